@@ -1,9 +1,22 @@
 from nicegui import ui
-from services.naver_api import naver_api
+from services.naver_api import naver_api, BLOG_PAGE_SIZE
+from components.result_list import ResultList
 import re
 
+
+async def _iterate(pages):
+    """리스트와 비동기 제너레이터를 같은 방식으로 순회"""
+    if hasattr(pages, '__aiter__'):
+        async for page in pages:
+            yield page
+    else:
+        for page in pages:
+            yield page
+
 def content():
     search_results = []
+    # 새 검색이 시작되면 증가; 이전 검색의 늦게 도착한 결과는 버림
+    search_state = {'generation': 0}
     
     def clean_html(text: str) -> str:
         """HTML 태그 제거"""
@@ -13,67 +26,113 @@ def content():
         """날짜 포맷 (20250919 -> 2025-09-19)"""
         return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
     
+    def render_card(idx: int, item: dict):
+        with ui.card().classes('w-full mb-3 hover:shadow-lg transition-shadow'):
+            with ui.row().classes('w-full items-start justify-between'):
+                with ui.column().classes('flex-grow'):
+                    # 제목
+                    title = clean_html(item['title'])
+                    ui.link(title, item['link'], new_tab=True).classes('text-lg font-semibold text-gray-800 hover:text-blue-600')
+                    
+                    # 설명
+                    description = clean_html(item['description'])
+                    ui.label(description).classes('text-sm text-gray-600 mt-2')
+                    
+                    # 메타 정보
+                    with ui.row().classes('mt-2 gap-4'):
+                        ui.label(f"👤 {item['bloggername']}").classes('text-xs text-gray-500')
+                        ui.label(f"📅 {format_date(item['postdate'])}").classes('text-xs text-gray-500')
+                
+                # 순번 배지
+                # ui.badge(str(idx)).classes('bg-gray-200 text-white-700')
+                ui.badge(str(idx)).classes('bg-blue-100 text-blue-50')
+    
+    def show_header(query: str, total: int):
+        status_container.clear()
+        with status_container:
+            # 결과 헤더
+            with ui.row().classes('w-full items-center justify-between mb-4'):
+                ui.label(f"'{query}' 검색 결과").classes('text-xl font-bold')
+                ui.badge(f"{total:,}개").classes('bg-gray-500')
+    
     async def handle_search():
         query = search_input.value.strip()
         if not query:
             ui.notify('검색어를 입력해주세요', type='warning')
             return
         
+        search_state['generation'] += 1
+        generation = search_state['generation']
+        
+        def superseded() -> bool:
+            return generation != search_state['generation']
+        
         # 로딩 표시
-        results_container.clear()
-        with results_container:
+        result_list.clear()
+        status_container.clear()
+        with status_container:
             ui.spinner(size='lg')
             ui.label('검색 중입니다...').classes('text-gray-500 mt-4')
         
+        pages = []
         try:
-            # API 호출
-            data = await naver_api.search_blog(
-                query=query,
-                display=int(display_select.value),
-                sort=sort_select.value
-            )
+            display = int(display_select.value)
+            if display <= BLOG_PAGE_SIZE:
+                # API 호출 (단일 페이지)
+                data = await naver_api.search_blog(
+                    query=query,
+                    display=display,
+                    sort=sort_select.value
+                )
+                if superseded():
+                    return
+                pages = [{'items': data.get('items', []), 'total': data.get('total', 0)}]
+            else:
+                # 여러 페이지는 도착하는 대로 렌더링
+                pages = naver_api.search_blog_all(query=query, max_items=display, sort=sort_select.value)
             
-            # 결과 표시
-            results_container.clear()
-            with results_container:
-                if not data.get('items'):
-                    ui.label(f"'{query}' 검색 결과가 없습니다.").classes('text-warning')
+            count = 0
+            async for page in _iterate(pages):
+                if superseded():
                     return
-                
-                # 결과 헤더
-                with ui.row().classes('w-full items-center justify-between mb-4'):
-                    ui.label(f"'{query}' 검색 결과").classes('text-xl font-bold')
-                    ui.badge(f"{data.get('total', 0):,}개").classes('bg-gray-500')
-                
-                # 검색 결과 카드
-                for idx, item in enumerate(data['items'], 1):
-                    with ui.card().classes('w-full mb-3 hover:shadow-lg transition-shadow'):
-                        with ui.row().classes('w-full items-start justify-between'):
-                            with ui.column().classes('flex-grow'):
-                                # 제목
-                                title = clean_html(item['title'])
-                                ui.link(title, item['link'], new_tab=True).classes('text-lg font-semibold text-gray-800 hover:text-blue-600')
-                                
-                                # 설명
-                                description = clean_html(item['description'])
-                                ui.label(description).classes('text-sm text-gray-600 mt-2')
-                                
-                                # 메타 정보
-                                with ui.row().classes('mt-2 gap-4'):
-                                    ui.label(f"👤 {item['bloggername']}").classes('text-xs text-gray-500')
-                                    ui.label(f"📅 {format_date(item['postdate'])}").classes('text-xs text-gray-500')
-                            
-                            # 순번 배지
-                            # ui.badge(str(idx)).classes('bg-gray-200 text-white-700')
-                            ui.badge(str(idx)).classes('bg-blue-100 text-blue-50')
-
-            ui.notify(f'검색 완료: {len(data["items"])}건', type='positive')
+                if not count:
+                    if not page['items']:
+                        break
+                    show_header(query, page['total'])
+                count += len(page['items'])
+                await result_list.extend(page['items'])
+            
+            if not count:
+                status_container.clear()
+                with status_container:
+                    ui.label(f"'{query}' 검색 결과가 없습니다.").classes('text-warning')
+                return
+            
+            # 최근 7일 색인에서 함께 언급된 키워드 (추가 API 호출 없음)
+            related = await naver_api.top_cooccurring_terms(query, days=7, limit=10)
+            if superseded():
+                return
+            if related:
+                with status_container:
+                    with ui.row().classes('w-full items-center gap-2 mb-4'):
+                        ui.label('함께 언급된 키워드 (최근 7일)').classes('text-sm text-gray-500')
+                        for term in related:
+                            ui.chip(f"{term['term']} {term['share']:.0%}").props('dense outline')
+            
+            ui.notify(f'검색 완료: {count}건', type='positive')
             
         except Exception as e:
-            results_container.clear()
-            with results_container:
+            if superseded():
+                return
+            result_list.clear()
+            status_container.clear()
+            with status_container:
                 ui.label(f'검색 실패: {str(e)}').classes('text-red-500')
             ui.notify(f'검색 중 오류 발생: {str(e)}', type='negative')
+        finally:
+            # 중단된 병렬 수집은 남은 페이지 요청을 취소
+            if hasattr(pages, 'aclose'):
+                await pages.aclose()
     
     # UI 구성
     with ui.column().classes('w-full max-w-4xl mx-auto p-4'):
@@ -95,7 +154,7 @@ def content():
                 with ui.column().classes('flex-1'):
                     ui.label('결과 수').classes('text-sm')
                     display_select = ui.select(
-                        options=[10, 20, 50, 100],
+                        options=[10, 20, 50, 100, 300, 1000],
                         value=20
                     ).classes('w-full')
                 
@@ -107,6 +166,7 @@ def content():
                     ).classes('w-full')
         
         # 검색 결과 영역
-        results_container = ui.column().classes('w-full')
-        with results_container:
+        status_container = ui.column().classes('w-full')
+        with status_container:
             ui.label('검색어를 입력하여 네이버 블로그의 최신 트렌드를 분석해보세요.').classes('text-gray-500 text-center p-4')
+        result_list = ResultList(render_card)
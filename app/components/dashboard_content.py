@@ -1,28 +1,90 @@
-from nicegui import ui, app
-import random
-import services.helpers as helpers
+from nicegui import ui
+from datetime import datetime
+from services.dashboard_snapshots import dashboard_snapshots
+
+
+def _fmt_change(value):
+    if value is None:
+        return '-'
+    return f'{value * 100:+.1f}%'
+
+
+def _fmt_time(timestamp):
+    if not timestamp:
+        return '-'
+    return datetime.fromtimestamp(timestamp).strftime('%Y-%m-%d %H:%M')
+
+
+def render_sparkline(points: str, box, color: str) -> None:
+    """미리 계산된 좌표로 SVG 스파크라인 표시"""
+    width, height = box
+    ui.html(
+        f'<svg viewBox="0 0 {width} {height}" width="{width}" height="{height}" preserveAspectRatio="none">'
+        f'<polyline points="{points}" fill="none" stroke="{color}" stroke-width="1.5"/></svg>'
+    )
+
 
 def content() -> None:
-        
-        ui.label('Welcome to the Dashboard').style('font-size: 1.5rem;').style('font-weight: 400;')
-
-        with ui.card().classes('plot-card w-full mt-4'):
-                chart = ui.highchart({
-                'title': False,
-                'chart': {'type': 'bar'},
-                'xAxis': {'categories': ['A', 'B']},
-                'series': [
-                        {'name': 'Alpha', 'data': [0.1, 0.2]},
-                        {'name': 'Beta', 'data': [0.3, 0.4]},
-                ],
-                }).classes('w-full h-64')
-
-                async def update():
-                        chart.options['series'][0]['data'][0] = random.random()
-                        ui.notify(await helpers.dummy_function())
-                        chart.update()
-
-                with ui.row().classes('w-full items-center justify-end'):
-                        ui.button('Delete', on_click= lambda : ui.notify('Item was deleted...')).props('flat no-caps').classes('google-like-button secondary')
-                        ui.button('Cancel', on_click= lambda : ui.notify('Task was canceled...')).props('flat no-caps').classes('google-like-button tertiary')
-                        ui.button('Update', on_click=update).props("").props('flat no-caps').classes('google-like-button primary')
\ No newline at end of file
+    """워치리스트 스냅샷 기반 트렌드 요약
+
+    백그라운드 작업이 미리 만들어 둔 스냅샷만 읽으므로 렌더링 중에는
+    API 호출이나 집계가 없다.
+    """
+    snapshot = dashboard_snapshots.latest()
+
+    with ui.column().classes('w-full max-w-6xl mx-auto px-8 pb-8'):
+        if snapshot is None:
+            with ui.card().classes('w-full p-6'):
+                ui.label('트렌드 요약이 아직 없습니다').classes('text-lg font-semibold')
+                ui.label('NAVER_WATCHLIST에 키워드를 설정하면 주기적으로 수집된 결과가 여기에 표시됩니다').classes('text-sm text-gray-500')
+            return
+
+        with ui.row().classes('w-full items-center justify-between mb-2'):
+            ui.label('워치리스트 트렌드').classes('text-2xl font-bold')
+            with ui.row().classes('items-center gap-2'):
+                # 수집이 멈춘 경우 오래된 요약임을 표시
+                if dashboard_snapshots.is_stale(snapshot):
+                    ui.badge('오래된 데이터').classes('bg-orange-500 text-white')
+                ui.label(
+                    f"키워드 {snapshot['keywords']}개 · 갱신 {_fmt_time(snapshot['built_at'])}"
+                ).classes('text-sm text-gray-500')
+
+        # 상승/하락 키워드 (최근 주간 평균 대비 변화율 순)
+        with ui.card().classes('w-full p-6 mb-4'):
+            with ui.row().classes('items-center gap-2 mb-4'):
+                ui.icon('trending_up', size='md').classes('text-purple-600')
+                ui.label('주요 변동 키워드').classes('text-xl font-bold')
+
+            if not snapshot['movers']:
+                ui.label('수집된 데이터랩 결과가 없습니다').classes('text-gray-500')
+            with ui.grid(columns=3).classes('w-full gap-3'):
+                for mover in snapshot['movers']:
+                    change = mover['change']
+                    color = '#16a34a' if (change or 0) >= 0 else '#dc2626'
+                    with ui.card().classes('p-3').props('flat bordered'):
+                        with ui.row().classes('w-full items-center justify-between'):
+                            ui.label(mover['keyword']).classes('font-semibold')
+                            ui.label(_fmt_change(change)).style(f'color: {color};').classes('text-sm font-bold')
+                        if mover['sparkline']:
+                            render_sparkline(mover['sparkline'], snapshot['sparkline_box'], color)
+                        ui.label(f"{mover['period']} · 최근 {mover['latest']:.1f}").classes('text-xs text-gray-500')
+
+        # 블로그 문서 수 변화 (하루 전 대비)
+        with ui.card().classes('w-full p-6'):
+            with ui.row().classes('items-center gap-2 mb-4'):
+                ui.icon('article', size='md').classes('text-blue-600')
+                ui.label('최근 블로그 검색량').classes('text-xl font-bold')
+
+            columns = [
+                {'name': 'keyword', 'label': '키워드', 'field': 'keyword', 'align': 'left'},
+                {'name': 'total', 'label': '전체 문서 수', 'field': 'total'},
+                {'name': 'delta', 'label': '하루 새 문서', 'field': 'delta'},
+                {'name': 'fetched_at', 'label': '수집 시각', 'field': 'fetched_at'}
+            ]
+            rows = [{
+                'keyword': row['keyword'],
+                'total': f"{row['total']:,}",
+                'delta': f"{row['delta']:+,}",
+                'fetched_at': _fmt_time(row['fetched_at'])
+            } for row in snapshot['volumes']]
+            ui.table(columns=columns, rows=rows, row_key='keyword').classes('w-full')
@@ -1,13 +1,14 @@
 from nicegui import ui
-from services.naver_api import naver_api
+from services.naver_api import naver_api, DATALAB_MAX_TOTAL_GROUPS
+from services.trend_analytics import TrendMatrix
 from datetime import datetime, timedelta
 
 def content():
     keyword_groups = []
     
     def add_keyword_group():
-        if len(keyword_groups) >= 5:
-            ui.notify('최대 5개 그룹까지만 추가할 수 있습니다', type='warning')
+        if len(keyword_groups) >= DATALAB_MAX_TOTAL_GROUPS:
+            ui.notify(f'최대 {DATALAB_MAX_TOTAL_GROUPS}개 그룹까지만 추가할 수 있습니다', type='warning')
             return
         
         with keyword_container:
@@ -96,6 +97,43 @@ def content():
                         ui.icon('analytics', size='lg').classes('text-purple-600')
                         ui.label('트렌드 분석 결과').classes('text-2xl font-bold')
                     
+                    # 이동평균/증감률/피크/계절성 분석 (전체 그룹 일괄 계산)
+                    matrix = TrendMatrix.from_response(data, time_unit=time_unit_select.value)
+                    summary = matrix.summary()
+                    moving = matrix.moving_average(min(7, matrix.values.shape[1]))
+                    growth = matrix.growth(1)
+                    peaks = matrix.peaks()
+                    
+                    def fmt(value, percent=False):
+                        if value is None or value != value:
+                            return '-'
+                        return f'{value * 100:+.1f}%' if percent else f'{value:.2f}'
+                    
+                    ui.label('분석 요약').classes('font-semibold mb-2')
+                    summary_columns = [
+                        {'name': 'title', 'label': '그룹', 'field': 'title', 'align': 'left'},
+                        {'name': 'mean', 'label': '평균', 'field': 'mean'},
+                        {'name': 'latest', 'label': '최근', 'field': 'latest'},
+                        {'name': 'moving_average', 'label': '이동평균', 'field': 'moving_average'},
+                        {'name': 'growth', 'label': '직전 대비', 'field': 'growth'},
+                        {'name': 'yearly_growth', 'label': '전년 대비', 'field': 'yearly_growth'},
+                        {'name': 'peak', 'label': '최고점', 'field': 'peak', 'align': 'left'},
+                        {'name': 'slope', 'label': '추세', 'field': 'slope'},
+                        {'name': 'seasonal_strength', 'label': '계절성', 'field': 'seasonal_strength'}
+                    ]
+                    summary_rows = [{
+                        'title': row['title'],
+                        'mean': fmt(row['mean']),
+                        'latest': fmt(row['latest']),
+                        'moving_average': fmt(row['moving_average']),
+                        'growth': fmt(row['growth'], percent=True),
+                        'yearly_growth': fmt(row['yearly_growth'], percent=True),
+                        'peak': f"{row['peak_period']} ({row['peak_ratio']:.1f})",
+                        'slope': f"{row['slope']:+.3f}",
+                        'seasonal_strength': fmt(row['seasonal_strength'])
+                    } for row in summary]
+                    ui.table(columns=summary_columns, rows=summary_rows, row_key='title').classes('w-full mb-4')
+                    
                     colors = ['blue', 'green', 'red', 'orange', 'purple']
                     
                     for idx, result in enumerate(data['results']):
@@ -113,10 +151,17 @@ def content():
                             # 데이터 테이블
                             columns = [
                                 {'name': 'period', 'label': '날짜', 'field': 'period', 'align': 'left'},
-                                {'name': 'ratio', 'label': '검색 비율', 'field': 'ratio', 'align': 'left'}
+                                {'name': 'ratio', 'label': '검색 비율', 'field': 'ratio', 'align': 'left'},
+                                {'name': 'moving_average', 'label': '이동평균', 'field': 'moving_average', 'align': 'left'},
+                                {'name': 'growth', 'label': '증감률', 'field': 'growth', 'align': 'left'}
                             ]
                             
-                            rows = result['data']
+                            rows = [{
+                                'period': f"{period} ▲" if peaks[idx, col] else str(period),
+                                'ratio': round(float(matrix.values[idx, col]), 5),
+                                'moving_average': fmt(moving[idx, col]),
+                                'growth': fmt(growth[idx, col], percent=True)
+                            } for col, period in enumerate(matrix.periods)]
                             
                             ui.table(columns=columns, rows=rows, row_key='period').classes('w-full')
                             
@@ -199,7 +244,7 @@ def content():
                     age_checkboxes[age_code] = ui.checkbox(age_label)
             
             # 키워드 그룹
-            ui.label('키워드 그룹 (최대 5개)').classes('font-bold mb-2')
+            ui.label(f'키워드 그룹 (최대 {DATALAB_MAX_TOTAL_GROUPS}개, 5개 초과 시 첫 그룹 기준으로 비교)').classes('font-bold mb-2')
             keyword_container = ui.column().classes('w-full mb-4')
             
             # 버튼
@@ -1,35 +1,155 @@
 from nicegui import ui
 from services.naver_api import naver_api
+from services.spatial_index import to_wgs84, place_key
+from components.result_list import ResultList
 import re
 
+# 주변 장소 조회 반경 (미터)
+NEARBY_RADIUS_M = 500
+
 def content():
+    # 새 검색이 시작되면 증가; 이전 검색의 늦게 도착한 결과는 버림
+    search_state = {'generation': 0}
+    
     def clean_html(text: str) -> str:
         """HTML 태그 제거"""
         return re.sub(r'</?b>|&gt;', lambda m: ' > ' if m.group() == '&gt;' else '', text)
     
+    def show_nearby(item: dict):
+        """공간 색인에 누적된 장소 중 주변 장소 표시 (API 호출 없음)"""
+        coordinates = to_wgs84(item.get('mapx'), item.get('mapy'))
+        if coordinates is None:
+            return
+        key = place_key(item, coordinates)
+        nearby = [place for place in naver_api.places_near(*coordinates, radius_m=NEARBY_RADIUS_M, limit=11) if place['key'] != key][:10]
+        
+        with ui.dialog() as dialog, ui.card().classes('w-full max-w-lg'):
+            ui.label(f"{clean_html(item['title'])} 주변 {NEARBY_RADIUS_M}m").classes('text-lg font-bold mb-2')
+            if not nearby:
+                ui.label('저장된 주변 장소가 없습니다').classes('text-gray-500')
+            for place in nearby:
+                with ui.row().classes('w-full items-center justify-between'):
+                    ui.label(clean_html(place['item'].get('title', ''))).classes('text-sm')
+                    ui.label(f"{place['distance']:.0f}m").classes('text-xs text-gray-500')
+            ui.button('닫기', on_click=dialog.close).props('flat')
+        dialog.open()
+    
+    def render_card(idx: int, item: dict):
+        with ui.card().classes('w-full mb-3 hover:shadow-lg transition-shadow'):
+            with ui.row().classes('w-full items-start justify-between gap-4'):
+                with ui.column().classes('flex-grow'):
+                    # 제목과 카테고리
+                    with ui.row().classes('items-center gap-2 mb-1'):
+                        title = clean_html(item['title'])
+                        if item.get('link'):
+                            ui.link(title, item['link'], new_tab=True).classes('text-lg font-semibold text-gray-800 hover:text-green-600')
+                        else:
+                            ui.label(title).classes('text-lg font-semibold text-gray-800')
+                                    
+                        ui.badge(str(idx)).classes('bg-gray-300 text-gray-800')
+                                
+                    # 카테고리
+                    category = item['category'].replace('&gt;', ' > ')
+                    with ui.row().classes('items-center gap-1 mb-2'):
+                        ui.icon('sell', size='sm').classes('text-green-600')
+                        ui.label(category).classes('text-sm text-gray-600')
+                                
+                    # 설명
+                    if item.get('description'):
+                        ui.label(item['description']).classes('text-sm text-gray-600 mb-2')
+                                
+                    # 주소
+                    address = item.get('roadAddress') or item.get('address', '')
+                    if address:
+                        with ui.row().classes('items-center gap-1 mb-1'):
+                            ui.icon('location_on', size='sm').classes('text-red-500')
+                            ui.label(address).classes('text-sm text-gray-700')
+                                
+                    # 전화번호
+                    if item.get('telephone'):
+                        with ui.row().classes('items-center gap-1 mb-2'):
+                            ui.icon('phone', size='sm').classes('text-blue-500')
+                            ui.link(item['telephone'], f"tel:{item['telephone']}").classes('text-sm text-blue-600 hover:underline')
+                                
+                    # 지도 보기 버튼
+                    if item.get('mapx') and item.get('mapy'):
+                        map_url = f"https://map.naver.com/v5/search/{title}?c={item['mapx']},{item['mapy']},15,0,0,0,dh"
+                        with ui.row().classes('gap-2'):
+                            ui.button('지도 보기', on_click=lambda url=map_url: ui.open(url, new_tab=True)) \
+                                .props('outline color=green size=sm icon=map')
+                            ui.button('주변 장소', on_click=lambda item=item: show_nearby(item)) \
+                                .props('outline color=green size=sm icon=near_me')
+    
+    async def handle_sweep(query: str, superseded):
+        """세부 지역/키워드로 나눠 동시에 검색하고 도착하는 대로 렌더링"""
+        areas = [area.strip() for area in areas_input.value.split(',') if area.strip()]
+        count = 0
+        progress = None
+        
+        sweep = naver_api.search_local_sweep(query, areas=areas or None)
+        try:
+            async for page in sweep:
+                if superseded():
+                    return
+                if progress is None:
+                    status_container.clear()
+                    with status_container:
+                        with ui.row().classes('w-full items-center justify-between mb-4'):
+                            ui.label(f"'{query}' 확장 검색 결과").classes('text-xl font-bold text-green-700')
+                            progress = ui.badge().classes('bg-green-500 text-white')
+                count = page['collected']
+                progress.set_text(f"{count:,}개 · {page['completed']}/{page['queries']}")
+                await result_list.extend(page['items'])
+        finally:
+            # 중단된 확장 검색은 남은 요청을 취소
+            await sweep.aclose()
+        
+        if superseded():
+            return
+        if not count:
+            status_container.clear()
+            with status_container:
+                ui.label(f"'{query}' 검색 결과가 없습니다.").classes('text-orange-500')
+            return
+        
+        ui.notify(f'확장 검색 완료: {count}건', type='positive')
+    
     async def handle_search():
         query = search_input.value.strip()
         if not query:
             ui.notify('검색어를 입력해주세요', type='warning')
             return
         
+        search_state['generation'] += 1
+        generation = search_state['generation']
+        
+        def superseded() -> bool:
+            return generation != search_state['generation']
+        
         # 로딩 표시
-        results_container.clear()
-        with results_container:
+        result_list.clear()
+        status_container.clear()
+        with status_container:
             ui.spinner(size='lg')
             ui.label('검색 중입니다...').classes('text-gray-500 mt-4')
         
         try:
+            if sweep_switch.value:
+                await handle_sweep(query, superseded)
+                return
+            
             # API 호출
             data = await naver_api.search_local(
                 query=query,
                 display=int(display_select.value),
                 sort=sort_select.value
             )
+            if superseded():
+                return
             
             # 결과 표시
-            results_container.clear()
-            with results_container:
+            status_container.clear()
+            with status_container:
                 if not data.get('items'):
                     ui.label(f"'{query}' 검색 결과가 없습니다.").classes('text-orange-500')
                     return
@@ -38,56 +158,18 @@ def content():
                 with ui.row().classes('w-full items-center justify-between mb-4'):
                     ui.label(f"'{query}' 검색 결과").classes('text-xl font-bold text-green-700')
                     ui.badge(f"{data.get('total', 0):,}개").classes('bg-green-500 text-white')
-                
-                # 검색 결과 카드
-                for idx, item in enumerate(data['items'], 1):
-                    with ui.card().classes('w-full mb-3 hover:shadow-lg transition-shadow'):
-                        with ui.row().classes('w-full items-start justify-between gap-4'):
-                            with ui.column().classes('flex-grow'):
-                                # 제목과 카테고리
-                                with ui.row().classes('items-center gap-2 mb-1'):
-                                    title = clean_html(item['title'])
-                                    if item.get('link'):
-                                        ui.link(title, item['link'], new_tab=True).classes('text-lg font-semibold text-gray-800 hover:text-green-600')
-                                    else:
-                                        ui.label(title).classes('text-lg font-semibold text-gray-800')
-                                    
-                                    ui.badge(str(idx)).classes('bg-gray-300 text-gray-800')
-                                
-                                # 카테고리
-                                category = item['category'].replace('&gt;', ' > ')
-                                with ui.row().classes('items-center gap-1 mb-2'):
-                                    ui.icon('sell', size='sm').classes('text-green-600')
-                                    ui.label(category).classes('text-sm text-gray-600')
-                                
-                                # 설명
-                                if item.get('description'):
-                                    ui.label(item['description']).classes('text-sm text-gray-600 mb-2')
-                                
-                                # 주소
-                                address = item.get('roadAddress') or item.get('address', '')
-                                if address:
-                                    with ui.row().classes('items-center gap-1 mb-1'):
-                                        ui.icon('location_on', size='sm').classes('text-red-500')
-                                        ui.label(address).classes('text-sm text-gray-700')
-                                
-                                # 전화번호
-                                if item.get('telephone'):
-                                    with ui.row().classes('items-center gap-1 mb-2'):
-                                        ui.icon('phone', size='sm').classes('text-blue-500')
-                                        ui.link(item['telephone'], f"tel:{item['telephone']}").classes('text-sm text-blue-600 hover:underline')
-                                
-                                # 지도 보기 버튼
-                                if item.get('mapx') and item.get('mapy'):
-                                    map_url = f"https://map.naver.com/v5/search/{title}?c={item['mapx']},{item['mapy']},15,0,0,0,dh"
-                                    ui.button('지도 보기', on_click=lambda url=map_url: ui.open(url, new_tab=True)) \
-                                        .props('outline color=green size=sm icon=map')
+            
+            # 검색 결과 카드
+            await result_list.extend(data['items'])
             
             ui.notify(f'검색 완료: {len(data["items"])}건', type='positive')
             
         except Exception as e:
-            results_container.clear()
-            with results_container:
+            if superseded():
+                return
+            result_list.clear()
+            status_container.clear()
+            with status_container:
                 ui.label(f'검색 실패: {str(e)}').classes('text-red-500')
             ui.notify(f'검색 중 오류 발생: {str(e)}', type='negative')
     
@@ -121,8 +203,16 @@ def content():
                         options={'random': '정확도순', 'comment': '리뷰 많은순'},
                         value='random'
                     ).classes('w-full')
+            
+            # 확장 검색 (세부 지역/키워드 조합으로 5건 제한 우회)
+            with ui.row().classes('w-full items-center gap-4 mt-4'):
+                sweep_switch = ui.switch('확장 검색')
+                areas_input = ui.input(
+                    placeholder='세부 지역 (쉼표로 구분, 예: 신사동,논현동,역삼동)'
+                ).classes('flex-grow').props('outlined dense').bind_visibility_from(sweep_switch, 'value')
         
         # 검색 결과 영역
-        results_container = ui.column().classes('w-full')
-        with results_container:
+        status_container = ui.column().classes('w-full')
+        with status_container:
             ui.label('지역 검색어를 입력하여 업체 및 장소의 트렌드를 확인해보세요.').classes('text-gray-500 text-center p-4')
+        result_list = ResultList(render_card)
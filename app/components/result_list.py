@@ -0,0 +1,72 @@
+from typing import Callable, Dict, List
+from nicegui import ui
+import asyncio
+
+# 한 번에 만드는 카드 수
+RENDER_CHUNK_SIZE = 20
+
+# 스크롤 전에 미리 만들어 두는 카드 수
+RENDER_AHEAD = 40
+
+# 청크 사이 대기 시간 (초); NiceGUI 아웃박스 전송 주기(약 10ms)보다 길게 잡아 청크마다 전송되게 함
+CHUNK_FLUSH_DELAY = 0.02
+
+
+class ResultList:
+    """검색 결과 카드를 청크 단위로 이어 붙이는 스크롤 목록
+
+    도착한 항목은 서버 쪽 버퍼에 쌓아 두고 처음에는 RENDER_AHEAD 건까지만
+    카드를 만든다. 스크롤이 바닥에 가까워지면 RENDER_CHUNK_SIZE 단위로 이어
+    붙이므로 결과가 많아도 첫 카드가 빨리 뜬다. 가상 스크롤은 아니어서 한 번
+    만든 카드는 지우지 않으며, DOM 은 사용자가 스크롤한 만큼 커진다.
+    """
+
+    def __init__(self, render_item: Callable[[int, Dict], None], height: str = '70vh'):
+        """
+        Args:
+            render_item: (순번, 항목)을 받아 카드 하나를 만드는 함수
+            height: 스크롤 영역 높이 (CSS)
+        """
+        self.render_item = render_item
+        self.items: List[Dict] = []
+        self.rendered = 0
+        self._limit = RENDER_AHEAD
+        self._rendering = False
+
+        with ui.scroll_area(on_scroll=self._handle_scroll).classes('w-full').style(f'height: {height};') as self.scroll_area:
+            self.container = ui.column().classes('w-full')
+
+    def clear(self) -> None:
+        """목록과 버퍼 초기화"""
+        self.items = []
+        self.rendered = 0
+        self._limit = RENDER_AHEAD
+        self.container.clear()
+        self.scroll_area.scroll_to(percent=0)
+
+    async def extend(self, items: List[Dict]) -> None:
+        """항목 추가 후 보이는 범위까지 청크 단위 렌더링"""
+        self.items.extend(items)
+        await self._render()
+
+    async def _handle_scroll(self, e) -> None:
+        # 바닥에 가까워지면 다음 청크 렌더링
+        if e.vertical_percentage > 0.8 and self.rendered < len(self.items):
+            self._limit = self.rendered + RENDER_AHEAD
+            await self._render()
+
+    async def _render(self) -> None:
+        if self._rendering:
+            return
+        self._rendering = True
+        try:
+            while self.rendered < min(len(self.items), self._limit):
+                end = min(self.rendered + RENDER_CHUNK_SIZE, len(self.items), self._limit)
+                with self.container:
+                    for index in range(self.rendered, end):
+                        self.render_item(index + 1, self.items[index])
+                self.rendered = end
+                # 아웃박스가 이 청크를 보낼 때까지 양보
+                await asyncio.sleep(CHUNK_FLUSH_DELAY)
+        finally:
+            self._rendering = False
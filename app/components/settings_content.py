@@ -3,13 +3,16 @@ from services.user_service import UserService
 from services.auth_service import is_current_user_admin
 import services.helpers as helpers
 
-def content() -> None:
+# Users fetched per page in the user list
+USER_PAGE_SIZE = 50
+
+async def content() -> None:
     with ui.row().classes('w-full mt-4'):
         ui.icon('settings', size='md').classes('')
         ui.label('Settings').style('font-size: 1.0rem; font-weight: 500;').classes('mt-1')
     
     # Only show user management for admin users
-    if is_current_user_admin():
+    if await is_current_user_admin():
         # User creation section
         with ui.card().classes('user-management-card w-full mt-6'):
             ui.label('User Management').classes('form-section-title')
@@ -91,7 +94,7 @@ def content() -> None:
                 
                 async def handle_create_user_confirmed(dialog, username, password, email, full_name):
                     # Create user using service layer
-                    result = UserService.create_user(
+                    result = await UserService.create_user(
                         username=username,
                         password=password,
                         email=email,
@@ -107,7 +110,7 @@ def content() -> None:
                         # Clear form
                         clear_form()
                         # Refresh user list
-                        refresh_user_list()
+                        await refresh_user_list()
                         ui.notify(result["message"], type='positive')
                     else:
                         result_label.text = result["message"]
@@ -130,83 +133,123 @@ def content() -> None:
         with ui.card().classes('user-management-card w-full mt-4'):
             ui.label('Existing Users').classes('form-section-title')
             
-            def refresh_user_list():
-                user_list_container.clear()
-                users = UserService.get_all_users()
+            # Keyset pagination state; 'generation' discards pages from a superseded search
+            list_state = {'cursor': None, 'done': False, 'loading': False, 'generation': 0}
+            
+            def render_user(user):
+                with ui.row().classes('user-list-item w-full'):
+                    with ui.column().classes('flex-1'):
+                        with ui.row().classes('items-center gap-2'):
+                            ui.label(user['username']).style('font-weight: 500; font-size: 1rem;')
+                            if user['is_admin']:
+                                ui.label('ADMIN').classes('user-badge admin')
+                            else:
+                                ui.label('USER').classes('user-badge user')
+                        
+                        if user['full_name']:
+                            ui.label(user['full_name']).classes('text-gray-600 text-sm')
+                        if user['email']:
+                            ui.label(user['email']).classes('text-gray-500 text-xs')
+                    
+                    with ui.column().classes('items-end gap-2'):
+                        with ui.column().classes('items-end text-xs text-gray-400'):
+                            if user['created_at']:
+                                ui.label(f"Created: {user['created_at'][:10]}")
+                            if user['last_login']:
+                                ui.label(f"Last login: {user['last_login'][:10]}")
+                        
+                        # Add delete button (only for non-admin users)
+                        if user['username'] != 'admin':
+                            async def show_delete_dialog(username=user['username'], full_name=user.get('full_name'), email=user.get('email')):
+                                # Show confirmation dialog
+                                with ui.dialog() as dialog, ui.card():
+                                    ui.label('Confirm User Deletion').classes('dialog-title')
+                                    
+                                    ui.label('You are about to permanently delete the following user:').classes('dialog-content mb-4 text-red-600')
+                                    
+                                    with ui.column().classes('w-full gap-2'):
+                                        with ui.row().classes('user-info-item w-full'):
+                                            ui.label('Username:').style('font-weight: 500; min-width: 100px;')
+                                            ui.label(username)
+                                        
+                                        if full_name:
+                                            with ui.row().classes('user-info-item w-full'):
+                                                ui.label('Full Name:').style('font-weight: 500; min-width: 100px;')
+                                                ui.label(full_name)
+                                        
+                                        if email:
+                                            with ui.row().classes('user-info-item w-full'):
+                                                ui.label('Email:').style('font-weight: 500; min-width: 100px;')
+                                                ui.label(email)
+                                    
+                                    ui.separator()
+
+                                    with ui.row().classes('w-full justify-end gap-2 mt-6'):
+                                        ui.button('Cancel', on_click=dialog.close).props('flat no-caps').classes('google-like-button tertiary')
+                                        ui.button('Delete User', on_click=lambda: handle_delete_user_confirmed(dialog, username)).props('flat no-caps').classes('google-like-button secondary')
+                                
+                                dialog.open()
+                            
+                            async def handle_delete_user_confirmed(dialog, username):
+                                dialog.close()
+                                result = await UserService.delete_user(username)
+                                if result["success"]:
+                                    ui.notify(result["message"], type='positive')
+                                    await refresh_user_list()
+                                else:
+                                    ui.notify(result["message"], type='negative')
+                            
+                            ui.button('Delete', on_click=show_delete_dialog).props('flat no-caps size=sm').classes('google-like-button secondary')
+            
+            async def load_next_page():
+                if list_state['loading'] or list_state['done']:
+                    return
+                list_state['loading'] = True
+                generation = list_state['generation']
+                try:
+                    page = await UserService.list_users(
+                        search=search_input.value,
+                        role=role_select.value,
+                        cursor=list_state['cursor'],
+                        page_size=USER_PAGE_SIZE
+                    )
+                finally:
+                    if generation == list_state['generation']:
+                        list_state['loading'] = False
+                if generation != list_state['generation']:
+                    return
                 
-                if not users:
-                    with user_list_container:
+                with user_list_container:
+                    for user in page['users']:
+                        render_user(user)
+                    if list_state['cursor'] is None and not page['users']:
                         ui.label('No users found').classes('text-gray-500 italic p-4 text-center')
-                    return
                 
-                for user in users:
-                    with user_list_container:
-                        with ui.row().classes('user-list-item w-full'):
-                            with ui.column().classes('flex-1'):
-                                with ui.row().classes('items-center gap-2'):
-                                    ui.label(user['username']).style('font-weight: 500; font-size: 1rem;')
-                                    if user['is_admin']:
-                                        ui.label('ADMIN').classes('user-badge admin')
-                                    else:
-                                        ui.label('USER').classes('user-badge user')
-                                
-                                if user['full_name']:
-                                    ui.label(user['full_name']).classes('text-gray-600 text-sm')
-                                if user['email']:
-                                    ui.label(user['email']).classes('text-gray-500 text-xs')
-                            
-                            with ui.column().classes('items-end gap-2'):
-                                with ui.column().classes('items-end text-xs text-gray-400'):
-                                    if user['created_at']:
-                                        ui.label(f"Created: {user['created_at'][:10]}")
-                                    if user['last_login']:
-                                        ui.label(f"Last login: {user['last_login'][:10]}")
-                                
-                                # Add delete button (only for non-admin users)
-                                if user['username'] != 'admin':
-                                    async def show_delete_dialog(username=user['username'], full_name=user.get('full_name'), email=user.get('email')):
-                                        # Show confirmation dialog
-                                        with ui.dialog() as dialog, ui.card():
-                                            ui.label('Confirm User Deletion').classes('dialog-title')
-                                            
-                                            ui.label('You are about to permanently delete the following user:').classes('dialog-content mb-4 text-red-600')
-                                            
-                                            with ui.column().classes('w-full gap-2'):
-                                                with ui.row().classes('user-info-item w-full'):
-                                                    ui.label('Username:').style('font-weight: 500; min-width: 100px;')
-                                                    ui.label(username)
-                                                
-                                                if full_name:
-                                                    with ui.row().classes('user-info-item w-full'):
-                                                        ui.label('Full Name:').style('font-weight: 500; min-width: 100px;')
-                                                        ui.label(full_name)
-                                                
-                                                if email:
-                                                    with ui.row().classes('user-info-item w-full'):
-                                                        ui.label('Email:').style('font-weight: 500; min-width: 100px;')
-                                                        ui.label(email)
-                                            
-                                            ui.separator()
-
-                                            with ui.row().classes('w-full justify-end gap-2 mt-6'):
-                                                ui.button('Cancel', on_click=dialog.close).props('flat no-caps').classes('google-like-button tertiary')
-                                                ui.button('Delete User', on_click=lambda: handle_delete_user_confirmed(dialog, username)).props('flat no-caps').classes('google-like-button secondary')
-                                        
-                                        dialog.open()
-                                    
-                                    async def handle_delete_user_confirmed(dialog, username):
-                                        dialog.close()
-                                        result = UserService.delete_user(username)
-                                        if result["success"]:
-                                            ui.notify(result["message"], type='positive')
-                                            refresh_user_list()
-                                        else:
-                                            ui.notify(result["message"], type='negative')
-                                    
-                                    ui.button('Delete', on_click=show_delete_dialog).props('flat no-caps size=sm').classes('google-like-button secondary')
+                list_state['cursor'] = page['next_cursor']
+                list_state['done'] = page['next_cursor'] is None
+                load_more_button.set_visibility(not list_state['done'])
+            
+            async def refresh_user_list():
+                list_state.update(cursor=None, done=False, loading=False, generation=list_state['generation'] + 1)
+                user_list_container.clear()
+                await load_next_page()
+            
+            async def handle_scroll(e):
+                # fetch the next page when the user nears the bottom
+                if e.vertical_percentage > 0.9:
+                    await load_next_page()
+            
+            with ui.row().classes('w-full gap-4 items-center'):
+                search_input = ui.input('Search', placeholder='Username, name or email', on_change=refresh_user_list).props('clearable debounce=300').classes('flex-1')
+                role_select = ui.select({'all': 'All users', 'admin': 'Administrators', 'user': 'Regular users'}, value='all', on_change=refresh_user_list)
+            
+            with ui.scroll_area(on_scroll=handle_scroll).classes('w-full').style('height: 600px;'):
+                user_list_container = ui.column().classes('w-full')
+                load_more_button = ui.button('Load more', on_click=load_next_page).props('flat no-caps').classes('google-like-button tertiary w-full')
+                load_more_button.set_visibility(False)
             
-            user_list_container = ui.column().classes('w-full')
-            refresh_user_list()
+            # Load the first page off the page build so the database query doesn't block rendering
+            ui.timer(0, refresh_user_list, once=True)
     
     else:
         with ui.card().classes('user-management-card w-full mt-6'):
@@ -1,24 +1,213 @@
+import asyncio
+import base64
+import hmac
 import sqlite3
 import hashlib
 import os
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
 
 # Database file path
 DB_PATH = Path(__file__).parent / "users.db"
 
+# Worker threads (one pooled connection each) used for database I/O
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '4'))
+
+# Per-connection prepared statement cache; the queries below are constant strings
+DB_STATEMENT_CACHE = 64
+
+# Connection pragmas; WAL lets readers run alongside the single writer
+DB_PRAGMAS = (
+    'PRAGMA synchronous = NORMAL',
+    f"PRAGMA busy_timeout = {int(os.getenv('DB_BUSY_TIMEOUT_MS', '5000'))}",
+    'PRAGMA cache_size = -8000',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA mmap_size = 67108864',
+)
+
+
+class ConnectionPool:
+    """
+    SQLite connections bound to a dedicated executor
+
+    Each worker thread owns one long-lived connection, so queries never
+    open/close the database file and never run on the event loop.
+    """
+
+    def __init__(self, db_path: Path, size: int = DB_POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def connect(self) -> sqlite3.Connection:
+        """Get (or open) the calling thread's connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=DB_STATEMENT_CACHE)
+            for pragma in DB_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """Run func(conn, *args) on a pool thread"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix='db')
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._call, func, args)
+
+    def _call(self, func: Callable[..., Any], args: tuple) -> Any:
+        return func(self.connect(), *args)
+
+    def close(self) -> None:
+        """Stop the executor and close every pooled connection"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+class LoginBuffer:
+    """
+    Buffers last_login updates and writes them in one transaction per interval
+
+    Keeps the per-login commit (and its fsync) off the login path; the column
+    lags by at most flush_interval seconds, and pending values are overlaid
+    on reads so callers never see the lag.
+    """
+
+    def __init__(self, flush_interval: float = float(os.getenv('DB_LOGIN_FLUSH_INTERVAL', '5'))):
+        self.flush_interval = flush_interval
+        self._pending: Dict[int, str] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._stats = {
+            'recorded': 0,
+            'flushes': 0,
+            'rows_written': 0
+        }
+
+    def record(self, user_id: int) -> None:
+        """Remember a login at the current time (same format as CURRENT_TIMESTAMP)"""
+        self._pending[user_id] = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+        self._stats['recorded'] += 1
+
+    def pending(self, user_id: int) -> Optional[str]:
+        return self._pending.get(user_id)
+
+    async def flush(self) -> None:
+        """Write all pending updates in a single transaction"""
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        try:
+            await pool.run(_write_logins, list(batch.items()))
+        except Exception:
+            # keep the values for the next attempt unless a newer login replaced them
+            for user_id, timestamp in batch.items():
+                self._pending.setdefault(user_id, timestamp)
+            raise
+        self._stats['flushes'] += 1
+        self._stats['rows_written'] += len(batch)
+
+    async def start(self) -> None:
+        """Start the periodic flush task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the flush task and write what is left"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def stats(self) -> Dict:
+        return {**self._stats, 'pending': len(self._pending)}
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush last_login updates: {e}")
+
+
+pool = ConnectionPool(DB_PATH)
+login_buffer = LoginBuffer()
+
+# scrypt cost parameters for new hashes (N=2^14, r=8 uses 16 MiB per hash)
+SCRYPT_N = int(os.getenv('PASSWORD_SCRYPT_N', '16384'))
+SCRYPT_R = int(os.getenv('PASSWORD_SCRYPT_R', '8'))
+SCRYPT_P = int(os.getenv('PASSWORD_SCRYPT_P', '1'))
+SCRYPT_SALT_BYTES = 16
+SCRYPT_KEY_BYTES = 32
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(), salt=salt, n=n, r=r, p=p,
+        maxmem=256 * n * r * p, dklen=SCRYPT_KEY_BYTES
+    )
+
 def hash_password(password: str) -> str:
-    """Hash a password using SHA-256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash a password with scrypt and a random per-user salt"""
+    salt = os.urandom(SCRYPT_SALT_BYTES)
+    key = _scrypt(password, salt, SCRYPT_N, SCRYPT_R, SCRYPT_P)
+    return '$'.join([
+        'scrypt', str(SCRYPT_N), str(SCRYPT_R), str(SCRYPT_P),
+        base64.b64encode(salt).decode(), base64.b64encode(key).decode()
+    ])
 
 def verify_password(password: str, hashed: str) -> bool:
-    """Verify a password against its hash"""
-    return hash_password(password) == hashed
+    """Verify a password against a scrypt hash or a legacy unsalted SHA-256 hash"""
+    if is_legacy_hash(hashed):
+        return hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), hashed)
+    try:
+        scheme, n, r, p, salt, key = hashed.split('$')
+        if scheme != 'scrypt':
+            return False
+        expected = base64.b64decode(key)
+        return hmac.compare_digest(_scrypt(password, base64.b64decode(salt), int(n), int(r), int(p)), expected)
+    except ValueError:
+        return False
+
+def is_legacy_hash(hashed: str) -> bool:
+    """Check for the old unsalted SHA-256 hex format"""
+    return len(hashed) == 64 and '$' not in hashed
+
+def needs_rehash(hashed: str) -> bool:
+    """Check if a hash is legacy or uses other cost parameters than the current ones"""
+    if is_legacy_hash(hashed):
+        return True
+    return not hashed.startswith(f'scrypt${SCRYPT_N}${SCRYPT_R}${SCRYPT_P}$')
 
 def init_database():
     """Initialize the database and create tables"""
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
-    
+
+    # WAL is persistent in the database file, so it only needs to be set once
+    cursor.execute('PRAGMA journal_mode = WAL')
+
     # Create users table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -32,95 +221,90 @@ def init_database():
             last_login TIMESTAMP
         )
     ''')
-    
+
     # Check if is_admin column exists, if not add it
     cursor.execute("PRAGMA table_info(users)")
     columns = [column[1] for column in cursor.fetchall()]
     if 'is_admin' not in columns:
         cursor.execute('ALTER TABLE users ADD COLUMN is_admin BOOLEAN DEFAULT 0')
         print("Added is_admin column to users table")
-    
+
     # Check if admin user exists
     cursor.execute('SELECT COUNT(*) FROM users WHERE username = ?', ('admin',))
     if cursor.fetchone()[0] == 0:
         # Create default admin user
         admin_password_hash = hash_password('admin')
         cursor.execute('''
-            INSERT INTO users (username, password_hash, email, full_name, is_admin) 
+            INSERT INTO users (username, password_hash, email, full_name, is_admin)
             VALUES (?, ?, ?, ?, ?)
         ''', ('admin', admin_password_hash, 'admin@localhost', 'Administrator', 1))
         print("Default admin user created (username: admin, password: admin)")
     else:
         # Update existing admin user to have admin privileges
         cursor.execute('UPDATE users SET is_admin = 1 WHERE username = ?', ('admin',))
-    
+
+    # Index for keyset-paginated listing; search is a substring match that no index can serve,
+    # so drop the username index older databases were created with
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_created_at ON users (created_at DESC, id DESC)')
+    cursor.execute('DROP INDEX IF EXISTS idx_users_username_nocase')
+
     conn.commit()
     conn.close()
 
-def authenticate_user(username: str, password: str) -> dict:
-    """Authenticate a user with username and password"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT id, username, password_hash, email, full_name, is_admin, is_active 
+async def start_database():
+    """Start background database work (called on app startup)"""
+    await login_buffer.start()
+
+async def close_database():
+    """Flush buffered writes and shut down the connection pool (called on app shutdown)"""
+    await login_buffer.close()
+    pool.close()
+
+def _get_credentials(conn: sqlite3.Connection, username: str) -> dict:
+    user = conn.execute('''
+        SELECT id, username, password_hash, email, full_name, is_admin
         FROM users WHERE username = ? AND is_active = 1
-    ''', (username,))
-    
-    user = cursor.fetchone()
-    
-    if user and verify_password(password, user[2]):
-        # Update last login
-        cursor.execute('''
-            UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?
-        ''', (user[0],))
-        conn.commit()
-        
-        user_data = {
+    ''', (username,)).fetchone()
+
+    if user:
+        return {
             'id': user[0],
             'username': user[1],
-            'email': user[3] or f'{user[1]}@localhost',
-            'name': user[4] or user[1],
-            'is_admin': bool(user[5]),
-            'login_type': 'local'
+            'password_hash': user[2],
+            'email': user[3],
+            'full_name': user[4],
+            'is_admin': bool(user[5])
         }
-        conn.close()
-        return user_data
-    
-    conn.close()
     return None
 
-def create_user(username: str, password: str, email: str = None, full_name: str = None, is_admin: bool = False) -> bool:
-    """Create a new user"""
+def _write_logins(conn: sqlite3.Connection, rows: list) -> None:
+    with conn:
+        conn.executemany('''
+            UPDATE users SET last_login = ? WHERE id = ?
+        ''', [(timestamp, user_id) for user_id, timestamp in rows])
+
+def _update_password_hash(conn: sqlite3.Connection, user_id: int, password_hash: str) -> None:
+    conn.execute('UPDATE users SET password_hash = ? WHERE id = ?', (password_hash, user_id))
+    conn.commit()
+
+def _create_user(conn: sqlite3.Connection, username: str, password_hash: str, email: str, full_name: str, is_admin: bool) -> bool:
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        password_hash = hash_password(password)
-        cursor.execute('''
-            INSERT INTO users (username, password_hash, email, full_name, is_admin) 
+        conn.execute('''
+            INSERT INTO users (username, password_hash, email, full_name, is_admin)
             VALUES (?, ?, ?, ?, ?)
         ''', (username, password_hash, email, full_name, is_admin))
-        
         conn.commit()
-        conn.close()
         return True
     except sqlite3.IntegrityError:
+        conn.rollback()
         return False  # Username already exists
 
-def get_user(username: str) -> dict:
-    """Get user information by username"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT id, username, email, full_name, is_admin, is_active, created_at, last_login 
+def _get_user(conn: sqlite3.Connection, username: str) -> dict:
+    user = conn.execute('''
+        SELECT id, username, email, full_name, is_admin, is_active, created_at, last_login
         FROM users WHERE username = ?
-    ''', (username,))
-    
-    user = cursor.fetchone()
-    conn.close()
-    
+    ''', (username,)).fetchone()
+
     if user:
         return {
             'id': user[0],
@@ -134,19 +318,31 @@ def get_user(username: str) -> dict:
         }
     return None
 
-def get_all_users() -> list:
-    """Get all users for admin interface"""
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT id, username, email, full_name, is_admin, is_active, created_at, last_login 
+def _get_user_by_id(conn: sqlite3.Connection, user_id: int) -> dict:
+    user = conn.execute('''
+        SELECT id, username, email, full_name, is_admin, is_active, created_at, last_login
+        FROM users WHERE id = ?
+    ''', (user_id,)).fetchone()
+
+    if user:
+        return {
+            'id': user[0],
+            'username': user[1],
+            'email': user[2],
+            'full_name': user[3],
+            'is_admin': bool(user[4]),
+            'is_active': user[5],
+            'created_at': user[6],
+            'last_login': user[7]
+        }
+    return None
+
+def _get_all_users(conn: sqlite3.Connection) -> list:
+    users = conn.execute('''
+        SELECT id, username, email, full_name, is_admin, is_active, created_at, last_login
         FROM users ORDER BY created_at DESC
-    ''')
-    
-    users = cursor.fetchall()
-    conn.close()
-    
+    ''').fetchall()
+
     return [{
         'id': user[0],
         'username': user[1],
@@ -158,24 +354,98 @@ def get_all_users() -> list:
         'last_login': user[7]
     } for user in users]
 
-def delete_user(username: str) -> bool:
-    """Delete a user (cannot delete admin user)"""
-    if username == 'admin':
-        return False  # Cannot delete admin user
-    
+def _list_users(conn: sqlite3.Connection, search: str, role: str, after: tuple, limit: int) -> list:
+    clauses, params = [], []
+    if after:
+        # keyset: continue strictly after the last (created_at, id) of the previous page
+        clauses.append('(created_at, id) < (?, ?)')
+        params.extend(after)
+    if search:
+        pattern = '%' + search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        clauses.append("(username LIKE ? ESCAPE '\\' OR full_name LIKE ? ESCAPE '\\' OR email LIKE ? ESCAPE '\\')")
+        params.extend([pattern] * 3)
+    if role == 'admin':
+        clauses.append('is_admin = 1')
+    elif role == 'user':
+        clauses.append('is_admin = 0')
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    users = conn.execute(f'''
+        SELECT id, username, email, full_name, is_admin, is_active, created_at, last_login
+        FROM users {where} ORDER BY created_at DESC, id DESC LIMIT ?
+    ''', (*params, limit)).fetchall()
+
+    return [{
+        'id': user[0],
+        'username': user[1],
+        'email': user[2],
+        'full_name': user[3],
+        'is_admin': bool(user[4]),
+        'is_active': bool(user[5]),
+        'created_at': user[6],
+        'last_login': user[7]
+    } for user in users]
+
+def _delete_user(conn: sqlite3.Connection, username: str) -> bool:
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM users WHERE username = ?', (username,))
-        rows_affected = cursor.rowcount
-        
+        cursor = conn.execute('DELETE FROM users WHERE username = ?', (username,))
         conn.commit()
-        conn.close()
-        
-        return rows_affected > 0
+        return cursor.rowcount > 0
     except sqlite3.Error:
+        conn.rollback()
         return False
 
-# Initialize database on import
-init_database()
+async def get_credentials(username: str) -> dict:
+    """Get an active user's record including the stored password hash"""
+    return await pool.run(_get_credentials, username)
+
+def record_login(user_id: int) -> None:
+    """Update a user's last login time (buffered, written by login_buffer)"""
+    login_buffer.record(user_id)
+
+def _with_pending_login(user: dict) -> dict:
+    pending = login_buffer.pending(user['id'])
+    if pending:
+        user['last_login'] = pending
+    return user
+
+async def update_password_hash(user_id: int, password_hash: str) -> None:
+    """Replace a user's stored password hash"""
+    await pool.run(_update_password_hash, user_id, password_hash)
+
+async def create_user(username: str, password_hash: str, email: str = None, full_name: str = None, is_admin: bool = False) -> bool:
+    """Create a new user from an already hashed password"""
+    return await pool.run(_create_user, username, password_hash, email, full_name, is_admin)
+
+async def get_user(username: str) -> dict:
+    """Get user information by username"""
+    user = await pool.run(_get_user, username)
+    return _with_pending_login(user) if user else None
+
+async def get_user_by_id(user_id: int) -> dict:
+    """Get user information by id"""
+    user = await pool.run(_get_user_by_id, user_id)
+    return _with_pending_login(user) if user else None
+
+async def get_all_users() -> list:
+    """Get all users for admin interface"""
+    return [_with_pending_login(user) for user in await pool.run(_get_all_users)]
+
+async def list_users(search: str = None, role: str = None, after: tuple = None, limit: int = 50) -> list:
+    """
+    Get one page of users, newest first
+
+    Args:
+        search: Case-insensitive substring of username, full name or email
+        role: 'admin', 'user' or None for all
+        after: (created_at, id) of the last row of the previous page
+        limit: Page size
+    """
+    users = await pool.run(_list_users, search, role, tuple(after) if after else None, limit)
+    return [_with_pending_login(user) for user in users]
+
+async def delete_user(username: str) -> bool:
+    """Delete a user (cannot delete admin user)"""
+    if username == 'admin':
+        return False  # Cannot delete admin user
+    return await pool.run(_delete_user, username)
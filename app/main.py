@@ -1,16 +1,10 @@
+import time
+_import_started = time.perf_counter()
+
 import header
-import components.dashboard_content
-import components.shipping_content
-import components.production_content
-import components.orders_content
-import components.pallets_content
-import components.packings_content
-import components.data_content
-import components.settings_content
-import components.print_component
-import components.blog_content
-import components.local_content
-import components.datalab_content
+import importlib
+import os
+import sys
 
 from pathlib import Path
 import json
@@ -19,18 +13,17 @@ from functools import wraps
 from fastapi import Request
 from fastapi.responses import RedirectResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-import requests
-from authlib.integrations.starlette_client import OAuthError
 import traceback
+import asyncio
+import re
 import logging
-import urllib3
 
 # Import database functions
 from services.user_service import UserService
 from services.auth_service import AuthService
-
-# Disable SSL warnings when verification is disabled
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from services.password_service import password_service
+from db.database import init_database, start_database, close_database
+from services.static_assets import static_assets
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -52,6 +45,62 @@ REDIRECT_URI = config["google_oauth"]["redirect_uri"]
 
 app.add_static_files('/assets', "assets")
 
+# Stylesheets are read once and served as hashed, long-cacheable files
+static_assets.add('global', Path(__file__).parent / "assets" / "css" / "global-css.css")
+static_assets.add('icons', Path(__file__).parent / "assets" / "css" / "icons.css")
+static_assets.register(app)
+
+def load_component(name: str):
+    """Import a page module on its first route hit (later calls hit sys.modules)"""
+    module_name = f'components.{name}'
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    started = time.perf_counter()
+    module = importlib.import_module(module_name)
+    logger.info(f"Loaded {module_name} in {(time.perf_counter() - started) * 1000:.1f} ms")
+    return module
+
+async def startup():
+    """Explicit startup phase: schema init and background workers, with timings"""
+    started = time.perf_counter()
+    await asyncio.to_thread(init_database)
+    logger.info(f"Startup: database initialized in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    phase = time.perf_counter()
+    # Batched last_login writes
+    await start_database()
+    # Keyword watchlist polling (pulls in the Naver client, so only when configured)
+    if os.getenv('NAVER_WATCHLIST'):
+        from services.watchlist import watchlist
+        from services.dashboard_snapshots import dashboard_snapshots
+        # Dashboard summaries are rebuilt after every cycle and once now from stored results
+        watchlist.add_listener(lambda: dashboard_snapshots.rebuild(watchlist.store))
+        await dashboard_snapshots.load()
+        await dashboard_snapshots.rebuild(watchlist.store)
+        await watchlist.start()
+    logger.info(f"Startup: background workers started in {(time.perf_counter() - phase) * 1000:.1f} ms")
+    logger.info(f"Startup: ready in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+async def shutdown():
+    """Close the HTTP clients that were used, then flush and release the database"""
+    # The watchlist polls through the Naver client, so stop it first
+    if 'services.watchlist' in sys.modules:
+        watchlist = sys.modules['services.watchlist'].watchlist
+        await watchlist.close()
+        watchlist.store.close()
+    if 'services.dashboard_snapshots' in sys.modules:
+        sys.modules['services.dashboard_snapshots'].dashboard_snapshots.close()
+    # The Naver and Google clients are created lazily; only close modules that were loaded
+    for module_name, attribute in (('services.naver_api', 'naver_api'), ('services.google_oauth', 'google_oauth')):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            await getattr(module, attribute).close()
+    await close_database()
+    password_service.close()
+
+app.on_startup(startup)
+app.on_shutdown(shutdown)
+
 # Create a global logo image instance to prevent reloading
 logo_image = None
 
@@ -64,40 +113,61 @@ def get_logo_image():
 # Define unrestricted routes (accessible without authentication)
 unrestricted_page_routes = {'/login', '/unauthorized', '/auth', '/logout', '/print', '/', '/favicon.ico'}
 
+def _compile_path_classes(public_routes) -> re.Pattern:
+    """One regex that classifies a path as framework, static, public or (no match) page"""
+    public = '|'.join(re.escape(route) for route in sorted(public_routes, key=len, reverse=True))
+    return re.compile(
+        r'(?P<framework>/_nicegui)'
+        r'|(?P<static>/assets/|/static/|.*\.(?:ico|png|css|js)$)'
+        rf'|(?P<public>(?:{public})$|/print/)'
+    )
+
 class AuthMiddleware(BaseHTTPMiddleware):
     """This middleware restricts access to all NiceGUI pages.
     
     It redirects the user to the login page if they are not authenticated.
+    Framework, static and public paths are recognised with one precompiled
+    regex and never touch user storage.
     """
 
+    path_classes = _compile_path_classes(unrestricted_page_routes)
+    _stats = {name: {'requests': 0, 'seconds': 0.0, 'max_seconds': 0.0} for name in ('framework', 'static', 'public', 'page')}
+
+    @classmethod
+    def classify(cls, path: str) -> str:
+        match = cls.path_classes.match(path)
+        return match.lastgroup if match else 'page'
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Request count and latency per path class"""
+        return {
+            name: {**counters, 'avg_ms': counters['seconds'] * 1000 / counters['requests'] if counters['requests'] else 0.0}
+            for name, counters in cls._stats.items()
+        }
+
     async def dispatch(self, request: Request, call_next):
-        if not app.storage.user.get('authenticated', False):
-            # Check if route is unrestricted or a print page
-            is_unrestricted = (
-                request.url.path.startswith('/_nicegui') or 
-                request.url.path in unrestricted_page_routes or
-                request.url.path.startswith('/print/') or
-                request.url.path.startswith('/assets/') or  # Allow access to static assets
-                request.url.path.endswith('.ico') or  # Allow favicon and icon files
-                request.url.path.endswith('.png') or  # Allow image files
-                request.url.path.endswith('.css') or  # Allow CSS files
-                request.url.path.endswith('.js')      # Allow JS files
-            )
-            
-            if not is_unrestricted:
+        started = time.perf_counter()
+        path_class = self.classify(request.url.path)
+        try:
+            if path_class == 'page' and not app.storage.user.get('authenticated', False):
                 app.storage.user['referrer_path'] = request.url.path  # remember where the user wanted to go
                 return RedirectResponse('/login')  # Redirect to login instead of unauthorized
-        return await call_next(request)
+            return await call_next(request)
+        finally:
+            elapsed = time.perf_counter() - started
+            counters = self._stats[path_class]
+            counters['requests'] += 1
+            counters['seconds'] += elapsed
+            counters['max_seconds'] = max(counters['max_seconds'], elapsed)
 
 app.add_middleware(AuthMiddleware)
 
 def with_auth_layout(route_handler):
     """Decorator for authenticated pages that includes the base layout"""
-    @wraps(route_handler)
-    def wrapper(*args, **kwargs):
+    def setup_layout():
         ui.colors(primary='#212121', secondary="#B4C3AA", positive='#53B689', accent='#111B1E')
-        ui.add_head_html("<style>" + open(Path(__file__).parent / "assets" / "css" / "global-css.css").read() + "</style>")
-        ui.add_head_html("<style>" + open(Path(__file__).parent / "assets" / "css" / "icons.css").read() + "</style>")
+        ui.add_head_html(static_assets.stylesheet_links('global', 'icons'))
         
         # Preload the logo image to prevent flickering
         ui.add_head_html('<link rel="preload" href="/assets/images/logo.gif" as="image">')
@@ -105,6 +175,18 @@ def with_auth_layout(route_handler):
         if 'sidebar-collapsed' not in app.storage.user:
             app.storage.user['sidebar-collapsed'] = True
 
+    if asyncio.iscoroutinefunction(route_handler):
+        # Async pages must finish inside the frame so their elements land in it
+        @wraps(route_handler)
+        async def async_wrapper(*args, **kwargs):
+            setup_layout()
+            with header.frame(title=appName, version=appVersion, get_logo_func=get_logo_image):
+                return await route_handler(*args, **kwargs)
+        return async_wrapper
+
+    @wraps(route_handler)
+    def wrapper(*args, **kwargs):
+        setup_layout()
         with header.frame(title=appName, version=appVersion, get_logo_func=get_logo_image):
             return route_handler(*args, **kwargs)
     return wrapper
@@ -114,8 +196,7 @@ def with_login_layout(route_handler):
     @wraps(route_handler)
     def wrapper(*args, **kwargs):
         ui.colors(primary='#212121', secondary="#B4C3AA", positive='#53B689', accent='#111B1E')
-        ui.add_head_html("<style>" + open(Path(__file__).parent / "assets" / "css" / "global-css.css").read() + "</style>")
-        ui.add_head_html("<style>" + open(Path(__file__).parent / "assets" / "css" / "icons.css").read() + "</style>")
+        ui.add_head_html(static_assets.stylesheet_links('global', 'icons'))
         
         return route_handler(*args, **kwargs)
     return wrapper
@@ -178,7 +259,7 @@ def login_page():
                         password_input = ui.input('Password', placeholder='Enter password', password=True).classes('w-full mb-4')
                         error_label = ui.label('').classes('text-red-500 text-sm mb-4').style('display: none;')
                         
-                        def handle_local_login():
+                        async def handle_local_login():
                             try:
                                 username = username_input.value.strip()
                                 password = password_input.value
@@ -189,7 +270,7 @@ def login_page():
                                     return
                                 
                                 # Authenticate user
-                                user_data = UserService.authenticate_user(username, password)
+                                user_data = await UserService.authenticate_user(username, password)
                                 
                                 if user_data:
                                     # Store user data and mark as authenticated
@@ -238,8 +319,8 @@ def login_page():
         logger.error(f"Error in login page: {e}")
         ui.label(f'Error: {str(e)}').classes('text-red-500')
 
-@ui.page('/auth')
-def auth_callback(code: str):
+@ui.page('/auth', response_timeout=15)
+async def auth_callback(code: str):
     """Google OAuth callback handler"""
     try:
         if not code:
@@ -247,25 +328,17 @@ def auth_callback(code: str):
             ui.navigate.to('/login')
             return
             
-        # Exchange authorization code for access token
-        token_url = "https://oauth2.googleapis.com/token"
-        
-        data = {
-            "code": code,
-            "client_id": CLIENT_ID,
-            "client_secret": CLIENT_SECRET,
-            "redirect_uri": REDIRECT_URI,
-            "grant_type": "authorization_code",
-        }
-        
-        response = requests.post(token_url, data=data, verify=False)
+        # Imported on first login; pulls in httpx
+        from services.google_oauth import google_oauth, GoogleOAuthError
         
-        if response.status_code != 200:
-            logger.error(f"Token exchange failed: {response.text}")
+        # Exchange authorization code for access token (non-blocking)
+        try:
+            token_data = await google_oauth.exchange_code(code, CLIENT_ID, CLIENT_SECRET, REDIRECT_URI)
+        except GoogleOAuthError as e:
+            logger.error(str(e))
             ui.navigate.to('/login')
             return
             
-        token_data = response.json()
         access_token = token_data.get("access_token")
         id_token = token_data.get("id_token")
         
@@ -279,18 +352,12 @@ def auth_callback(code: str):
         app.storage.user["id_token"] = id_token
         
         # Get user information
-        user_info_response = requests.get(
-            "https://www.googleapis.com/oauth2/v2/userinfo",
-            headers={"Authorization": f"Bearer {access_token}"},
-            verify=False
-        )
-        
-        if user_info_response.status_code != 200:
-            logger.error(f"Failed to get user info: {user_info_response.text}")
+        try:
+            user_data = await google_oauth.fetch_userinfo(access_token)
+        except GoogleOAuthError as e:
+            logger.error(str(e))
             ui.navigate.to('/login')
             return
-            
-        user_data = user_info_response.json()
         
         # Store user data and mark as authenticated
         app.storage.user.update({
@@ -338,17 +405,17 @@ def logout():
 @ui.page('/trends/blog')
 @with_auth_layout
 def blog_page():
-    components.blog_content.content()
+    load_component('blog_content').content()
 
 @ui.page('/trends/local')
 @with_auth_layout
 def local_page():
-    components.local_content.content()
+    load_component('local_content').content()
 
 @ui.page('/trends/datalab')
 @with_auth_layout
 def datalab_page():
-    components.datalab_content.content()
+    load_component('datalab_content').content()
 
 # Main application pages (all protected)
 @ui.page('/dashboard')
@@ -382,8 +449,9 @@ def dashboard():
                         ui.icon('analytics', size='xl').classes('text-purple-500')
                         ui.label('데이터랩 트렌드').classes('text-xl font-bold mt-2')
                         ui.label('키워드별 검색량 추이 분석').classes('text-sm text-gray-500')
-            
-        # components.dashboard_content.content()
+
+        # Watchlist trend summaries from the precomputed snapshot
+        load_component('dashboard_content').content()
             
     except Exception as e:
         logger.error(f"Dashboard error: {e}")
@@ -392,55 +460,57 @@ def dashboard():
 @ui.page('/shipping')
 @with_auth_layout
 def shipping():
-    components.shipping_content.content()
+    load_component('shipping_content').content()
 
 @ui.page('/production')
 @with_auth_layout
 def production():
-    components.production_content.content(searchFilter='')
+    load_component('production_content').content(searchFilter='')
 
 @ui.page('/production/{searchFilter}')
 @with_auth_layout
 def production_search(searchFilter):
-    components.production_content.content(searchFilter=searchFilter)
+    load_component('production_content').content(searchFilter=searchFilter)
 
 @ui.page('/orders')
 @with_auth_layout
 def orders():
-    components.orders_content.content()
+    load_component('orders_content').content()
 
 @ui.page('/pallets')
 @with_auth_layout
 def pallets():
-    components.pallets_content.content()
+    load_component('pallets_content').content()
 
 @ui.page('/packing')
 @with_auth_layout
 def packing():
-    components.packings_content.content()
+    load_component('packings_content').content()
 
 @ui.page('/settings')
 @with_auth_layout
-def settings():
-    components.settings_content.content()
+async def settings():
+    await load_component('settings_content').content()
 
 @ui.page('/customer/{customernumber}')
 @with_auth_layout
 def customer_page(customernumber):
-    components.data_content.content(customernumber)
+    load_component('data_content').content(customernumber)
 
 # Print page (unrestricted - doesn't require authentication)
 @ui.page('/print/{data}')
 def print_page(data):
     ui.colors(primary='#212121', secondary="#B4C3AA", positive='#53B689', accent='#111B1E')
-    ui.add_head_html("<style>" + open(Path(__file__).parent / "assets" / "css" / "global-css.css").read() + "</style>")
-    components.print_component.content(data)
+    ui.add_head_html(static_assets.stylesheet_links('global'))
+    load_component('print_component').content(data)
 
 # Update the header.py logout functionality
 def update_header_logout():
     """This function should be called to update the logout functionality in header.py"""
     pass
 
+logger.info(f"App module loaded in {(time.perf_counter() - _import_started) * 1000:.1f} ms")
+
 if __name__ == "__main__":
     # For dev
     ui.run(storage_secret="myStorageSecret", title=appName, port=appPort, favicon='ico.ico', reconnect_timeout=20, reload=False)  # log_level="debug")
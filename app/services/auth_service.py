@@ -34,15 +34,24 @@ class AuthService:
         return app.storage.user.get('authenticated', False)
     
     @staticmethod
-    def is_current_user_admin() -> bool:
+    async def is_current_user_admin() -> bool:
         """
         Check if the current user has admin privileges
         
+        Local users are checked against their database record (served from
+        the user cache, which login populates), so revoked privileges and
+        deleted accounts take effect without logging out.
+        
         Returns:
             True if current user is admin, False otherwise
         """
         user_data = AuthService.get_current_user()
-        return UserService.is_admin(user_data) if user_data else False
+        if not user_data:
+            return False
+        
+        if user_data.get('login_type') == 'local':
+            return UserService.is_admin(await UserService.get_user(user_data.get('username')))
+        return UserService.is_admin(user_data)
     
     @staticmethod
     def get_current_username() -> Optional[str]:
@@ -85,14 +94,14 @@ class AuthService:
         app.storage.user.clear()
     
     @staticmethod
-    def require_admin() -> bool:
+    async def require_admin() -> bool:
         """
         Check if current user is admin, can be used for route protection
         
         Returns:
             True if user is admin, False otherwise
         """
-        return AuthService.is_current_user_admin()
+        return await AuthService.is_current_user_admin()
     
     @staticmethod
     def require_authentication() -> bool:
@@ -116,9 +125,9 @@ def is_authenticated() -> bool:
     return AuthService.is_authenticated()
 
 
-def is_current_user_admin() -> bool:
+async def is_current_user_admin() -> bool:
     """Check if current user is admin"""
-    return AuthService.is_current_user_admin()
+    return await AuthService.is_current_user_admin()
 
 
 def get_current_username() -> Optional[str]:
@@ -126,9 +135,9 @@ def get_current_username() -> Optional[str]:
     return AuthService.get_current_username()
 
 
-def require_admin() -> bool:
+async def require_admin() -> bool:
     """Require admin privileges"""
-    return AuthService.require_admin()
+    return await AuthService.require_admin()
 
 
 def require_authentication() -> bool:
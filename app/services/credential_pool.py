@@ -0,0 +1,190 @@
+"""
+Credential Pool Module
+
+Load balancing across several Naver Open API application credentials.
+Requests go to the credential with the most remaining daily quota and the
+lowest recent error rate; credentials answering 429/401/403 are put on a
+cooldown and come back into rotation once it expires.
+"""
+
+import logging
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from services.rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Status codes that take a credential out of rotation
+RATE_LIMITED_STATUS = 429
+AUTH_FAILED_STATUSES = (401, 403)
+
+
+class NoCredentialAvailable(Exception):
+    """Raised when every credential is cooling down or out of quota"""
+
+
+class Credential:
+    """One Naver application key pair with its health state"""
+
+    def __init__(self, client_id: str, client_secret: str, window: int = 20):
+        self.client_id = client_id
+        self.client_secret = client_secret
+        self.headers = {
+            'X-Naver-Client-Id': client_id,
+            'X-Naver-Client-Secret': client_secret
+        }
+        self.cooldown_until = 0.0
+        self.consecutive_rate_limits = 0
+        self._recent = deque(maxlen=window)
+
+    @property
+    def label(self) -> str:
+        """Client ID masked for logs and stats"""
+        return f"{self.client_id[:4]}***" if self.client_id else '(unset)'
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed calls in the recent window"""
+        if not self._recent:
+            return 0.0
+        return self._recent.count(False) / len(self._recent)
+
+    def is_available(self, now: float) -> bool:
+        return now >= self.cooldown_until
+
+    def record(self, success: bool) -> None:
+        self._recent.append(success)
+
+
+class CredentialPool:
+    """Selects credentials by remaining quota and recent error rate"""
+
+    def __init__(
+        self,
+        credentials: List[Tuple[str, str]],
+        rate_limiter: RateLimiter,
+        rate_limit_cooldown: float = 30.0,
+        auth_failure_cooldown: float = 600.0,
+        max_cooldown: float = 600.0
+    ):
+        """
+        Args:
+            credentials: List of (client_id, client_secret) pairs
+            rate_limiter: Limiter that tracks per-credential quota usage
+            rate_limit_cooldown: Base cooldown after a 429 (doubles on repeats)
+            auth_failure_cooldown: Cooldown after a 401/403
+            max_cooldown: Upper bound for the 429 cooldown
+        """
+        self.credentials = [Credential(client_id, secret) for client_id, secret in credentials]
+        self.rate_limiter = rate_limiter
+        self.rate_limit_cooldown = rate_limit_cooldown
+        self.auth_failure_cooldown = auth_failure_cooldown
+        self.max_cooldown = max_cooldown
+
+    @staticmethod
+    def from_env() -> List[Tuple[str, str]]:
+        """
+        Read credentials from the environment
+
+        NAVER_CREDENTIALS holds comma-separated "id:secret" pairs; the single
+        NAVER_CLIENT_ID/NAVER_CLIENT_SECRET pair is still honoured.
+
+        Returns:
+            De-duplicated list of (client_id, client_secret) pairs
+        """
+        pairs = []
+        for entry in os.getenv('NAVER_CREDENTIALS', '').split(','):
+            client_id, _, secret = entry.strip().partition(':')
+            if client_id and secret:
+                pairs.append((client_id.strip(), secret.strip()))
+
+        legacy = (os.getenv('NAVER_CLIENT_ID'), os.getenv('NAVER_CLIENT_SECRET'))
+        if legacy[0] and legacy[1] and legacy not in pairs:
+            pairs.insert(0, legacy)
+
+        return pairs
+
+    def select(self, bucket: str) -> Credential:
+        """
+        Pick the healthiest credential for a bucket
+
+        Args:
+            bucket: Limit bucket name ('search', 'datalab')
+
+        Returns:
+            Credential with the best quota/error-rate score
+
+        Raises:
+            NoCredentialAvailable: If all credentials are cooling down or exhausted
+        """
+        now = time.time()
+        best, best_score = None, 0.0
+        for credential in self.credentials:
+            if not credential.is_available(now):
+                continue
+            remaining = self.rate_limiter.remaining(credential.client_id, bucket)
+            waiting = self.rate_limiter.waiting(credential.client_id, bucket)
+            score = remaining * (1.0 - credential.error_rate) / (1 + waiting)
+            # a credential whose every recent call failed still gets probed
+            score = max(score, 1e-9) if remaining else 0.0
+            if score > best_score:
+                best, best_score = credential, score
+
+        if best is None:
+            raise NoCredentialAvailable("사용 가능한 네이버 API 인증 정보가 없습니다")
+        return best
+
+    def report_success(self, credential: Credential) -> None:
+        """Record a successful call"""
+        credential.record(True)
+        credential.consecutive_rate_limits = 0
+
+    def report_failure(self, credential: Credential, status_code: int) -> None:
+        """
+        Record a failed call and bench the credential on 429/401/403
+
+        Args:
+            credential: Credential used for the call
+            status_code: HTTP status returned by Naver
+        """
+        credential.record(False)
+
+        # concurrent calls already in flight when it was benched don't extend the cooldown
+        if not credential.is_available(time.time()):
+            return
+
+        if status_code == RATE_LIMITED_STATUS:
+            credential.consecutive_rate_limits += 1
+            cooldown = min(
+                self.max_cooldown,
+                self.rate_limit_cooldown * 2 ** (credential.consecutive_rate_limits - 1)
+            )
+        elif status_code in AUTH_FAILED_STATUSES:
+            cooldown = self.auth_failure_cooldown
+        else:
+            return
+
+        credential.cooldown_until = time.time() + cooldown
+        logger.warning(f"Credential {credential.label} benched for {cooldown:.0f}s (HTTP {status_code})")
+
+    def stats(self) -> List[Dict]:
+        """
+        Get per-credential health
+
+        Returns:
+            List of dicts with masked ID, availability, error rate and cooldown
+        """
+        now = time.time()
+        return [{
+            'client_id': credential.label,
+            'available': credential.is_available(now),
+            'error_rate': credential.error_rate,
+            'cooldown_remaining': max(0.0, credential.cooldown_until - now)
+        } for credential in self.credentials]
+
+    def first(self) -> Optional[Credential]:
+        """Primary credential (used for backward-compatible attributes)"""
+        return self.credentials[0] if self.credentials else None
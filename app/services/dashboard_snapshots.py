@@ -0,0 +1,224 @@
+"""
+Dashboard Snapshots Module
+
+Precomputed dashboard content. After every watchlist cycle the stored
+DataLab series and blog volumes are reduced to a bounded snapshot (top
+movers with sparkline points, recent volume changes), persisted as one JSON
+row and kept in memory. The dashboard page only reads the in-memory
+snapshot, so rendering does no network calls and costs the same however
+many keywords are tracked. Nothing is shown unless the watchlist is active,
+and snapshots older than max_age are flagged as stale.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_DB = Path(__file__).parent.parent / 'db' / 'watchlist.db'
+
+# Periods per side when comparing the latest week with the one before
+MOVER_WINDOW = 7
+
+# Sparkline drawing box (SVG user units)
+SPARKLINE_WIDTH = 120
+SPARKLINE_HEIGHT = 32
+
+
+def sparkline_points(values: List[float], points: int) -> str:
+    """SVG polyline points for the last N values, scaled to the sparkline box"""
+    values = values[-points:]
+    if len(values) < 2:
+        return ''
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    step = SPARKLINE_WIDTH / (len(values) - 1)
+    return ' '.join(
+        f'{i * step:.1f},{SPARKLINE_HEIGHT - (value - low) / span * SPARKLINE_HEIGHT:.1f}'
+        for i, value in enumerate(values)
+    )
+
+
+def build_snapshot(
+    series: Dict[str, Dict],
+    volumes: Dict[str, List[tuple]],
+    movers: int = 12,
+    volume_rows: int = 10,
+    points: int = 30
+) -> Dict:
+    """
+    Reduce watchlist data to what the dashboard shows
+
+    Args:
+        series: WatchlistStore.series() output
+        volumes: WatchlistStore.volumes() output, oldest first per keyword
+        movers: Keywords kept in the movers list
+        volume_rows: Keywords kept in the volume list
+        points: Sparkline length in periods
+
+    Returns:
+        Snapshot dict with 'movers', 'volumes' and bookkeeping fields
+    """
+    # numpy is only needed here, in the background rebuild
+    import numpy as np
+    from services.trend_analytics import TrendMatrix
+
+    # series fetched on the same day share a period axis; analyse each axis as one matrix
+    axes: Dict[tuple, List[str]] = {}
+    for keyword, data in series.items():
+        if data['periods']:
+            axes.setdefault((data['time_unit'], tuple(data['periods'])), []).append(keyword)
+
+    rows = []
+    for (time_unit, periods), keywords in axes.items():
+        matrix = TrendMatrix(
+            titles=keywords,
+            periods=np.array(periods, dtype='datetime64[D]'),
+            values=np.array([series[keyword]['ratios'] for keyword in keywords], dtype=float),
+            time_unit=time_unit
+        )
+        # latest window mean versus the window before it
+        window = min(MOVER_WINDOW, len(periods) // 2)
+        change = np.full(len(keywords), np.nan)
+        if window:
+            moving = matrix.moving_average(window)
+            current, previous = moving[:, -1], moving[:, -1 - window]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                change = np.where(previous > 0, (current - previous) / previous, np.nan)
+        slopes = matrix.slopes()
+
+        for row, keyword in enumerate(keywords):
+            rows.append({
+                'keyword': keyword,
+                'latest': float(matrix.values[row, -1]),
+                'change': None if np.isnan(change[row]) else float(change[row]),
+                'slope': float(slopes[row]),
+                'period': str(matrix.periods[-1]),
+                'sparkline': sparkline_points(series[keyword]['ratios'], points)
+            })
+
+    rows.sort(key=lambda row: abs(row['change']) if row['change'] is not None else -1.0, reverse=True)
+
+    volume_list = []
+    for keyword, history in volumes.items():
+        fetched_at, total = history[-1]
+        # compare with the newest reading at least a day older
+        base = next((t for at, t in reversed(history) if at <= fetched_at - 86400), history[0][1])
+        volume_list.append({'keyword': keyword, 'total': total, 'delta': total - base, 'fetched_at': fetched_at})
+    volume_list.sort(key=lambda row: row['delta'], reverse=True)
+
+    return {
+        'built_at': time.time(),
+        'keywords': len(set(series) | set(volumes)),
+        'source_fetched_at': max((data['fetched_at'] for data in series.values()), default=None),
+        'sparkline_box': [SPARKLINE_WIDTH, SPARKLINE_HEIGHT],
+        'movers': rows[:movers],
+        'volumes': volume_list[:volume_rows]
+    }
+
+
+class DashboardSnapshots:
+    """Latest dashboard snapshot, rebuilt in the background and read in O(1)"""
+
+    def __init__(self, db_path: Union[str, Path], max_age: Optional[float] = None):
+        """
+        Args:
+            db_path: SQLite file the snapshot is persisted to (shared with the watchlist)
+            max_age: Seconds after which a snapshot counts as stale (default two watchlist intervals)
+        """
+        self.db_path = Path(db_path)
+        self.max_age = max_age or 2 * float(os.getenv('NAVER_WATCHLIST_INTERVAL', '3600'))
+        self._db_lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._latest: Optional[Dict] = None
+        # set once the watchlist starts; a leftover snapshot from a disabled watchlist stays hidden
+        self._active = False
+        self._stats = {
+            'rebuilds': 0,
+            'last_build_ms': None
+        }
+
+    async def load(self) -> None:
+        """Restore the last persisted snapshot (called at startup when the watchlist is active)"""
+        self._latest = await asyncio.to_thread(self._db_load)
+        self._active = True
+
+    def latest(self) -> Optional[Dict]:
+        """Current snapshot, or None without an active watchlist or before the first build"""
+        return self._latest if self._active else None
+
+    def is_stale(self, snapshot: Dict) -> bool:
+        """Whether a snapshot is older than max_age"""
+        return time.time() - snapshot['built_at'] > self.max_age
+
+    async def rebuild(self, store) -> Dict:
+        """
+        Build a snapshot from a WatchlistStore and publish it
+
+        Args:
+            store: WatchlistStore to read series and volumes from
+        """
+        started = time.perf_counter()
+        snapshot = await asyncio.to_thread(self._build, store)
+        self._latest = snapshot
+        self._active = True
+        self._stats['rebuilds'] += 1
+        self._stats['last_build_ms'] = (time.perf_counter() - started) * 1000
+        logger.info(f"Dashboard snapshot rebuilt | keywords: {snapshot['keywords']} | {self._stats['last_build_ms']:.1f} ms")
+        return snapshot
+
+    def stats(self) -> Dict:
+        return {**self._stats, 'built_at': (self._latest or {}).get('built_at')}
+
+    def close(self) -> None:
+        """Close the SQLite backend"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _build(self, store) -> Dict:
+        snapshot = build_snapshot(store.series(), store.volumes(time.time() - 2 * 86400))
+        self._db_save(snapshot)
+        return snapshot
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._db is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute('''
+                CREATE TABLE IF NOT EXISTS dashboard_snapshots (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    built_at REAL NOT NULL,
+                    payload TEXT NOT NULL
+                )
+            ''')
+            self._db.commit()
+        return self._db
+
+    def _db_save(self, snapshot: Dict) -> None:
+        with self._db_lock:
+            db = self._connect()
+            db.execute(
+                'INSERT OR REPLACE INTO dashboard_snapshots (id, built_at, payload) VALUES (1, ?, ?)',
+                (snapshot['built_at'], json.dumps(snapshot, ensure_ascii=False))
+            )
+            db.commit()
+
+    def _db_load(self) -> Optional[Dict]:
+        if not self.db_path.exists():
+            return None
+        with self._db_lock:
+            row = self._connect().execute('SELECT payload FROM dashboard_snapshots WHERE id = 1').fetchone()
+        return json.loads(row[0]) if row else None
+
+
+# Shared instance
+dashboard_snapshots = DashboardSnapshots(os.getenv('NAVER_WATCHLIST_DB', str(DEFAULT_SNAPSHOT_DB)))
@@ -0,0 +1,105 @@
+"""
+Google OAuth Service Module
+
+Non-blocking Google OAuth code exchange and userinfo lookup on a shared,
+pooled async HTTP client with TLS verification and bounded timeouts.
+"""
+
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+TOKEN_URL = "https://oauth2.googleapis.com/token"
+USERINFO_URL = "https://www.googleapis.com/oauth2/v2/userinfo"
+
+
+class GoogleOAuthError(Exception):
+    """Raised when the token exchange or userinfo request fails"""
+
+
+class GoogleOAuthService:
+    """Service class for the Google OAuth authorization-code flow"""
+
+    def __init__(self, timeout: float = 5.0, max_connections: int = 10):
+        """
+        Args:
+            timeout: Per-request timeout in seconds
+            max_connections: Connection pool size
+        """
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def start(self) -> None:
+        """Create the shared client (called on app startup)"""
+        if self._client is not None and not self._client.is_closed:
+            return
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(max_connections=self.max_connections),
+            verify=True
+        )
+
+    async def close(self) -> None:
+        """Close the shared client (called on app shutdown)"""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            await self.start()
+        return self._client
+
+    async def exchange_code(self, code: str, client_id: str, client_secret: str, redirect_uri: str) -> Dict:
+        """
+        Exchange an authorization code for tokens
+
+        Returns:
+            Token response containing access_token and id_token
+
+        Raises:
+            GoogleOAuthError: If Google rejects the code or is unreachable
+        """
+        client = await self._get_client()
+        try:
+            response = await client.post(TOKEN_URL, data={
+                "code": code,
+                "client_id": client_id,
+                "client_secret": client_secret,
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
+            })
+        except httpx.HTTPError as e:
+            raise GoogleOAuthError(f"Token exchange failed: {e}") from e
+
+        if response.status_code != 200:
+            raise GoogleOAuthError(f"Token exchange failed: {response.text}")
+        return response.json()
+
+    async def fetch_userinfo(self, access_token: str) -> Dict:
+        """
+        Fetch the Google profile for an access token
+
+        Returns:
+            Userinfo dictionary (email, name, picture, ...)
+
+        Raises:
+            GoogleOAuthError: If the request fails
+        """
+        client = await self._get_client()
+        try:
+            response = await client.get(USERINFO_URL, headers={"Authorization": f"Bearer {access_token}"})
+        except httpx.HTTPError as e:
+            raise GoogleOAuthError(f"Failed to get user info: {e}") from e
+
+        if response.status_code != 200:
+            raise GoogleOAuthError(f"Failed to get user info: {response.text}")
+        return response.json()
+
+
+# Shared instance
+google_oauth = GoogleOAuthService()
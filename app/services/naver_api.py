@@ -1,30 +1,588 @@
-import httpx
-import os
-from typing import Dict, List, Optional
+import asyncio
+import importlib.util
 import logging
+import os
+from datetime import date, datetime, timedelta
 from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
 from dotenv import load_dotenv
 
+from services.credential_pool import AUTH_FAILED_STATUSES, RATE_LIMITED_STATUS, CredentialPool, NoCredentialAvailable
+from services.rate_limiter import KST, RateLimiter, RateLimitExceeded
+from services.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from services.response_cache import ResponseCache
+from services.series_store import DataLabSeriesStore, series_from_response, series_to_response, splice_series
+from services.single_flight import SingleFlight
+from services.spatial_index import SpatialIndex, place_key, to_wgs84
+from services.term_index import TermIndex
+
 # 상위 디렉토리의 .env 파일 로드
 env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
 
 logger = logging.getLogger(__name__)
 
+# 엔드포인트별 호출 한도 버킷 (검색 API 와 데이터랩은 한도가 별도)
+ENDPOINT_BUCKETS = {
+    'blog': 'search',
+    'local': 'search',
+    'datalab': 'datalab'
+}
+
+# 블로그 검색 페이지 제한 (display 최대 100, start 최대 1000)
+BLOG_PAGE_SIZE = 100
+BLOG_MAX_START = 1000
+
+# 지역 검색 결과 제한 (display 최대 5) 과 확장 검색 기본 세부 키워드
+LOCAL_PAGE_SIZE = 5
+LOCAL_SORTS = ('random', 'comment')
+LOCAL_SWEEP_MODIFIERS = (
+    '한식', '일식', '중식', '양식', '분식', '고기', '해산물', '카페', '디저트', '술집', '브런치', '베이커리'
+)
+
+# 데이터랩 요청당 키워드 그룹 제한 (초과 시 기준 그룹을 공유하는 샤드로 분할)
+DATALAB_MAX_GROUPS = 5
+DATALAB_MAX_TOTAL_GROUPS = 50
+
+# 증분 조회 시 저장된 마지막 구간과 겹쳐 받을 구간 수 (척도 보정용)
+DATALAB_OVERLAP_PERIODS = 3
+
+# 구간이 끝난 뒤 데이터랩에 집계가 반영되기까지 기다리는 일수
+DATALAB_PUBLISH_LAG_DAYS = 1
+
+DEFAULT_QUOTA_DB = Path(__file__).parent.parent / 'db' / 'naver_quota.db'
+DEFAULT_SERIES_DB = Path(__file__).parent.parent / 'db' / 'datalab_series.db'
+DEFAULT_TERM_DB = Path(__file__).parent.parent / 'db' / 'blog_terms.db'
+DEFAULT_PLACES_DB = Path(__file__).parent.parent / 'db' / 'places.db'
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """환경 변수를 bool 로 해석 (1/true/yes/on)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _period_close(end_date: str, time_unit: str) -> date:
+    """end_date 가 속한 데이터랩 구간의 마지막 날 (주 단위는 시작 요일과 무관하게 보수적으로 6일 뒤)"""
+    end = date.fromisoformat(end_date)
+    if time_unit == 'week':
+        return end + timedelta(days=6)
+    if time_unit == 'month':
+        return (end.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return end
+
+
+def _period_settled(period: str, time_unit: str) -> str:
+    """이 날짜 이후에 받은 값이면 해당 구간 집계가 끝난 것으로 봄 (구간 마지막 날 + 공개 지연)"""
+    return (_period_close(period, time_unit) + timedelta(days=DATALAB_PUBLISH_LAG_DAYS)).isoformat()
+
+
+def _ratio_sum(result: Dict) -> float:
+    """데이터랩 결과 그룹의 비율 합계"""
+    return sum(item['ratio'] for item in result['data'])
+
+
+def _merge_datalab_shards(responses: List[Dict], anchor_index: int) -> Dict:
+    """기준 그룹을 공유하는 데이터랩 샤드 응답을 하나의 척도로 병합
+    
+    각 샤드는 자기 안에서 최대값이 100 이 되도록 정규화되어 있으므로,
+    모든 샤드에 포함된 기준 그룹(각 샤드의 첫 결과)의 합계 비율로 다시 맞춘 뒤
+    전체 최대값이 100 이 되도록 재정규화한다.
+    
+    Args:
+        responses: 샤드별 응답 (각 응답의 results[0] 이 기준 그룹)
+        anchor_index: 원래 요청에서 기준 그룹의 위치
+    
+    Returns:
+        원래 그룹 순서대로 병합된 응답 딕셔너리
+    
+    Raises:
+        Exception: 어느 샤드에서든 기준 그룹 검색량이 0 이라 척도를 맞출 수 없는 경우
+    """
+    totals = [_ratio_sum(response['results'][0]) for response in responses]
+    if not all(total > 0 for total in totals):
+        raise Exception("분석 실패: 기준 그룹 검색량이 0 이라 샤드 결과를 병합할 수 없습니다")
+    
+    reference = totals[0]
+    scaled = []
+    for shard_idx, response in enumerate(responses):
+        factor = reference / totals[shard_idx]
+        
+        # 기준 그룹은 첫 샤드의 것만 사용
+        results = response['results'] if shard_idx == 0 else response['results'][1:]
+        for result in results:
+            scaled.append({
+                **result,
+                'data': [{**item, 'ratio': item['ratio'] * factor} for item in result['data']]
+            })
+    
+    peak = max((item['ratio'] for result in scaled for item in result['data']), default=0)
+    if peak > 0:
+        for result in scaled:
+            for item in result['data']:
+                item['ratio'] = round(item['ratio'] * 100 / peak, 5)
+    
+    # 기준 그룹을 원래 위치로 이동
+    scaled.insert(anchor_index, scaled.pop(0))
+    
+    return {
+        **{key: value for key, value in responses[0].items() if key != 'results'},
+        'results': scaled,
+        'shards': len(responses)
+    }
+
+
 class NaverAPIService:
-    def __init__(self):
-        self.client_id = os.getenv('NAVER_CLIENT_ID')
-        self.client_secret = os.getenv('NAVER_CLIENT_SECRET')
-        self.base_headers = {
-            'X-Naver-Client-Id': self.client_id,
-            'X-Naver-Client-Secret': self.client_secret
+    def __init__(
+        self,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: Optional[bool] = None,
+        timeout: Optional[float] = None,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        credentials: Optional[List[Tuple[str, str]]] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        series_store: Optional[DataLabSeriesStore] = None,
+        term_index: Optional[TermIndex] = None,
+        spatial_index: Optional[SpatialIndex] = None
+    ):
+        # 커넥션 풀 설정 (인자 > 환경 변수 > 기본값)
+        self.max_connections = max_connections or int(os.getenv('NAVER_HTTP_MAX_CONNECTIONS', '20'))
+        self.max_keepalive_connections = max_keepalive_connections or int(os.getenv('NAVER_HTTP_MAX_KEEPALIVE', '10'))
+        self.keepalive_expiry = keepalive_expiry or float(os.getenv('NAVER_HTTP_KEEPALIVE_EXPIRY', '30'))
+        self.timeout = timeout or float(os.getenv('NAVER_HTTP_TIMEOUT', '10'))
+        
+        # HTTP/2 는 h2 패키지가 설치된 경우에만 사용
+        want_http2 = _env_bool('NAVER_HTTP2', True) if http2 is None else http2
+        self.http2 = want_http2 and importlib.util.find_spec('h2') is not None
+        if want_http2 and not self.http2:
+            logger.warning("h2 패키지가 없어 HTTP/1.1 로 동작합니다 (pip install 'httpx[http2]')")
+        
+        self._client: Optional[httpx.AsyncClient] = None
+        self._requests_sent = 0
+        
+        # 응답 캐시 (엔드포인트별 TTL, 0 이면 캐시하지 않음)
+        self.cache = cache or ResponseCache(
+            ttls={
+                'blog': float(os.getenv('NAVER_CACHE_TTL_BLOG', '300')),
+                'local': float(os.getenv('NAVER_CACHE_TTL_LOCAL', '600')),
+                'datalab': float(os.getenv('NAVER_CACHE_TTL_DATALAB', '3600'))
+            },
+            max_entries=int(os.getenv('NAVER_CACHE_MAX_ENTRIES', '1000')),
+            db_path=os.getenv('NAVER_CACHE_DB') or None,
+            stale_ttl=float(os.getenv('NAVER_CACHE_STALE_TTL', '86400'))
+        )
+        
+        # 동일 요청 동시 호출 병합 (single-flight)
+        self.single_flight = SingleFlight()
+        
+        # 초당/일일 호출 한도 (버킷: (초당 호출, 버스트, 일일 호출))
+        self.rate_limiter = rate_limiter or RateLimiter(
+            limits={
+                'search': (
+                    float(os.getenv('NAVER_RATE_SEARCH_PER_SEC', '10')),
+                    float(os.getenv('NAVER_RATE_SEARCH_BURST', '10')),
+                    int(os.getenv('NAVER_QUOTA_SEARCH_DAILY', '25000'))
+                ),
+                'datalab': (
+                    float(os.getenv('NAVER_RATE_DATALAB_PER_SEC', '5')),
+                    float(os.getenv('NAVER_RATE_DATALAB_BURST', '5')),
+                    int(os.getenv('NAVER_QUOTA_DATALAB_DAILY', '1000'))
+                )
+            },
+            max_wait=float(os.getenv('NAVER_RATE_MAX_WAIT', '5')),
+            db_path=os.getenv('NAVER_QUOTA_DB', str(DEFAULT_QUOTA_DB)) or None
+        )
+        
+        # 인증 정보 풀 (NAVER_CREDENTIALS="id1:secret1,id2:secret2" + 기존 단일 키)
+        self.credentials = CredentialPool(
+            credentials if credentials is not None else CredentialPool.from_env(),
+            self.rate_limiter,
+            rate_limit_cooldown=float(os.getenv('NAVER_CREDENTIAL_COOLDOWN', '30')),
+            auth_failure_cooldown=float(os.getenv('NAVER_CREDENTIAL_AUTH_COOLDOWN', '600'))
+        )
+        if not self.credentials.credentials:
+            logger.warning("네이버 API 인증 정보가 설정되지 않았습니다 (NAVER_CLIENT_ID / NAVER_CREDENTIALS)")
+        
+        # 엔드포인트별 타임아웃 (데이터랩은 응답이 느림)
+        self.timeouts = {
+            'blog': float(os.getenv('NAVER_TIMEOUT_BLOG', '5')),
+            'local': float(os.getenv('NAVER_TIMEOUT_LOCAL', '5')),
+            'datalab': float(os.getenv('NAVER_TIMEOUT_DATALAB', '15'))
+        }
+        
+        # 재시도 정책 및 엔드포인트별 서킷 브레이커
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=int(os.getenv('NAVER_RETRY_MAX', '3')),
+            base_delay=float(os.getenv('NAVER_RETRY_BASE_DELAY', '0.2')),
+            max_delay=float(os.getenv('NAVER_RETRY_MAX_DELAY', '5'))
+        )
+        self.breakers = {
+            endpoint: CircuitBreaker(
+                endpoint,
+                failure_threshold=int(os.getenv('NAVER_BREAKER_THRESHOLD', '5')),
+                recovery_timeout=float(os.getenv('NAVER_BREAKER_RECOVERY', '30'))
+            )
+            for endpoint in ENDPOINT_BUCKETS
         }
+        
+        # 데이터랩 시계열 저장소 (빈 값이면 비활성화)
+        series_db = os.getenv('NAVER_DATALAB_STORE', str(DEFAULT_SERIES_DB))
+        self.series_store = series_store or (DataLabSeriesStore(series_db) if series_db else None)
+        
+        # 블로그 결과 역색인 (빈 값이면 비활성화)
+        term_db = os.getenv('NAVER_TERM_INDEX', str(DEFAULT_TERM_DB))
+        self.term_index = term_index or (TermIndex(term_db) if term_db else None)
+        
+        # 지역 결과 공간 색인 (빈 값이면 비활성화)
+        places_db = os.getenv('NAVER_SPATIAL_INDEX', str(DEFAULT_PLACES_DB))
+        self.spatial_index = spatial_index or (SpatialIndex(places_db) if places_db else None)
+        self._index_tasks = set()
+        
+        # 기존 코드 호환용 (기본 인증 정보)
+        primary = self.credentials.first()
+        self.client_id = primary.client_id if primary else None
+        self.client_secret = primary.client_secret if primary else None
+        self.base_headers = primary.headers if primary else {}
+    
+    async def start(self) -> None:
+        """공유 HTTP 클라이언트 생성 (앱 시작 시 호출)"""
+        if self._client is not None and not self._client.is_closed:
+            return
+        
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            timeout=self.timeout,
+            http2=self.http2
+        )
+        # 저장된 장소는 이벤트 루프를 막지 않도록 백그라운드 스레드에서 불러옴
+        if self.spatial_index is not None:
+            self._schedule_index(self.spatial_index.start())
+        logger.info(
+            f"네이버 API 클라이언트 시작 | HTTP/2: {self.http2} | "
+            f"최대 연결: {self.max_connections} | keep-alive: {self.max_keepalive_connections} | "
+            f"인증 정보: {len(self.credentials.credentials)}개"
+        )
+    
+    async def close(self) -> None:
+        """공유 HTTP 클라이언트 종료 (앱 종료 시 호출)"""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+        self.cache.close()
+        self.rate_limiter.close()
+        if self.series_store is not None:
+            self.series_store.close()
+        if self._index_tasks:
+            await asyncio.gather(*self._index_tasks, return_exceptions=True)
+        if self.term_index is not None:
+            self.term_index.close()
+        if self.spatial_index is not None:
+            self.spatial_index.close()
+        logger.info(f"네이버 API 클라이언트 종료 | 총 요청: {self._requests_sent}건")
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """공유 클라이언트 반환 (start() 전에 호출되면 지연 생성)"""
+        if self._client is None or self._client.is_closed:
+            await self.start()
+        self._requests_sent += 1
+        return self._client
+    
+    def pool_stats(self) -> Dict:
+        """커넥션 풀 통계
+        
+        Returns:
+            설정값, 누적 요청 수, 현재 연결 상태(전체/유휴/사용 중/HTTP2)
+        """
+        stats = {
+            'started': self._client is not None and not self._client.is_closed,
+            'http2': self.http2,
+            'max_connections': self.max_connections,
+            'max_keepalive_connections': self.max_keepalive_connections,
+            'keepalive_expiry': self.keepalive_expiry,
+            'requests_sent': self._requests_sent,
+            'connections': 0,
+            'idle': 0,
+            'active': 0,
+            'http2_connections': 0
+        }
+        
+        # httpcore 커넥션 풀은 공개 API 가 없어 transport 를 통해 조회
+        pool = getattr(getattr(self._client, '_transport', None), '_pool', None)
+        for connection in getattr(pool, 'connections', []):
+            stats['connections'] += 1
+            if connection.is_idle():
+                stats['idle'] += 1
+            else:
+                stats['active'] += 1
+            if 'HTTP/2' in connection.info():
+                stats['http2_connections'] += 1
+        
+        return stats
+    
+    def cache_stats(self) -> Dict:
+        """응답 캐시 통계 (히트/미스, 적중률, 크기)"""
+        return self.cache.stats()
+    
+    def coalesce_stats(self) -> Dict:
+        """요청 병합 통계 (실제 호출 수, 절약된 호출 수)"""
+        return self.single_flight.stats()
+    
+    def quota_stats(self) -> Dict:
+        """호출 한도 통계 (허용/거부 수, 일일 사용량)"""
+        return self.rate_limiter.stats()
+    
+    def remaining_quota(self, endpoint: str) -> int:
+        """엔드포인트의 오늘 남은 호출 수 (모든 인증 정보 합계)"""
+        bucket = ENDPOINT_BUCKETS[endpoint]
+        return sum(
+            self.rate_limiter.remaining(credential.client_id, bucket)
+            for credential in self.credentials.credentials
+        )
+    
+    def credential_stats(self) -> List[Dict]:
+        """인증 정보별 상태 (사용 가능 여부, 오류율, 남은 대기 시간)"""
+        return self.credentials.stats()
+    
+    def series_stats(self) -> Dict:
+        """데이터랩 시계열 저장소 통계 (전체/증분 조회, 저장소 응답 수)"""
+        return self.series_store.stats() if self.series_store is not None else {}
+    
+    def term_stats(self) -> Dict:
+        """블로그 역색인 통계 (색인 문서 수, 포스팅 수, 질의 수)"""
+        return self.term_index.stats() if self.term_index is not None else {}
+    
+    async def top_cooccurring_terms(self, query: str, days: int = 7, limit: int = 20) -> List[Dict]:
+        """최근 N일 블로그 결과에서 검색어와 함께 자주 등장한 단어 (API 호출 없음)
+        
+        Args:
+            query: 검색어
+            days: 최근 일수 (게시일 기준, KST)
+            limit: 반환할 단어 수
+        
+        Returns:
+            [{'term': 단어, 'count': 함께 등장한 문서 수, 'share': 비율}, ...]
+        """
+        if self.term_index is None:
+            return []
+        return await self.term_index.top_cooccurring(query, days=days, limit=limit)
+    
+    def spatial_stats(self) -> Dict:
+        """지역 결과 공간 색인 통계 (저장 장소 수, 셀 수, 질의 수)"""
+        return self.spatial_index.stats() if self.spatial_index is not None else {}
+    
+    def places_near(self, lat: float, lon: float, radius_m: float = 500, limit: Optional[int] = None) -> List[Dict]:
+        """저장된 장소 중 반경 내 장소 (가까운 순, API 호출 없음)
+        
+        Args:
+            lat, lon: 중심 좌표 (WGS84)
+            radius_m: 반경 (미터)
+            limit: 최대 결과 수
+        
+        Returns:
+            [{'key', 'lat', 'lon', 'distance', 'item'}, ...]
+        """
+        if self.spatial_index is None:
+            return []
+        return self.spatial_index.within_radius(lat, lon, radius_m, limit=limit)
+    
+    def places_in_bbox(self, south: float, west: float, north: float, east: float) -> List[Dict]:
+        """저장된 장소 중 영역 내 장소 (API 호출 없음)"""
+        if self.spatial_index is None:
+            return []
+        return self.spatial_index.within_bbox(south, west, north, east)
+    
+    def place_clusters(self, min_points: int = 5, cell_size_m: Optional[float] = None, bbox: Optional[Tuple] = None) -> List[Dict]:
+        """저장된 장소의 밀집 지역 (격자 밀도 군집, API 호출 없음)"""
+        if self.spatial_index is None:
+            return []
+        return self.spatial_index.clusters(min_points=min_points, cell_size_m=cell_size_m, bbox=bbox)
+    
+    def _index_response(self, endpoint: str, data: Dict) -> None:
+        """새로 받은 응답만 색인 (캐시나 병합된 요청으로 받은 결과는 이미 색인됨)"""
+        if endpoint == 'blog':
+            self._index_blog_items(data.get('items', []))
+        elif endpoint == 'local':
+            self._index_local_items(data.get('items', []))
+    
+    def _index_blog_items(self, items: List[Dict]) -> None:
+        """응답 경로를 막지 않도록 블로그 결과 색인을 백그라운드로 실행"""
+        if self.term_index is None or not items:
+            return
+        self._schedule_index(self.term_index.add_items(items))
+    
+    def _index_local_items(self, items: List[Dict]) -> None:
+        """지역 결과를 백그라운드로 공간 색인에 누적"""
+        if self.spatial_index is None or not items:
+            return
+        self._schedule_index(self.spatial_index.add_items(items))
+    
+    def _schedule_index(self, coroutine) -> None:
+        task = asyncio.create_task(coroutine)
+        self._index_tasks.add(task)
+        task.add_done_callback(self._index_done)
+    
+    def _index_done(self, task: asyncio.Task) -> None:
+        self._index_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"검색 결과 색인 실패 | {task.exception()}")
+    
+    def breaker_stats(self) -> Dict:
+        """엔드포인트별 서킷 브레이커 상태"""
+        return {endpoint: breaker.stats() for endpoint, breaker in self.breakers.items()}
+    
+    async def _fetch(
+        self,
+        endpoint: str,
+        method: str,
+        url: str,
+        params: Optional[Dict] = None,
+        json_body: Optional[Dict] = None,
+        idempotent: Optional[bool] = None
+    ) -> Dict:
+        """캐시와 요청 병합을 거쳐 API 호출
+        
+        Args:
+            endpoint: 캐시/통계용 엔드포인트 이름 ('blog', 'local', 'datalab')
+            method: HTTP 메서드
+            url: 요청 URL
+            params: 쿼리 파라미터
+            json_body: JSON 요청 본문
+            idempotent: 재시도 안전 여부 (기본: GET 만 안전)
+        
+        Returns:
+            응답 JSON (캐시 히트 시 공유 객체이므로 수정 금지)
+        """
+        if idempotent is None:
+            idempotent = method == 'GET'
+        
+        cache_key = self.cache.make_key(endpoint, json_body if json_body is not None else params)
+        cached = await self.cache.get(endpoint, cache_key)
+        if cached is not None:
+            logger.info(f"캐시 히트 | {endpoint}")
+            return cached
+        
+        try:
+            # 같은 요청이 진행 중이면 그 결과를 함께 기다림
+            return await self.single_flight.do(
+                cache_key,
+                lambda: self._send(endpoint, cache_key, method, url, params, json_body, idempotent)
+            )
+        except Exception as e:
+            if not self._is_degraded(e):
+                raise
+            # 네이버 장애/한도 초과 시 만료된 캐시라도 있으면 제공
+            stale = await self.cache.get_stale(endpoint, cache_key)
+            if stale is None:
+                raise
+            logger.warning(f"⚠️ 만료된 캐시 제공 | {endpoint} | {e}")
+            return stale
+    
+    @staticmethod
+    def _is_degraded(error: Exception) -> bool:
+        """업스트림 장애 또는 한도 초과로 인한 실패인지 확인"""
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code == 429 or error.response.status_code >= 500
+        return isinstance(error, (
+            httpx.TransportError,
+            CircuitOpenError,
+            RateLimitExceeded,
+            NoCredentialAvailable
+        ))
+    
+    async def _send(
+        self,
+        endpoint: str,
+        cache_key: str,
+        method: str,
+        url: str,
+        params: Optional[Dict],
+        json_body: Optional[Dict],
+        idempotent: bool
+    ) -> Dict:
+        """서킷 브레이커, 호출 한도, 재시도를 거쳐 실제 HTTP 요청, 응답을 캐시에 저장"""
+        bucket = ENDPOINT_BUCKETS[endpoint]
+        breaker = self.breakers[endpoint]
+        client = await self._get_client()
+        attempt = 0
+        
+        while True:
+            breaker.before_call()
+            
+            try:
+                # 429 후 재시도 시에는 다른 인증 정보가 선택됨
+                credential = self.credentials.select(bucket)
+                await self.rate_limiter.acquire(credential.client_id, bucket)
+            except BaseException:
+                breaker.release()
+                raise
+            
+            headers = credential.headers
+            if json_body is not None:
+                headers = {**headers, 'Content-Type': 'application/json'}
+            
+            retry_after = None
+            try:
+                response = await client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=json_body,
+                    timeout=self.timeouts[endpoint]
+                )
+            except httpx.TransportError as e:
+                breaker.record_failure()
+                if not self.retry_policy.should_retry_exception(e, attempt, idempotent):
+                    raise
+                logger.warning(f"재시도 {attempt + 1}/{self.retry_policy.max_retries} | {endpoint} | {type(e).__name__}")
+            except BaseException:
+                # 취소나 예상 밖 오류로 끝난 반개방 시험 요청이 차단기를 막지 않도록 해제
+                breaker.release()
+                raise
+            else:
+                status = response.status_code
+                if status < 400:
+                    breaker.record_success()
+                    self.credentials.report_success(credential)
+                    data = response.json()
+                    await self.cache.set(endpoint, cache_key, data)
+                    self._index_response(endpoint, data)
+                    return data
+                
+                if status >= 500:
+                    breaker.record_failure()
+                else:
+                    # 4xx 는 업스트림 장애가 아님
+                    breaker.release()
+                    # 인증 오류/한도 초과만 키 문제로 집계 (잘못된 검색어 등의 400 은 키와 무관)
+                    if status == RATE_LIMITED_STATUS or status in AUTH_FAILED_STATUSES:
+                        self.credentials.report_failure(credential, status)
+                
+                if not self.retry_policy.should_retry_status(status, attempt, idempotent):
+                    response.raise_for_status()
+                retry_after = response.headers.get('Retry-After')
+                logger.warning(f"재시도 {attempt + 1}/{self.retry_policy.max_retries} | {endpoint} | HTTP {status}")
+            
+            await asyncio.sleep(self.retry_policy.backoff(attempt, retry_after))
+            attempt += 1
     
     async def search_blog(
         self, 
         query: str, 
         display: int = 20, 
-        sort: str = 'sim'
+        sort: str = 'sim',
+        start: int = 1
     ) -> Dict:
         """블로그 검색
         
@@ -32,6 +590,7 @@ class NaverAPIService:
             query: 검색어
             display: 결과 수 (1-100)
             sort: 정렬 방식 ('sim' 또는 'date')
+            start: 검색 시작 위치 (1-1000)
         
         Returns:
             검색 결과 딕셔너리
@@ -40,23 +599,16 @@ class NaverAPIService:
         params = {
             'query': query,
             'display': display,
-            'sort': sort
+            'sort': sort,
+            'start': start
         }
         
         logger.info(f"블로그 검색 시작 - 검색어: '{query}'")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url, 
-                    headers=self.base_headers, 
-                    params=params
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                logger.info(f"✅ 블로그 검색 성공 | 검색어: '{query}' | 결과: {len(data.get('items', []))}건")
-                return data
+            data = await self._fetch('blog', 'GET', url, params=params)
+            logger.info(f"✅ 블로그 검색 성공 | 검색어: '{query}' | 결과: {len(data.get('items', []))}건")
+            return data
                 
         except httpx.HTTPStatusError as e:
             logger.error(f"❌ 블로그 API 오류 | 상태: {e.response.status_code} | {e}")
@@ -65,6 +617,82 @@ class NaverAPIService:
             logger.error(f"❌ 블로그 검색 오류 | {str(e)}")
             raise
     
+    async def search_blog_all(
+        self,
+        query: str,
+        max_items: int = 1000,
+        sort: str = 'sim',
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict]:
+        """블로그 다중 페이지 병렬 수집 (display 100건 제한 우회)
+        
+        첫 페이지로 전체 건수를 확인한 뒤 나머지 start 오프셋을 동시에 요청하고,
+        페이지가 도착하는 순서대로 link 기준 중복을 제거해 전달한다.
+        
+        Args:
+            query: 검색어
+            max_items: 최대 수집 건수 (API 한계상 최대 1099)
+            sort: 정렬 방식 ('sim' 또는 'date')
+            concurrency: 동시 요청 수 (기본: NAVER_BLOG_CRAWL_CONCURRENCY 또는 4)
+        
+        Yields:
+            {'start': 페이지 시작 위치, 'items': 새 항목, 'total': 전체 건수, 'collected': 누적 건수}
+        """
+        max_items = max(1, min(max_items, BLOG_MAX_START + BLOG_PAGE_SIZE - 1))
+        concurrency = concurrency or int(os.getenv('NAVER_BLOG_CRAWL_CONCURRENCY', '4'))
+        seen_links = set()
+        
+        def page(start: int, data: Dict) -> Dict:
+            items = []
+            for item in data.get('items', []):
+                link = item.get('link')
+                if link in seen_links:
+                    continue
+                seen_links.add(link)
+                items.append(item)
+            return {
+                'start': start,
+                'items': items,
+                'total': data.get('total', 0),
+                'collected': len(seen_links)
+            }
+        
+        # 첫 페이지로 전체 건수 확인
+        first = await self.search_blog(query, display=min(BLOG_PAGE_SIZE, max_items), sort=sort, start=1)
+        yield page(1, first)
+        
+        limit = min(max_items, first.get('total', 0))
+        offsets = list(range(1 + BLOG_PAGE_SIZE, min(limit, BLOG_MAX_START) + 1, BLOG_PAGE_SIZE))
+        if limit > BLOG_MAX_START:
+            # start 는 1000 까지만 허용되므로 1001 번째 이후는 start=1000 페이지로 수집 (1000 번째는 중복 제거)
+            offsets.append(BLOG_MAX_START)
+        if not offsets:
+            return
+        
+        logger.info(f"블로그 병렬 수집 | 검색어: '{query}' | 페이지: {len(offsets) + 1} | 동시 요청: {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(start: int) -> Tuple[int, Dict]:
+            async with semaphore:
+                display = min(BLOG_PAGE_SIZE, limit - start + 1)
+                return start, await self.search_blog(query, display=display, sort=sort, start=start)
+        
+        tasks = [asyncio.create_task(fetch(start)) for start in offsets]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                try:
+                    start, data = await next_page
+                except Exception as e:
+                    # 일부 페이지 실패는 건너뛰고 나머지 결과는 계속 전달
+                    logger.warning(f"⚠️ 블로그 페이지 수집 실패 | 검색어: '{query}' | {e}")
+                    continue
+                yield page(start, data)
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        logger.info(f"✅ 블로그 병렬 수집 완료 | 검색어: '{query}' | 결과: {len(seen_links)}건")
+    
     async def search_local(
         self,
         query: str,
@@ -91,17 +719,9 @@ class NaverAPIService:
         logger.info(f"지역 검색 시작 - 검색어: '{query}'")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    url,
-                    headers=self.base_headers,
-                    params=params
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                logger.info(f"✅ 지역 검색 성공 | 검색어: '{query}' | 결과: {len(data.get('items', []))}건")
-                return data
+            data = await self._fetch('local', 'GET', url, params=params)
+            logger.info(f"✅ 지역 검색 성공 | 검색어: '{query}' | 결과: {len(data.get('items', []))}건")
+            return data
                 
         except httpx.HTTPStatusError as e:
             logger.error(f"❌ 지역 API 오류 | 상태: {e.response.status_code}")
@@ -110,6 +730,105 @@ class NaverAPIService:
             logger.error(f"❌ 지역 검색 오류 | {str(e)}")
             raise
     
+    async def search_local_sweep(
+        self,
+        query: str,
+        areas: Optional[List[str]] = None,
+        modifiers: Optional[List[str]] = None,
+        concurrency: Optional[int] = None,
+        max_queries: Optional[int] = None
+    ) -> AsyncIterator[Dict]:
+        """지역 확장 검색 (요청당 5건 제한 우회)
+        
+        검색어를 세부 지역(앞에 붙임)과 세부 키워드(뒤에 붙임) 조합으로 나누고
+        정렬 방식별로 동시에 요청한 뒤, 응답이 도착하는 순서대로 주소/좌표 기준
+        중복을 제거해 전달한다. 각 요청은 search_local 을 거치므로 캐시, 호출 한도,
+        공간 색인이 그대로 적용된다.
+        
+        Args:
+            query: 기본 검색어 (예: '강남 맛집')
+            areas: 세부 지역 (기본: NAVER_LOCAL_SWEEP_AREAS, 쉼표 구분)
+            modifiers: 세부 키워드 (기본: NAVER_LOCAL_SWEEP_MODIFIERS 또는 LOCAL_SWEEP_MODIFIERS)
+            concurrency: 동시 요청 수 (기본: NAVER_LOCAL_SWEEP_CONCURRENCY 또는 4)
+            max_queries: 최대 요청 수 (기본: NAVER_LOCAL_SWEEP_MAX_QUERIES 또는 200, 남은 호출 수 이내)
+        
+        Yields:
+            {'query': 세부 검색어, 'items': 새 장소, 'collected': 누적 장소 수,
+             'completed': 완료 요청 수, 'queries': 전체 요청 수}
+        """
+        def env_list(name: str, default) -> List[str]:
+            value = os.getenv(name)
+            return [v.strip() for v in value.split(',') if v.strip()] if value is not None else list(default)
+        
+        areas = env_list('NAVER_LOCAL_SWEEP_AREAS', ()) if areas is None else areas
+        modifiers = env_list('NAVER_LOCAL_SWEEP_MODIFIERS', LOCAL_SWEEP_MODIFIERS) if modifiers is None else modifiers
+        concurrency = concurrency or int(os.getenv('NAVER_LOCAL_SWEEP_CONCURRENCY', '4'))
+        max_queries = max_queries or int(os.getenv('NAVER_LOCAL_SWEEP_MAX_QUERIES', '200'))
+        
+        # 기본 검색어 먼저, 이후 지역 x 키워드 조합
+        sub_queries = []
+        for area in [''] + list(areas):
+            for modifier in [''] + list(modifiers):
+                sub_query = ' '.join(part for part in (area, query, modifier) if part)
+                sub_queries.extend((sub_query, sort) for sort in LOCAL_SORTS)
+        sub_queries = sub_queries[:max(1, min(max_queries, self.remaining_quota('local')))]
+        
+        seen_keys = set()
+        seen_points = set()
+        completed = 0
+        
+        def new_places(items: List[Dict]) -> List[Dict]:
+            places = []
+            for item in items:
+                coordinates = to_wgs84(item.get('mapx'), item.get('mapy'))
+                key = place_key(item, coordinates)
+                # 주소 표기가 달라도 같은 이름이 약 10m 안에 있으면 같은 장소
+                point = f"{key.split('|')[0]}|{coordinates[0]:.4f},{coordinates[1]:.4f}" if coordinates else None
+                if key in seen_keys or (point and point in seen_points):
+                    continue
+                seen_keys.add(key)
+                if point:
+                    seen_points.add(point)
+                places.append(item)
+            return places
+        
+        logger.info(f"지역 확장 검색 | 검색어: '{query}' | 요청: {len(sub_queries)} | 동시 요청: {concurrency}")
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def fetch(sub_query: str, sort: str) -> Tuple[str, Dict]:
+            async with semaphore:
+                return sub_query, await self.search_local(sub_query, display=LOCAL_PAGE_SIZE, sort=sort)
+        
+        tasks = [asyncio.create_task(fetch(sub_query, sort)) for sub_query, sort in sub_queries]
+        succeeded = 0
+        error = None
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                completed += 1
+                try:
+                    sub_query, data = await next_result
+                except Exception as e:
+                    # 일부 요청 실패는 건너뛰고 나머지 결과는 계속 전달
+                    logger.warning(f"⚠️ 지역 확장 검색 요청 실패 | 검색어: '{query}' | {e}")
+                    error = e
+                    continue
+                succeeded += 1
+                yield {
+                    'query': sub_query,
+                    'items': new_places(data.get('items', [])),
+                    'collected': len(seen_keys),
+                    'completed': completed,
+                    'queries': len(sub_queries)
+                }
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        # 전부 실패하면 단일 검색과 같은 오류로 알림
+        if not succeeded and error is not None:
+            raise error
+        logger.info(f"✅ 지역 확장 검색 완료 | 검색어: '{query}' | 결과: {len(seen_keys)}건")
+    
     async def search_datalab(
         self,
         start_date: str,
@@ -118,9 +837,14 @@ class NaverAPIService:
         keyword_groups: List[Dict],
         device: Optional[str] = None,
         gender: Optional[str] = None,
-        ages: Optional[List[str]] = None
+        ages: Optional[List[str]] = None,
+        anchor_index: int = 0
     ) -> Dict:
-        """데이터랩 트렌드 검색"""
+        """데이터랩 트렌드 검색
+        
+        그룹이 5개를 넘으면 기준 그룹(anchor_index)과 나머지 4개씩으로 나눈 요청을
+        동시에 보내고, 기준 그룹 비율로 척도를 맞춰 하나의 결과로 병합한다.
+        """
         url = 'https://openapi.naver.com/v1/datalab/search'
         
         # 날짜 포맷 변환 (YYYY-MM-DD -> YYYY-MM-DD 유지)
@@ -139,23 +863,18 @@ class NaverAPIService:
         if ages:
             request_body['ages'] = ages
         
+        if len(keyword_groups) > DATALAB_MAX_TOTAL_GROUPS:
+            raise Exception(f"분석 실패: 키워드 그룹은 최대 {DATALAB_MAX_TOTAL_GROUPS}개까지 가능합니다")
+        
         logger.info(f"데이터랩 분석 | 그룹: {len(keyword_groups)}, 연령: {ages}")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    url,
-                    headers={
-                        **self.base_headers,
-                        'Content-Type': 'application/json'
-                    },
-                    json=request_body
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                logger.info(f"✅ 데이터랩 성공 | 결과: {len(data.get('results', []))}개")
-                return data
+            if self.series_store is not None:
+                data = await self._search_datalab_stored(url, request_body, anchor_index)
+            else:
+                data = await self._fetch_datalab(url, request_body, anchor_index)
+            logger.info(f"✅ 데이터랩 성공 | 결과: {len(data.get('results', []))}개")
+            return data
                 
         except httpx.HTTPStatusError as e:
             error_data = e.response.json() if e.response.text else {}
@@ -166,5 +885,108 @@ class NaverAPIService:
             logger.error(f"❌ 데이터랩 오류 | {str(e)}")
             raise
 
+    async def _fetch_datalab(self, url: str, request_body: Dict, anchor_index: int) -> Dict:
+        """그룹 수에 따라 단일 요청 또는 샤드 요청"""
+        if len(request_body['keywordGroups']) > DATALAB_MAX_GROUPS:
+            return await self._search_datalab_sharded(url, request_body, anchor_index)
+        # 데이터랩 POST 는 조회 전용이므로 재시도해도 안전
+        return await self._fetch('datalab', 'POST', url, json_body=request_body, idempotent=True)
+    
+    async def _search_datalab_stored(self, url: str, request_body: Dict, anchor_index: int) -> Dict:
+        """저장된 시계열을 활용해 빠진 최근 구간만 조회
+        
+        과거 구간은 변하지 않으므로, 저장된 마지막 구간 몇 개와 겹치도록 최근 구간만
+        받아 척도를 맞춘 뒤 이어 붙이고, 요청 기간만 잘라 응답 형식으로 돌려준다.
+        """
+        store = self.series_store
+        key = store.make_key(request_body)
+        start, end = request_body['startDate'], request_body['endDate']
+        today = datetime.now(KST).date().isoformat()
+        
+        stored = await store.load(key)
+        if stored is None or stored['fetched_start'] is None or stored['fetched_start'] > start:
+            # 처음 조회하거나 저장된 범위보다 과거가 필요하면 전체 조회
+            # (검색량이 없는 앞 구간은 응답에서 빠지므로 첫 구간이 아닌 요청 시작일로 비교)
+            return await self._fetch_datalab_series(url, request_body, anchor_index, key, today)
+        
+        # end 가 속한 구간이 끝나고 집계가 반영된 뒤에 받아 둔 기간이면 API 호출 없이 응답
+        # (그 전에 받은 마지막 구간은 비어 있거나 일부만 집계되어 있을 수 있음)
+        time_unit = request_body['timeUnit']
+        fetched_on = stored['fetched_on']
+        if stored['fetched_end'] >= end and fetched_on is not None and fetched_on > _period_settled(end, time_unit):
+            store.record('served_from_store')
+            return series_to_response(stored, start, end, {'timeUnit': time_unit})
+        
+        # 척도는 저장 당시 이미 집계가 끝난 구간으로만 맞춤 (일부만 집계된 꼬리는 제외)
+        settled_tail = [
+            period for period in stored['periods']
+            if period <= end and fetched_on is not None and fetched_on > _period_settled(period, time_unit)
+        ]
+        if not settled_tail:
+            # 척도를 맞출 구간이 없으면 전체 조회
+            return await self._fetch_datalab_series(url, request_body, anchor_index, key, today)
+        
+        overlap_start = settled_tail[-DATALAB_OVERLAP_PERIODS] if len(settled_tail) >= DATALAB_OVERLAP_PERIODS else settled_tail[0]
+        logger.info(f"데이터랩 증분 조회 | {overlap_start} ~ {end} (저장: {stored['periods'][0]} ~ {stored['periods'][-1]})")
+        
+        fresh = await self._fetch_datalab(url, {**request_body, 'startDate': overlap_start}, anchor_index)
+        combined = splice_series(stored, series_from_response(fresh), settled_until=settled_tail[-1])
+        # 이번 조회가 확인한 범위와 날짜만 기록 (end 이후에 남은 저장 구간은 다음 조회 때 다시 받음)
+        await store.save(key, combined, stored['fetched_start'], end, today)
+        store.record('incremental_fetches')
+        return series_to_response(combined, start, end, fresh)
+    
+    async def _fetch_datalab_series(self, url: str, request_body: Dict, anchor_index: int, key: str, today: str) -> Dict:
+        """요청 기간 전체를 조회해 저장된 시계열을 교체"""
+        data = await self._fetch_datalab(url, request_body, anchor_index)
+        await self.series_store.save(key, series_from_response(data), request_body['startDate'], request_body['endDate'], today)
+        self.series_store.record('full_fetches')
+        return data
+    
+    async def _search_datalab_sharded(
+        self,
+        url: str,
+        request_body: Dict,
+        anchor_index: int,
+        reanchor: bool = True
+    ) -> Dict:
+        """기준 그룹을 공유하는 5개 단위 샤드로 나눠 동시에 요청 후 병합
+        
+        기준 그룹 검색량이 0 인 샤드가 있으면 첫 샤드에서 검색량이 가장 많은
+        그룹을 기준으로 한 번 다시 나눠 요청한다.
+        """
+        groups = request_body['keywordGroups']
+        anchor = groups[anchor_index]
+        others = groups[:anchor_index] + groups[anchor_index + 1:]
+        per_shard = DATALAB_MAX_GROUPS - 1
+        shards = [others[i:i + per_shard] for i in range(0, len(others), per_shard)]
+        
+        logger.info(f"데이터랩 샤드 분할 | 그룹: {len(groups)} | 샤드: {len(shards)} | 기준: '{anchor['groupName']}'")
+        
+        responses = await asyncio.gather(*[
+            self._fetch(
+                'datalab',
+                'POST',
+                url,
+                json_body={**request_body, 'keywordGroups': [anchor, *shard]},
+                idempotent=True
+            )
+            for shard in shards
+        ])
+        
+        if reanchor and not all(_ratio_sum(response['results'][0]) > 0 for response in responses):
+            # 첫 샤드의 결과 순서는 [기준 그룹, *shards[0]]
+            volumes = [_ratio_sum(result) for result in responses[0]['results'][1:]]
+            best = max(range(len(volumes)), key=volumes.__getitem__)
+            if volumes[best] > 0:
+                new_anchor = groups.index(shards[0][best])
+                logger.warning(
+                    f"⚠️ 데이터랩 기준 그룹 '{anchor['groupName']}' 검색량이 0 | "
+                    f"'{groups[new_anchor]['groupName']}' 기준으로 다시 요청"
+                )
+                return await self._search_datalab_sharded(url, request_body, new_anchor, reanchor=False)
+        
+        return _merge_datalab_shards(responses, anchor_index)
+
 # 싱글톤 인스턴스
 naver_api = NaverAPIService()
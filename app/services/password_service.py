@@ -0,0 +1,136 @@
+"""
+Password Service Module
+
+Runs password hashing and verification off the event loop. scrypt releases
+the GIL, so a small thread pool gives real parallelism, while a semaphore
+caps how many hashes (16 MiB each at the default cost) run at once.
+
+Benchmark logins/sec at the configured cost: python -m services.password_service
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from db.database import (
+    SCRYPT_N,
+    SCRYPT_P,
+    SCRYPT_R,
+    hash_password,
+    needs_rehash,
+    verify_password
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordService:
+    """Bounded worker pool for the password KDF"""
+
+    def __init__(self, max_workers: Optional[int] = None, max_concurrency: Optional[int] = None):
+        """
+        Args:
+            max_workers: Threads running the KDF (default: CPU count)
+            max_concurrency: Hashes allowed in flight, queued or running (default: 4 x workers)
+        """
+        self.max_workers = max_workers or int(os.getenv('PASSWORD_HASH_WORKERS', str(os.cpu_count() or 1)))
+        self.max_concurrency = max_concurrency or int(os.getenv('PASSWORD_HASH_CONCURRENCY', str(self.max_workers * 4)))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stats = {
+            'hashes': 0,
+            'verifications': 0,
+            'rehashes': 0,
+            'waiting': 0
+        }
+
+    async def hash(self, password: str) -> str:
+        """Hash a password with the current KDF parameters"""
+        self._stats['hashes'] += 1
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and upgrade outdated hashes
+
+        Returns:
+            (valid, new_hash) where new_hash is set if the stored hash is legacy
+            SHA-256 or uses older cost parameters and should be replaced
+        """
+        self._stats['verifications'] += 1
+        if not await self._run(verify_password, password, hashed):
+            return False, None
+        if not needs_rehash(hashed):
+            return True, None
+
+        self._stats['rehashes'] += 1
+        return True, await self.hash(password)
+
+    async def benchmark(self, seconds: float = 3.0) -> Dict:
+        """
+        Measure verifications per second at the current cost parameters
+
+        Keeps max_concurrency verifications in flight for the given duration.
+        """
+        hashed = await self.hash('benchmark-password')
+        deadline = time.perf_counter() + seconds
+        completed = 0
+
+        async def worker():
+            nonlocal completed
+            while time.perf_counter() < deadline:
+                await self._run(verify_password, 'benchmark-password', hashed)
+                completed += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrency)))
+        elapsed = time.perf_counter() - started
+
+        return {
+            'params': {'n': SCRYPT_N, 'r': SCRYPT_R, 'p': SCRYPT_P},
+            'workers': self.max_workers,
+            'concurrency': self.max_concurrency,
+            'verifications': completed,
+            'seconds': round(elapsed, 3),
+            'logins_per_second': round(completed / elapsed, 1) if elapsed else 0.0
+        }
+
+    def stats(self) -> Dict:
+        return {**self._stats, 'workers': self.max_workers, 'concurrency': self.max_concurrency}
+
+    def close(self) -> None:
+        """Stop the worker pool (called on app shutdown)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _run(self, func, *args):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='kdf')
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        self._stats['waiting'] += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._stats['waiting'] -= 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._semaphore.release()
+
+
+# Shared instance
+password_service = PasswordService()
+
+
+if __name__ == '__main__':
+    result = asyncio.run(password_service.benchmark())
+    password_service.close()
+    print(f"scrypt N={SCRYPT_N} r={SCRYPT_R} p={SCRYPT_P}: "
+          f"{result['logins_per_second']} logins/sec "
+          f"({result['verifications']} in {result['seconds']}s, {result['workers']} workers)")
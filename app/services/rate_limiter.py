@@ -0,0 +1,256 @@
+"""
+Rate Limiter Module
+
+Client-side throttling for the Naver Open API: a token bucket per
+(credential, bucket) pair for the per-second limit, plus a daily call
+quota that is persisted to SQLite so usage survives restarts.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Naver quotas reset at midnight KST
+KST = timezone(timedelta(hours=9))
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a call cannot be admitted within the wait budget or quota"""
+
+
+def _today() -> str:
+    """Current quota day (KST) as YYYY-MM-DD"""
+    return datetime.now(KST).date().isoformat()
+
+
+class TokenBucket:
+    """Token bucket with FIFO waiters and a bounded wait time"""
+
+    def __init__(self, rate: float, capacity: float):
+        """
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waiting = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, max_wait: float) -> float:
+        """
+        Take one token, waiting at most max_wait seconds in total
+
+        The token is reserved under the lock and the wait happens outside it,
+        so callers are served in reservation order and the lock is never held
+        across a sleep.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            RateLimitExceeded: If no token is available within max_wait
+        """
+        started = time.monotonic()
+        self.waiting += 1
+        try:
+            async with self._lock:
+                self._refill()
+                delay = max(0.0, (1 - self._tokens) / self.rate)
+                if delay > max_wait:
+                    raise RateLimitExceeded(f"요청 대기 시간 초과 ({max_wait:.1f}초)")
+                # tokens may go negative; later callers then wait behind this reservation
+                self._tokens -= 1
+            if delay:
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    # hand the unused reservation back
+                    self._tokens += 1
+                    raise
+        finally:
+            self.waiting -= 1
+
+        return time.monotonic() - started
+
+
+class RateLimiter:
+    """Per-second and daily limits for each (scope, bucket) pair"""
+
+    def __init__(
+        self,
+        limits: Dict[str, Tuple[float, float, int]],
+        max_wait: float = 5.0,
+        db_path: Optional[Union[str, Path]] = None,
+        flush_interval: float = 5.0
+    ):
+        """
+        Args:
+            limits: bucket name -> (calls per second, burst, calls per day)
+            max_wait: Maximum seconds a call may queue for a token
+            db_path: Optional SQLite file for persistent daily usage
+            flush_interval: Minimum seconds between usage writes to disk
+        """
+        self.limits = dict(limits)
+        self.max_wait = max_wait
+        self.db_path = Path(db_path) if db_path else None
+        self.flush_interval = flush_interval
+
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._day = _today()
+        self._used: Dict[Tuple[str, str], int] = {}
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._stats = {
+            'admitted': 0,
+            'rejected': 0,
+            'wait_seconds': 0.0
+        }
+
+        if self.db_path:
+            self._open_db()
+
+    async def acquire(self, scope: str, bucket: str) -> None:
+        """
+        Admit one call for a credential scope and bucket
+
+        Args:
+            scope: Credential identifier (client ID)
+            bucket: Limit bucket name ('search', 'datalab')
+
+        Raises:
+            RateLimitExceeded: If the daily quota is used up or the wait is too long
+        """
+        rate, burst, daily = self.limits[bucket]
+        key = (scope, bucket)
+
+        self._roll_day()
+        if self._used.get(key, 0) >= daily:
+            self._stats['rejected'] += 1
+            raise RateLimitExceeded(f"일일 호출 한도 초과 ({bucket}: {daily}회)")
+
+        token_bucket = self._buckets.get(key)
+        if token_bucket is None:
+            token_bucket = self._buckets[key] = TokenBucket(rate, burst)
+
+        try:
+            waited = await token_bucket.acquire(self.max_wait)
+        except RateLimitExceeded:
+            self._stats['rejected'] += 1
+            raise
+
+        self._roll_day()
+        self._used[key] = self._used.get(key, 0) + 1
+        self._dirty = True
+        self._stats['admitted'] += 1
+        self._stats['wait_seconds'] += waited
+
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            await self.flush()
+
+    def remaining(self, scope: str, bucket: str) -> int:
+        """Remaining daily calls for a scope and bucket"""
+        self._roll_day()
+        return max(0, self.limits[bucket][2] - self._used.get((scope, bucket), 0))
+
+    def waiting(self, scope: str, bucket: str) -> int:
+        """Number of calls currently queued for a scope and bucket"""
+        token_bucket = self._buckets.get((scope, bucket))
+        return token_bucket.waiting if token_bucket else 0
+
+    def stats(self) -> Dict:
+        """
+        Get limiter statistics
+
+        Returns:
+            Dict with admitted/rejected counters and per-scope daily usage
+        """
+        self._roll_day()
+        usage = {}
+        for (scope, bucket), used in self._used.items():
+            usage[f"{scope[:4]}***:{bucket}"] = {
+                'used': used,
+                'remaining': self.remaining(scope, bucket),
+                'waiting': self.waiting(scope, bucket)
+            }
+        return {
+            **self._stats,
+            'day': self._day,
+            'usage': usage
+        }
+
+    async def flush(self) -> None:
+        """Persist today's usage counters"""
+        self._last_flush = time.monotonic()
+        if self._db is None or not self._dirty:
+            return
+        self._dirty = False
+        await asyncio.to_thread(self._db_write, self._usage_rows())
+
+    def close(self) -> None:
+        """Write pending usage and close the SQLite backend"""
+        if self._dirty:
+            self._dirty = False
+            self._db_write(self._usage_rows())
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _usage_rows(self) -> list:
+        return [(scope, bucket, self._day, used) for (scope, bucket), used in self._used.items()]
+
+    def _roll_day(self) -> None:
+        """Reset counters when the KST day changes"""
+        today = _today()
+        if today != self._day:
+            self._day = today
+            self._used.clear()
+            self._dirty = False
+
+    def _open_db(self) -> None:
+        """Open the SQLite backend and load today's usage"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS api_quota (
+                scope TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                day TEXT NOT NULL,
+                used INTEGER NOT NULL,
+                PRIMARY KEY (scope, bucket, day)
+            )
+        ''')
+        self._db.execute('DELETE FROM api_quota WHERE day < ?', (self._day,))
+        self._db.commit()
+        for scope, bucket, used in self._db.execute(
+            'SELECT scope, bucket, used FROM api_quota WHERE day = ?', (self._day,)
+        ):
+            self._used[(scope, bucket)] = used
+        logger.info(f"Quota store opened: {self.db_path} ({len(self._used)} counters)")
+
+    def _db_write(self, rows: list) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            self._db.executemany(
+                'INSERT OR REPLACE INTO api_quota (scope, bucket, day, used) VALUES (?, ?, ?, ?)',
+                rows
+            )
+            self._db.commit()
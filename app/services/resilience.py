@@ -0,0 +1,152 @@
+"""
+Resilience Module
+
+Retry policy with bounded exponential backoff and full jitter, plus a
+circuit breaker that fails fast while an upstream is degraded.
+"""
+
+import logging
+import random
+import time
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Errors raised before the request reached the server; safe to retry for any method
+NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+
+
+class CircuitOpenError(Exception):
+    """Raised when the circuit breaker rejects a call"""
+
+
+class RetryPolicy:
+    """Bounded exponential backoff with full jitter"""
+
+    def __init__(self, max_retries: int = 3, base_delay: float = 0.2, max_delay: float = 5.0):
+        """
+        Args:
+            max_retries: Retries after the first attempt
+            base_delay: Backoff ceiling for the first retry in seconds
+            max_delay: Upper bound for any single backoff
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry_exception(self, exc: Exception, attempt: int, idempotent: bool) -> bool:
+        """
+        Decide whether a transport error is worth another attempt
+
+        Non-idempotent requests are only retried if they never reached the server.
+        """
+        if attempt >= self.max_retries or not isinstance(exc, httpx.TransportError):
+            return False
+        return idempotent or isinstance(exc, NOT_SENT_ERRORS)
+
+    def should_retry_status(self, status_code: int, attempt: int, idempotent: bool) -> bool:
+        """Decide whether an HTTP status is worth another attempt"""
+        if attempt >= self.max_retries or status_code not in RETRYABLE_STATUSES:
+            return False
+        # 429 is rejected before processing, so it is safe even for non-idempotent calls
+        return idempotent or status_code == 429
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Delay before the next attempt
+
+        Args:
+            attempt: Zero-based number of the attempt that just failed
+            retry_after: Optional Retry-After header value (seconds)
+
+        Returns:
+            Seconds to sleep
+        """
+        if retry_after:
+            try:
+                return min(self.max_delay, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        ceiling = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open probe -> closed"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, failure_threshold: int = 5, recovery_timeout: float = 30.0):
+        """
+        Args:
+            name: Name used in logs and errors
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds to stay open before allowing a probe
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._stats = {
+            'rejected': 0,
+            'opened': 0
+        }
+
+    def before_call(self) -> None:
+        """
+        Admit or reject a call
+
+        Raises:
+            CircuitOpenError: While open, or while a half-open probe is running
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.recovery_timeout:
+                self._reject()
+            self.state = self.HALF_OPEN
+            self._probing = False
+
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                self._reject()
+            self._probing = True
+
+    def record_success(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit '{self.name}' closed")
+        self.state = self.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self._stats['opened'] += 1
+                logger.warning(f"Circuit '{self.name}' opened after {self._failures} failures")
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+    def release(self) -> None:
+        """End a half-open probe that finished without a verdict (a 4xx, cancellation or unexpected error)"""
+        self._probing = False
+
+    def stats(self) -> Dict:
+        return {
+            **self._stats,
+            'state': self.state,
+            'consecutive_failures': self._failures
+        }
+
+    def _reject(self) -> None:
+        self._stats['rejected'] += 1
+        raise CircuitOpenError(f"네이버 API 일시 장애로 요청을 중단했습니다 ({self.name}), 잠시 후 다시 시도해주세요")
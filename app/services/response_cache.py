@@ -0,0 +1,241 @@
+"""
+Response Cache Module
+
+TTL + LRU cache for Naver Open API responses. Entries are keyed on a
+canonicalized request (endpoint + sorted JSON of the request parameters),
+kept in a bounded in-memory LRU and optionally mirrored to SQLite so warm
+entries survive restarts. Expired rows are purged when the store opens
+and then at most once per prune interval, on write.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """Bounded TTL/LRU cache with an optional persistent SQLite backend"""
+
+    def __init__(
+        self,
+        ttls: Dict[str, float],
+        max_entries: int = 1000,
+        db_path: Optional[Union[str, Path]] = None,
+        stale_ttl: float = 0.0,
+        prune_interval: float = 600.0
+    ):
+        """
+        Args:
+            ttls: TTL in seconds per endpoint (0 or missing = not cached)
+            max_entries: Maximum number of entries kept in memory
+            db_path: Optional SQLite file for persistent entries
+            stale_ttl: How long expired entries stay available to get_stale()
+            prune_interval: Minimum seconds between purges of expired SQLite rows
+        """
+        self.ttls = dict(ttls)
+        self.max_entries = max_entries
+        self.stale_ttl = stale_ttl
+        self.prune_interval = prune_interval
+        self.db_path = Path(db_path) if db_path else None
+
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        self._last_prune = 0.0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'disk_hits': 0,
+            'evictions': 0,
+            'expired': 0,
+            'stale_hits': 0,
+            'pruned': 0
+        }
+
+        if self.db_path:
+            self._open_db()
+
+    @staticmethod
+    def make_key(endpoint: str, payload: Dict) -> str:
+        """
+        Build a canonical cache key for a request
+
+        Args:
+            endpoint: Logical endpoint name ('blog', 'local', 'datalab')
+            payload: Query parameters or JSON request body
+
+        Returns:
+            Stable key string independent of dict ordering and whitespace
+        """
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return f"{endpoint}:{canonical}"
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        """Check if the endpoint has a positive TTL"""
+        return self.ttls.get(endpoint, 0) > 0
+
+    async def get(self, endpoint: str, key: str) -> Optional[Any]:
+        """
+        Look up a cached response
+
+        Returns:
+            Cached value, or None on miss/expiry. Treat it as read-only.
+        """
+        if not self.is_cacheable(endpoint):
+            return None
+
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > now:
+                self._entries.move_to_end(key)
+                self._stats['hits'] += 1
+                return value
+            # expired entries are kept for get_stale() until the stale window passes
+            if expires_at + self.stale_ttl <= now:
+                del self._entries[key]
+            self._stats['expired'] += 1
+
+        if self._db is not None:
+            row = await asyncio.to_thread(self._db_get, key)
+            if row is not None and row[0] > now:
+                value = json.loads(row[1])
+                self._remember(key, row[0], value)
+                self._stats['hits'] += 1
+                self._stats['disk_hits'] += 1
+                return value
+
+        self._stats['misses'] += 1
+        return None
+
+    async def get_stale(self, endpoint: str, key: str) -> Optional[Any]:
+        """
+        Look up a response even if its TTL has passed (within stale_ttl)
+
+        Used as a fallback while the upstream is degraded.
+        """
+        if not self.is_cacheable(endpoint):
+            return None
+
+        now = time.time()
+        entry = self._entries.get(key)
+        if entry is None and self._db is not None:
+            row = await asyncio.to_thread(self._db_get, key)
+            if row is not None:
+                entry = (row[0], json.loads(row[1]))
+
+        if entry is None or entry[0] + self.stale_ttl <= now:
+            return None
+
+        self._stats['stale_hits'] += 1
+        return entry[1]
+
+    async def set(self, endpoint: str, key: str, value: Any) -> None:
+        """Store a response with the endpoint's TTL"""
+        if not self.is_cacheable(endpoint):
+            return
+
+        expires_at = time.time() + self.ttls[endpoint]
+        self._remember(key, expires_at, value)
+
+        if self._db is not None:
+            await asyncio.to_thread(
+                self._db_set, key, endpoint, expires_at, json.dumps(value, ensure_ascii=False)
+            )
+
+    async def clear(self) -> None:
+        """Drop all entries from memory and disk"""
+        self._entries.clear()
+        if self._db is not None:
+            await asyncio.to_thread(self._db_execute, 'DELETE FROM response_cache')
+
+    def stats(self) -> Dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hit/miss counters, hit rate and current size
+        """
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'size': len(self._entries),
+            'max_entries': self.max_entries,
+            'persistent': self._db is not None
+        }
+
+    def close(self) -> None:
+        """Close the SQLite backend"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entries"""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats['evictions'] += 1
+
+    def _open_db(self) -> None:
+        """Open the SQLite backend and purge expired rows"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS response_cache (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                value TEXT NOT NULL
+            )
+        ''')
+        self._db.execute('CREATE INDEX IF NOT EXISTS idx_response_cache_expires ON response_cache (expires_at)')
+        self._db.commit()
+        self._db_prune()
+        logger.info(f"Response cache backend opened: {self.db_path}")
+
+    def _db_get(self, key: str) -> Optional[Tuple[float, str]]:
+        with self._db_lock:
+            if self._db is None:
+                return None
+            return self._db.execute(
+                'SELECT expires_at, value FROM response_cache WHERE key = ?', (key,)
+            ).fetchone()
+
+    def _db_set(self, key: str, endpoint: str, expires_at: float, value: str) -> None:
+        self._db_execute(
+            'INSERT OR REPLACE INTO response_cache (key, endpoint, expires_at, value) VALUES (?, ?, ?, ?)',
+            (key, endpoint, expires_at, value)
+        )
+        # long-running servers would otherwise keep every expired row
+        if time.time() - self._last_prune >= self.prune_interval:
+            self._db_prune()
+
+    def _db_prune(self) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            now = time.time()
+            cursor = self._db.execute('DELETE FROM response_cache WHERE expires_at <= ?', (now - self.stale_ttl,))
+            self._db.commit()
+            self._last_prune = now
+            self._stats['pruned'] += cursor.rowcount
+
+    def _db_execute(self, sql: str, params: tuple = ()) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            self._db.execute(sql, params)
+            self._db.commit()
@@ -0,0 +1,286 @@
+"""
+Series Store Module
+
+Local time-series store for DataLab results. Each analysis (keyword groups,
+filters and timeUnit) is stored as one row of packed columns: period day
+ordinals (int32) and per-group ratios (float32). Stored series can be
+extended with only the missing recent periods; the fresh window overlaps
+the stored tail so both can be brought onto one ratio scale.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from array import array
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Request fields that identify a series (dates are excluded on purpose)
+SERIES_KEY_FIELDS = ('keywordGroups', 'timeUnit', 'device', 'gender', 'ages')
+
+
+def series_from_response(data: Dict) -> Dict:
+    """
+    Convert a DataLab response into column form
+
+    Returns:
+        Dict with sorted 'periods', 'groups' metadata and 'ratios' per group
+        (periods missing from a group are filled with 0)
+    """
+    results = data.get('results', [])
+    periods = sorted({item['period'] for result in results for item in result['data']})
+    index = {period: i for i, period in enumerate(periods)}
+
+    ratios = []
+    for result in results:
+        column = [0.0] * len(periods)
+        for item in result['data']:
+            column[index[item['period']]] = item['ratio']
+        ratios.append(column)
+
+    return {
+        'periods': periods,
+        'groups': [{'title': result['title'], 'keywords': result['keywords']} for result in results],
+        'ratios': ratios
+    }
+
+
+def splice_series(stored: Dict, fresh: Dict, settled_until: Optional[str] = None) -> Dict:
+    """
+    Append a fresh window onto a stored series
+
+    The fresh window must overlap the stored range. Ratios in both are
+    normalised independently, so the fresh window is rescaled by the ratio of
+    the summed overlapping values before the stored tail is replaced.
+
+    Args:
+        stored: Column-form series already stored
+        fresh: Column-form series from the new fetch
+        settled_until: Last stored period that was complete when it was
+            fetched; later stored periods may be partial and are left out of
+            the rescale factor (default: all overlapping periods count)
+
+    Returns:
+        Combined series renormalised so its maximum is 100
+    """
+    if not fresh['periods']:
+        return stored
+
+    fresh_start = fresh['periods'][0]
+    fresh_index = {period: i for i, period in enumerate(fresh['periods'])}
+    overlap = [
+        (i, fresh_index[p]) for i, p in enumerate(stored['periods'])
+        if p in fresh_index and (settled_until is None or p <= settled_until)
+    ]
+
+    stored_sum = sum(column[i] for column in stored['ratios'] for i, _ in overlap)
+    fresh_sum = sum(column[j] for column in fresh['ratios'] for _, j in overlap)
+    factor = stored_sum / fresh_sum if stored_sum > 0 and fresh_sum > 0 else 1.0
+
+    fresh_end = fresh['periods'][-1]
+    before = [i for i, period in enumerate(stored['periods']) if period < fresh_start]
+    after = [i for i, period in enumerate(stored['periods']) if period > fresh_end]
+    periods = [stored['periods'][i] for i in before] + fresh['periods'] + [stored['periods'][i] for i in after]
+    ratios = [
+        [old[i] for i in before] + [value * factor for value in new] + [old[i] for i in after]
+        for old, new in zip(stored['ratios'], fresh['ratios'])
+    ]
+
+    return {
+        'periods': periods,
+        'groups': fresh['groups'],
+        'ratios': _normalise(ratios)
+    }
+
+
+def series_to_response(series: Dict, start_date: str, end_date: str, base: Dict) -> Dict:
+    """
+    Slice a series to a date range and render it as a DataLab response
+
+    Args:
+        series: Column-form series
+        start_date: First period to include (YYYY-MM-DD)
+        end_date: Last day to include (YYYY-MM-DD)
+        base: Response whose top-level fields (timeUnit etc.) are reused
+
+    Returns:
+        Response dict with ratios renormalised to the sliced range
+    """
+    selected = [i for i, period in enumerate(series['periods']) if start_date <= period <= end_date]
+    ratios = _normalise([[column[i] for i in selected] for column in series['ratios']])
+
+    return {
+        **{key: value for key, value in base.items() if key != 'results'},
+        'startDate': start_date,
+        'endDate': end_date,
+        'results': [{
+            **group,
+            'data': [
+                {'period': series['periods'][i], 'ratio': round(column[pos], 5)}
+                for pos, i in enumerate(selected)
+            ]
+        } for group, column in zip(series['groups'], ratios)]
+    }
+
+
+def _normalise(ratios: List[List[float]]) -> List[List[float]]:
+    peak = max((value for column in ratios for value in column), default=0)
+    if peak <= 0:
+        return ratios
+    return [[value * 100 / peak for value in column] for column in ratios]
+
+
+class DataLabSeriesStore:
+    """SQLite-backed store of packed DataLab series"""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Args:
+            db_path: SQLite file for stored series
+        """
+        self.db_path = Path(db_path)
+        self._db_lock = threading.Lock()
+        self._stats = {
+            'loads': 0,
+            'saves': 0,
+            'full_fetches': 0,
+            'incremental_fetches': 0,
+            'served_from_store': 0
+        }
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS datalab_series (
+                key TEXT PRIMARY KEY,
+                groups TEXT NOT NULL,
+                periods BLOB NOT NULL,
+                ratios BLOB NOT NULL,
+                fetched_start TEXT NOT NULL DEFAULT '',
+                fetched_end TEXT NOT NULL,
+                fetched_on TEXT NOT NULL DEFAULT '',
+                updated_at REAL NOT NULL
+            )
+        ''')
+        # stores created before fetched_on/fetched_start existed; '' means unknown
+        columns = {row[1] for row in self._db.execute('PRAGMA table_info(datalab_series)')}
+        if 'fetched_on' not in columns:
+            self._db.execute("ALTER TABLE datalab_series ADD COLUMN fetched_on TEXT NOT NULL DEFAULT ''")
+        if 'fetched_start' not in columns:
+            self._db.execute("ALTER TABLE datalab_series ADD COLUMN fetched_start TEXT NOT NULL DEFAULT ''")
+        self._db.commit()
+
+    @staticmethod
+    def make_key(request_body: Dict) -> str:
+        """Canonical key of a DataLab request without its date range"""
+        identity = {field: request_body.get(field) for field in SERIES_KEY_FIELDS}
+        return json.dumps(identity, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+    def record(self, event: str) -> None:
+        """Count a fetch decision ('full_fetches', 'incremental_fetches', 'served_from_store')"""
+        self._stats[event] += 1
+
+    async def load(self, key: str) -> Optional[Dict]:
+        """
+        Load a stored series
+
+        Returns:
+            Column-form series plus 'fetched_start' (first stored period if
+            unknown), 'fetched_end' and 'fetched_on' (None if unknown), or
+            None if not stored
+        """
+        row = await asyncio.to_thread(self._db_get, key)
+        if row is None:
+            return None
+
+        self._stats['loads'] += 1
+        groups_json, periods_blob, ratios_blob, fetched_start, fetched_end, fetched_on = row
+        groups = json.loads(groups_json)
+
+        ordinals = array('i')
+        ordinals.frombytes(periods_blob)
+        values = array('f')
+        values.frombytes(ratios_blob)
+
+        count = len(ordinals)
+        periods = [date.fromordinal(ordinal).isoformat() for ordinal in ordinals]
+        return {
+            'periods': periods,
+            'groups': groups,
+            'ratios': [values[i * count:(i + 1) * count].tolist() for i in range(len(groups))],
+            'fetched_start': fetched_start or (periods[0] if periods else None),
+            'fetched_end': fetched_end,
+            'fetched_on': fetched_on or None
+        }
+
+    async def save(self, key: str, series: Dict, fetched_start: str, fetched_end: str, fetched_on: str) -> None:
+        """
+        Store a series, replacing any previous version
+
+        Args:
+            key: Series key from make_key()
+            series: Column-form series
+            fetched_start: Requested start date the series covers (DataLab
+                omits leading periods with no volume, so this can precede the
+                first stored period)
+            fetched_end: End date of the latest fetch that produced it
+            fetched_on: Day (KST, YYYY-MM-DD) that fetch was made
+        """
+        ordinals = array('i', (date.fromisoformat(period).toordinal() for period in series['periods']))
+        values = array('f')
+        for column in series['ratios']:
+            values.extend(column)
+
+        await asyncio.to_thread(
+            self._db_set,
+            key,
+            json.dumps(series['groups'], ensure_ascii=False),
+            ordinals.tobytes(),
+            values.tobytes(),
+            fetched_start,
+            fetched_end,
+            fetched_on
+        )
+        self._stats['saves'] += 1
+
+    def stats(self) -> Dict:
+        """Get store statistics"""
+        with self._db_lock:
+            count = self._db.execute('SELECT COUNT(*) FROM datalab_series').fetchone()[0] if self._db else 0
+        return {**self._stats, 'series': count}
+
+    def close(self) -> None:
+        """Close the SQLite backend"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _db_get(self, key: str) -> Optional[tuple]:
+        with self._db_lock:
+            if self._db is None:
+                return None
+            return self._db.execute(
+                'SELECT groups, periods, ratios, fetched_start, fetched_end, fetched_on FROM datalab_series WHERE key = ?',
+                (key,)
+            ).fetchone()
+
+    def _db_set(
+        self, key: str, groups: str, periods: bytes, ratios: bytes, fetched_start: str, fetched_end: str, fetched_on: str
+    ) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            self._db.execute(
+                'INSERT OR REPLACE INTO datalab_series '
+                '(key, groups, periods, ratios, fetched_start, fetched_end, fetched_on, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, groups, periods, ratios, fetched_start, fetched_end, fetched_on, time.time())
+            )
+            self._db.commit()
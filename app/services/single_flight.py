@@ -0,0 +1,65 @@
+"""
+Single-Flight Module
+
+Collapses concurrent calls that share a key into one in-flight task whose
+result (or exception) fans out to every waiter.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Request coalescing for identical concurrent coroutines"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._stats = {
+            'executed': 0,
+            'coalesced': 0
+        }
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run func once per key among concurrent callers
+
+        Args:
+            key: Identity of the call (e.g. canonical cache key)
+            func: Zero-argument coroutine factory executed by the first caller
+
+        Returns:
+            The shared result of the single execution
+        """
+        future = self._inflight.get(key)
+        if future is not None:
+            self._stats['coalesced'] += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.ensure_future(func())
+        self._inflight[key] = future
+        self._stats['executed'] += 1
+        future.add_done_callback(lambda done: self._finish(key, done))
+
+        # shield: a cancelled caller must not cancel the call for other waiters
+        return await asyncio.shield(future)
+
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        """Forget the finished call and mark its exception as retrieved"""
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()
+
+    def stats(self) -> Dict:
+        """
+        Get coalescing statistics
+
+        Returns:
+            Dict with executed/coalesced counts and calls currently in flight
+        """
+        total = self._stats['executed'] + self._stats['coalesced']
+        return {
+            **self._stats,
+            'saved_ratio': self._stats['coalesced'] / total if total else 0.0,
+            'in_flight': len(self._inflight)
+        }
@@ -0,0 +1,394 @@
+"""
+Spatial Index Module
+
+Accumulates local search results into a persistent place store with an
+in-memory uniform grid on top. Naver's mapx/mapy are converted to WGS84
+(current responses carry degrees x 10^7, older ones KATEC/TM128 metres),
+each place is bucketed into a fixed-size cell, and radius, bounding-box
+and density-cluster queries only visit the cells that can match, so they
+stay in the millisecond range over thousands of places without any API
+call. Places are persisted in SQLite and reloaded into the grid by
+start(), off the event loop.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from services.term_index import clean_text
+
+logger = logging.getLogger(__name__)
+
+EARTH_RADIUS_M = 6371008.8
+
+# Metres per degree of latitude, and the fixed latitude used to size longitude
+# cells (central Korea), so a place always lands in the same cell
+METERS_PER_DEGREE = 111320.0
+REFERENCE_LATITUDE = 36.5
+
+DEFAULT_CELL_SIZE_M = 250.0
+
+# KATEC (TM128): Transverse Mercator on the Bessel 1841 ellipsoid
+BESSEL_A = 6377397.155
+BESSEL_F = 1 / 299.1528128
+KATEC_LAT0 = math.radians(38.0)
+KATEC_LON0 = math.radians(128.0)
+KATEC_K0 = 0.9999
+KATEC_FALSE_EASTING = 400000.0
+KATEC_FALSE_NORTHING = 600000.0
+
+# Korean Bessel datum -> WGS84 geocentric shift in metres (3-parameter, ~10 m accuracy)
+BESSEL_TO_WGS84 = (-146.43, 507.89, 681.46)
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+
+
+def _meridian_arc(phi: float, a: float, e2: float) -> float:
+    return a * (
+        (1 - e2 / 4 - 3 * e2 ** 2 / 64 - 5 * e2 ** 3 / 256) * phi
+        - (3 * e2 / 8 + 3 * e2 ** 2 / 32 + 45 * e2 ** 3 / 1024) * math.sin(2 * phi)
+        + (15 * e2 ** 2 / 256 + 45 * e2 ** 3 / 1024) * math.sin(4 * phi)
+        - (35 * e2 ** 3 / 3072) * math.sin(6 * phi)
+    )
+
+
+def _katec_to_bessel(x: float, y: float) -> Tuple[float, float]:
+    """Inverse Transverse Mercator (Snyder) to Bessel geodetic radians"""
+    a, e2 = BESSEL_A, BESSEL_F * (2 - BESSEL_F)
+    ep2 = e2 / (1 - e2)
+    m = _meridian_arc(KATEC_LAT0, a, e2) + (y - KATEC_FALSE_NORTHING) / KATEC_K0
+    mu = m / (a * (1 - e2 / 4 - 3 * e2 ** 2 / 64 - 5 * e2 ** 3 / 256))
+    e1 = (1 - math.sqrt(1 - e2)) / (1 + math.sqrt(1 - e2))
+    phi1 = (
+        mu
+        + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * math.sin(2 * mu)
+        + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * math.sin(4 * mu)
+        + (151 * e1 ** 3 / 96) * math.sin(6 * mu)
+        + (1097 * e1 ** 4 / 512) * math.sin(8 * mu)
+    )
+
+    sin1, cos1, tan1 = math.sin(phi1), math.cos(phi1), math.tan(phi1)
+    c1 = ep2 * cos1 ** 2
+    t1 = tan1 ** 2
+    n1 = a / math.sqrt(1 - e2 * sin1 ** 2)
+    r1 = a * (1 - e2) / (1 - e2 * sin1 ** 2) ** 1.5
+    d = (x - KATEC_FALSE_EASTING) / (n1 * KATEC_K0)
+
+    lat = phi1 - (n1 * tan1 / r1) * (
+        d ** 2 / 2
+        - (5 + 3 * t1 + 10 * c1 - 4 * c1 ** 2 - 9 * ep2) * d ** 4 / 24
+        + (61 + 90 * t1 + 298 * c1 + 45 * t1 ** 2 - 252 * ep2 - 3 * c1 ** 2) * d ** 6 / 720
+    )
+    lon = KATEC_LON0 + (
+        d
+        - (1 + 2 * t1 + c1) * d ** 3 / 6
+        + (5 - 2 * c1 + 28 * t1 - 3 * c1 ** 2 + 8 * ep2 + 24 * t1 ** 2) * d ** 5 / 120
+    ) / cos1
+    return lat, lon
+
+
+def _bessel_to_wgs84(lat: float, lon: float) -> Tuple[float, float]:
+    """Geocentric datum shift, radians in, degrees out"""
+    a, e2 = BESSEL_A, BESSEL_F * (2 - BESSEL_F)
+    n = a / math.sqrt(1 - e2 * math.sin(lat) ** 2)
+    x = n * math.cos(lat) * math.cos(lon) + BESSEL_TO_WGS84[0]
+    y = n * math.cos(lat) * math.sin(lon) + BESSEL_TO_WGS84[1]
+    z = n * (1 - e2) * math.sin(lat) + BESSEL_TO_WGS84[2]
+
+    a, e2 = WGS84_A, WGS84_F * (2 - WGS84_F)
+    p = math.hypot(x, y)
+    lat = math.atan2(z, p * (1 - e2))
+    for _ in range(5):
+        n = a / math.sqrt(1 - e2 * math.sin(lat) ** 2)
+        lat = math.atan2(z + e2 * n * math.sin(lat), p)
+    return math.degrees(lat), math.degrees(math.atan2(y, x))
+
+
+def to_wgs84(mapx, mapy) -> Optional[Tuple[float, float]]:
+    """
+    Convert Naver local mapx/mapy to WGS84
+
+    Returns:
+        (latitude, longitude) in degrees, or None if the values are missing or invalid
+    """
+    try:
+        x, y = float(mapx), float(mapy)
+    except (TypeError, ValueError):
+        return None
+    if not x or not y:
+        return None
+
+    if x > 1e7:
+        # current format: WGS84 degrees x 10^7
+        lat, lon = y / 1e7, x / 1e7
+    elif x < 1000:
+        lat, lon = y, x
+    else:
+        lat, lon = _bessel_to_wgs84(*_katec_to_bessel(x, y))
+
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return None
+    return lat, lon
+
+
+def haversine_m(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in metres"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi, dlambda = phi2 - phi1, math.radians(lon2 - lon1)
+    h = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(h))
+
+
+def place_key(item: Dict, coordinates: Optional[Tuple[float, float]] = None) -> str:
+    """
+    Identity of a place across queries
+
+    Title plus address; falls back to coordinates rounded to ~1 m when a
+    result has no address.
+    """
+    title = ' '.join(clean_text(item.get('title', '')).lower().split())
+    address = ' '.join((item.get('roadAddress') or item.get('address') or '').split())
+    if address:
+        return f'{title}|{address}'
+    coordinates = coordinates or to_wgs84(item.get('mapx'), item.get('mapy'))
+    if coordinates:
+        return f'{title}|{coordinates[0]:.5f},{coordinates[1]:.5f}'
+    return title
+
+
+class SpatialIndex:
+    """Persistent place store with a uniform grid for spatial queries"""
+
+    def __init__(self, db_path: Union[str, Path], cell_size_m: Optional[float] = None):
+        """
+        Args:
+            db_path: SQLite file for stored places
+            cell_size_m: Grid cell edge in metres (default NAVER_SPATIAL_CELL or 250)
+        """
+        self.db_path = Path(db_path)
+        self.cell_size_m = cell_size_m or float(os.getenv('NAVER_SPATIAL_CELL', str(DEFAULT_CELL_SIZE_M)))
+        self._lat_step = self.cell_size_m / METERS_PER_DEGREE
+        self._lon_step = self.cell_size_m / (METERS_PER_DEGREE * math.cos(math.radians(REFERENCE_LATITUDE)))
+        self._places: Dict[str, Dict] = {}
+        self._grid: Dict[Tuple[int, int], List[str]] = {}
+        self._load_task: Optional[asyncio.Task] = None
+        self._db_lock = threading.Lock()
+        self._stats = {
+            'added': 0,
+            'updated': 0,
+            'skipped': 0,
+            'queries': 0
+        }
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode = WAL')
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS places (
+                key TEXT PRIMARY KEY,
+                lat REAL NOT NULL,
+                lon REAL NOT NULL,
+                item TEXT NOT NULL,
+                last_seen REAL NOT NULL
+            )
+        ''')
+        self._db.commit()
+
+    def __len__(self) -> int:
+        return len(self._places)
+
+    async def start(self) -> None:
+        """Load stored places into the grid; later calls wait for the same load"""
+        if self._load_task is None:
+            self._load_task = asyncio.ensure_future(self._load())
+        await asyncio.shield(self._load_task)
+
+    async def add_items(self, items: Iterable[Dict]) -> int:
+        """
+        Store local result items, refreshing places seen before
+
+        Returns:
+            Number of new places
+        """
+        await self.start()
+        rows = []
+        added = 0
+        for item in items:
+            coordinates = to_wgs84(item.get('mapx'), item.get('mapy'))
+            if coordinates is None:
+                self._stats['skipped'] += 1
+                continue
+            key = place_key(item, coordinates)
+            if key in self._places:
+                self._remove(key)
+                self._stats['updated'] += 1
+            else:
+                added += 1
+            self._insert(key, *coordinates, item)
+            rows.append((key, *coordinates, json.dumps(item, ensure_ascii=False), time.time()))
+
+        if rows:
+            await asyncio.to_thread(self._db_save, rows)
+        self._stats['added'] += added
+        return added
+
+    def within_radius(self, lat: float, lon: float, radius_m: float, limit: Optional[int] = None) -> List[Dict]:
+        """
+        Places within radius_m of a point, nearest first
+
+        Returns:
+            List of {'key', 'lat', 'lon', 'distance', 'item'}
+        """
+        self._stats['queries'] += 1
+        dlat = radius_m / METERS_PER_DEGREE
+        dlon = radius_m / (METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 1e-6))
+        results = []
+        for place in self._scan(lat - dlat, lon - dlon, lat + dlat, lon + dlon):
+            distance = haversine_m(lat, lon, place['lat'], place['lon'])
+            if distance <= radius_m:
+                results.append({**place, 'distance': distance})
+        results.sort(key=lambda place: place['distance'])
+        return results[:limit] if limit else results
+
+    def within_bbox(self, south: float, west: float, north: float, east: float) -> List[Dict]:
+        """Places inside a bounding box (degrees)"""
+        self._stats['queries'] += 1
+        return list(self._scan(south, west, north, east))
+
+    def clusters(
+        self,
+        min_points: int = 5,
+        cell_size_m: Optional[float] = None,
+        bbox: Optional[Tuple[float, float, float, float]] = None
+    ) -> List[Dict]:
+        """
+        Density clusters of stored places
+
+        Places are counted per cell (cell_size_m, default the index cell);
+        cells holding at least min_points places are dense, and dense cells
+        touching each other (8-neighbourhood) form one cluster.
+
+        Args:
+            min_points: Places a cell needs to count as dense
+            cell_size_m: Clustering cell edge in metres
+            bbox: Optional (south, west, north, east) to restrict to
+
+        Returns:
+            List of {'count', 'lat', 'lon', 'bbox', 'categories', 'keys'} sorted by count
+        """
+        self._stats['queries'] += 1
+        size = cell_size_m or self.cell_size_m
+        lat_step = size / METERS_PER_DEGREE
+        lon_step = size / (METERS_PER_DEGREE * math.cos(math.radians(REFERENCE_LATITUDE)))
+
+        places = self._scan(*bbox) if bbox else self._places.values()
+        cells: Dict[Tuple[int, int], List[Dict]] = {}
+        for place in places:
+            cells.setdefault((math.floor(place['lon'] / lon_step), math.floor(place['lat'] / lat_step)), []).append(place)
+        dense = {cell for cell, members in cells.items() if len(members) >= min_points}
+
+        results = []
+        seen = set()
+        for start in dense:
+            if start in seen:
+                continue
+            seen.add(start)
+            stack, members = [start], []
+            while stack:
+                cx, cy = stack.pop()
+                members.extend(cells[(cx, cy)])
+                for neighbour in ((cx + dx, cy + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+                    if neighbour in dense and neighbour not in seen:
+                        seen.add(neighbour)
+                        stack.append(neighbour)
+
+            lats = [place['lat'] for place in members]
+            lons = [place['lon'] for place in members]
+            categories = Counter(place['item'].get('category', '') for place in members if place['item'].get('category'))
+            results.append({
+                'count': len(members),
+                'lat': sum(lats) / len(lats),
+                'lon': sum(lons) / len(lons),
+                'bbox': (min(lats), min(lons), max(lats), max(lons)),
+                'categories': categories.most_common(3),
+                'keys': [place['key'] for place in members]
+            })
+
+        results.sort(key=lambda cluster: cluster['count'], reverse=True)
+        return results
+
+    def stats(self) -> Dict:
+        """Get index statistics"""
+        return {**self._stats, 'places': len(self._places), 'cells': len(self._grid), 'cell_size_m': self.cell_size_m}
+
+    def close(self) -> None:
+        """Close the SQLite backend"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lon / self._lon_step), math.floor(lat / self._lat_step)
+
+    def _insert(self, key: str, lat: float, lon: float, item: Dict) -> None:
+        self._places[key] = {'key': key, 'lat': lat, 'lon': lon, 'item': item}
+        self._grid.setdefault(self._cell(lat, lon), []).append(key)
+
+    def _remove(self, key: str) -> None:
+        place = self._places.pop(key)
+        cell = self._cell(place['lat'], place['lon'])
+        keys = self._grid[cell]
+        keys.remove(key)
+        if not keys:
+            del self._grid[cell]
+
+    def _scan(self, south: float, west: float, north: float, east: float) -> Iterator[Dict]:
+        """Places inside the box, visiting only the overlapping cells"""
+        min_x, min_y = self._cell(south, west)
+        max_x, max_y = self._cell(north, east)
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(self._grid):
+            # box covers more cells than are occupied: walk the occupied ones
+            cells = [cell for cell in self._grid if min_x <= cell[0] <= max_x and min_y <= cell[1] <= max_y]
+        else:
+            cells = [(x, y) for x in range(min_x, max_x + 1) for y in range(min_y, max_y + 1) if (x, y) in self._grid]
+
+        for cell in cells:
+            for key in self._grid[cell]:
+                place = self._places[key]
+                if south <= place['lat'] <= north and west <= place['lon'] <= east:
+                    yield place
+
+    async def _load(self) -> None:
+        started = time.perf_counter()
+        rows = await asyncio.to_thread(self._db_load)
+        for key, lat, lon, item in rows:
+            # places added while loading are newer than their stored copy
+            if key not in self._places:
+                self._insert(key, lat, lon, item)
+        if rows:
+            logger.info(f"Spatial index loaded {len(rows)} places in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    def _db_load(self) -> List[tuple]:
+        with self._db_lock:
+            if self._db is None:
+                return []
+            rows = self._db.execute('SELECT key, lat, lon, item FROM places').fetchall()
+        return [(key, lat, lon, json.loads(item)) for key, lat, lon, item in rows]
+
+    def _db_save(self, rows: List[tuple]) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            with self._db:
+                self._db.executemany(
+                    'INSERT OR REPLACE INTO places (key, lat, lon, item, last_seen) VALUES (?, ?, ?, ?, ?)', rows
+                )
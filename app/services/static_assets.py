@@ -0,0 +1,107 @@
+"""
+Static Assets Module
+
+Serves stylesheets as content-hashed, immutable files. Each file is read and
+gzip-compressed once, published under a URL containing its hash, and pages
+reference it with a <link> tag instead of inlining it, so browsers download
+it once and reuse it until the content changes.
+"""
+
+import gzip
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict
+
+from fastapi import Request
+from fastapi.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# Hashed URLs never change content, so they may be cached for a year
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+MEDIA_TYPES = {
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'text/javascript; charset=utf-8'
+}
+
+
+class StaticAsset:
+    """One file held in memory in plain and gzip form"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.content = path.read_bytes()
+        self.digest = hashlib.sha256(self.content).hexdigest()[:12]
+        self.gzipped = gzip.compress(self.content, compresslevel=9, mtime=0)
+        self.etag = f'"{self.digest}"'
+        self.media_type = MEDIA_TYPES.get(path.suffix, 'application/octet-stream')
+        self.filename = f"{path.stem}.{self.digest}{path.suffix}"
+
+
+class StaticAssets:
+    """Registry of hashed assets served from one URL prefix"""
+
+    def __init__(self, url_prefix: str = '/static'):
+        """
+        Args:
+            url_prefix: URL path under which hashed files are served
+        """
+        self.url_prefix = url_prefix.rstrip('/')
+        self._by_name: Dict[str, StaticAsset] = {}
+        self._by_filename: Dict[str, StaticAsset] = {}
+        self._registered = False
+
+    def add(self, name: str, path: Path) -> StaticAsset:
+        """
+        Load a file and publish it under its hashed filename
+
+        Args:
+            name: Lookup name used by url() and stylesheet_links()
+            path: File on disk
+        """
+        asset = StaticAsset(Path(path))
+        self._by_name[name] = asset
+        self._by_filename[asset.filename] = asset
+        logger.info(
+            f"Static asset {name}: {self.url(name)} "
+            f"({len(asset.content)} bytes, {len(asset.gzipped)} gzipped)"
+        )
+        return asset
+
+    def register(self, app) -> None:
+        """Add the serving route to the FastAPI/NiceGUI app"""
+        if self._registered:
+            return
+        app.add_api_route(f"{self.url_prefix}/{{filename}}", self._serve, methods=['GET', 'HEAD'], include_in_schema=False)
+        self._registered = True
+
+    def url(self, name: str) -> str:
+        return f"{self.url_prefix}/{self._by_name[name].filename}"
+
+    def stylesheet_links(self, *names: str) -> str:
+        """<link> tags for the given stylesheets"""
+        return ''.join(f'<link rel="stylesheet" href="{self.url(name)}">' for name in names)
+
+    async def _serve(self, filename: str, request: Request) -> Response:
+        asset = self._by_filename.get(filename)
+        if asset is None:
+            return Response(status_code=404)
+
+        headers = {
+            'Cache-Control': IMMUTABLE_CACHE_CONTROL,
+            'ETag': asset.etag,
+            'Vary': 'Accept-Encoding'
+        }
+        if request.headers.get('if-none-match') == asset.etag:
+            return Response(status_code=304, headers=headers)
+
+        if 'gzip' in request.headers.get('accept-encoding', ''):
+            headers['Content-Encoding'] = 'gzip'
+            return Response(asset.gzipped, media_type=asset.media_type, headers=headers)
+        return Response(asset.content, media_type=asset.media_type, headers=headers)
+
+
+# Shared instance
+static_assets = StaticAssets()
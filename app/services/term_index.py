@@ -0,0 +1,263 @@
+"""
+Term Index Module
+
+Persistent inverted index over blog titles and descriptions. Each post is
+tokenized into lowercased whitespace tokens plus character bigrams of every
+Hangul run (Korean has no reliable word boundaries, and particles attach to
+nouns, so bigrams match '인공지능을' for the query '인공지능'). Posts are keyed
+by link and dated by postdate, so co-occurring terms for a query over the
+last N days come from two indexed lookups and one grouped count. Posts
+older than the retention window are deleted with their postings every few
+hundred inserts, since queries never look that far back.
+"""
+
+import asyncio
+import html
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from services.rate_limiter import KST
+
+logger = logging.getLogger(__name__)
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WORD_PATTERN = re.compile(r'\w+')
+HANGUL_RUN_PATTERN = re.compile(r'[가-힣]{2,}')
+
+# Tokens shorter than this are dropped (single syllables/letters carry little signal)
+MIN_TOKEN_LENGTH = 2
+
+# New posts between retention sweeps
+PRUNE_EVERY_INSERTS = 500
+
+
+def clean_text(text: str) -> str:
+    """Strip the <b> highlight tags and HTML entities Naver puts in results"""
+    return html.unescape(TAG_PATTERN.sub('', text or ''))
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Tokenize text into whitespace tokens and Hangul bigrams
+
+    Returns:
+        Set of distinct terms
+    """
+    text = clean_text(text).lower()
+    terms = {word for word in WORD_PATTERN.findall(text) if len(word) >= MIN_TOKEN_LENGTH and not word.isdigit()}
+    for run in HANGUL_RUN_PATTERN.findall(text):
+        terms.update(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def query_terms(query: str) -> Set[str]:
+    """
+    Terms a post must contain to match a query
+
+    Hangul words match by their bigrams so inflected forms match too;
+    other words match as whole tokens.
+    """
+    terms = set()
+    for word in WORD_PATTERN.findall(clean_text(query).lower()):
+        if HANGUL_RUN_PATTERN.fullmatch(word):
+            terms.update(word[i:i + 2] for i in range(len(word) - 1))
+        elif len(word) >= MIN_TOKEN_LENGTH:
+            terms.add(word)
+    return terms
+
+
+def _post_day(postdate: Optional[str]) -> int:
+    """Day ordinal of a YYYYMMDD postdate (today in KST if missing)"""
+    try:
+        return datetime.strptime(postdate, '%Y%m%d').date().toordinal()
+    except (TypeError, ValueError):
+        return datetime.now(KST).date().toordinal()
+
+
+class TermIndex:
+    """SQLite-backed inverted index of blog posts"""
+
+    def __init__(self, db_path: Union[str, Path], retention_days: Optional[int] = None):
+        """
+        Args:
+            db_path: SQLite file for the index
+            retention_days: Posts dated older than this are pruned (default NAVER_TERM_RETENTION_DAYS or 30)
+        """
+        self.db_path = Path(db_path)
+        self.retention_days = retention_days or int(os.getenv('NAVER_TERM_RETENTION_DAYS', '30'))
+        self._db_lock = threading.Lock()
+        # start due, so the first batch after a restart sweeps what aged out meanwhile
+        self._inserts_since_prune = PRUNE_EVERY_INSERTS
+        self._stats = {
+            'indexed': 0,
+            'skipped': 0,
+            'pruned': 0,
+            'queries': 0
+        }
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode = WAL')
+        self._db.execute('PRAGMA synchronous = NORMAL')
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS posts (
+                id INTEGER PRIMARY KEY,
+                link TEXT UNIQUE NOT NULL,
+                day INTEGER NOT NULL,
+                indexed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_posts_day ON posts (day);
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                post_id INTEGER NOT NULL,
+                PRIMARY KEY (term, post_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_post ON postings (post_id, term);
+        ''')
+        self._db.commit()
+
+    async def add_items(self, items: Iterable[Dict]) -> int:
+        """
+        Index blog result items not seen before
+
+        Returns:
+            Number of newly indexed posts
+        """
+        items = [item for item in items if item.get('link')]
+        if not items:
+            return 0
+
+        # tokenizing is pure Python, so it runs in the worker thread with the insert
+        added = await asyncio.to_thread(self._db_add, items)
+        self._stats['indexed'] += added
+        self._stats['skipped'] += len(items) - added
+        return added
+
+    async def top_cooccurring(self, query: str, days: int = 7, limit: int = 20) -> List[Dict]:
+        """
+        Terms that appear most often in posts matching a query
+
+        Args:
+            query: Search text; posts must contain all of its terms
+            days: Only posts dated within the last N days (KST)
+            limit: Number of terms to return
+
+        Returns:
+            List of {'term', 'count', 'share'} sorted by count, where share is
+            the fraction of matching posts containing the term
+        """
+        terms = sorted(query_terms(query))
+        if not terms:
+            return []
+
+        since = (datetime.now(KST).date() - timedelta(days=max(days, 1) - 1)).toordinal()
+        self._stats['queries'] += 1
+        total, rows = await asyncio.to_thread(self._db_cooccurring, terms, since, limit * 3)
+
+        words = WORD_PATTERN.findall(clean_text(query).lower())
+        results = []
+        for term, count in rows:
+            # pieces and inflected forms of the query itself ('인공', '인공지능을', '능을' for '인공지능')
+            if any(term in word for word in words) or any(t in term for t in terms):
+                continue
+            if len(term) == 2 and any(
+                HANGUL_RUN_PATTERN.fullmatch(word) and (term[0] == word[-1] or term[1] == word[0]) for word in words
+            ):
+                continue
+            # a bigram of a longer term that co-occurs about as often adds nothing
+            if len(term) == 2 and any(
+                len(other) > 2 and term in other and other_count >= 0.8 * count for other, other_count in rows
+            ):
+                continue
+            results.append({'term': term, 'count': count, 'share': count / total})
+            if len(results) == limit:
+                break
+        return results
+
+    def stats(self) -> Dict:
+        """Get index statistics"""
+        with self._db_lock:
+            if self._db is None:
+                return {**self._stats, 'posts': 0, 'postings': 0}
+            posts = self._db.execute('SELECT COUNT(*) FROM posts').fetchone()[0]
+            postings = self._db.execute('SELECT COUNT(*) FROM postings').fetchone()[0]
+        return {**self._stats, 'posts': posts, 'postings': postings}
+
+    def close(self) -> None:
+        """Close the SQLite backend"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _db_add(self, items: List[Dict]) -> int:
+        documents = [
+            (item['link'], _post_day(item.get('postdate')), tokenize(f"{item.get('title', '')} {item.get('description', '')}"))
+            for item in items
+        ]
+        with self._db_lock:
+            if self._db is None:
+                return 0
+            added = 0
+            now = time.time()
+            with self._db:
+                for link, day, terms in documents:
+                    cursor = self._db.execute(
+                        'INSERT OR IGNORE INTO posts (link, day, indexed_at) VALUES (?, ?, ?)', (link, day, now)
+                    )
+                    if not cursor.rowcount:
+                        continue
+                    post_id = cursor.lastrowid
+                    self._db.executemany(
+                        'INSERT OR IGNORE INTO postings (term, post_id) VALUES (?, ?)',
+                        ((term, post_id) for term in terms)
+                    )
+                    added += 1
+            self._inserts_since_prune += added
+            if added and self._inserts_since_prune >= PRUNE_EVERY_INSERTS:
+                self._db_prune()
+            return added
+
+    def _db_prune(self) -> None:
+        # caller holds _db_lock
+        cutoff = datetime.now(KST).date().toordinal() - self.retention_days
+        with self._db:
+            self._db.execute('DELETE FROM postings WHERE post_id IN (SELECT id FROM posts WHERE day < ?)', (cutoff,))
+            pruned = self._db.execute('DELETE FROM posts WHERE day < ?', (cutoff,)).rowcount
+        self._inserts_since_prune = 0
+        self._stats['pruned'] += pruned
+        if pruned:
+            logger.info(f"Term index pruned {pruned} posts older than {self.retention_days} days")
+
+    def _db_cooccurring(self, terms: List[str], since: int, limit: int) -> tuple:
+        # posts containing every query term, restricted to the date window
+        matches = ' INTERSECT '.join('SELECT post_id FROM postings WHERE term = ?' for _ in terms)
+        placeholders = ', '.join('?' for _ in terms)
+        with self._db_lock:
+            if self._db is None:
+                return 0, []
+            self._db.execute('DROP TABLE IF EXISTS temp.matched')
+            self._db.execute(
+                f'CREATE TEMP TABLE matched AS SELECT id FROM posts WHERE day >= ? AND id IN ({matches})',
+                (since, *terms)
+            )
+            total = self._db.execute('SELECT COUNT(*) FROM temp.matched').fetchone()[0]
+            if not total:
+                return 0, []
+            rows = self._db.execute(f'''
+                SELECT p.term, COUNT(*) AS count
+                FROM temp.matched m JOIN postings p ON p.post_id = m.id
+                WHERE p.term NOT IN ({placeholders})
+                GROUP BY p.term
+                ORDER BY count DESC, p.term
+                LIMIT ?
+            ''', (*terms, limit)).fetchall()
+
+        return total, rows
@@ -0,0 +1,206 @@
+"""
+Trend Analytics Module
+
+Vectorized analytics over DataLab series. All keyword groups are loaded
+into one (groups x periods) NumPy matrix so moving averages, growth,
+peak detection and seasonal decomposition run over every group at once.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Seasonal cycle length and periods per year for each DataLab timeUnit
+SEASON_LENGTH = {'date': 7, 'week': 52, 'month': 12}
+PERIODS_PER_YEAR = {'date': 365, 'week': 52, 'month': 12}
+
+
+class TrendMatrix:
+    """Ratio series of several keyword groups on a shared period axis"""
+
+    def __init__(self, titles: List[str], periods: np.ndarray, values: np.ndarray, time_unit: str = 'date'):
+        """
+        Args:
+            titles: Group titles, one per row
+            periods: datetime64[D] array of length T
+            values: float array of shape (groups, T)
+            time_unit: DataLab timeUnit ('date', 'week', 'month')
+        """
+        self.titles = titles
+        self.periods = periods
+        self.values = values
+        self.time_unit = time_unit
+
+    @classmethod
+    def from_response(cls, data: Dict, time_unit: Optional[str] = None) -> 'TrendMatrix':
+        """
+        Build a matrix from a DataLab response
+
+        Periods missing from a group are filled with 0, matching how DataLab
+        omits periods without searches.
+        """
+        results = data.get('results', [])
+        periods = np.unique(np.array(
+            [item['period'] for result in results for item in result['data']],
+            dtype='datetime64[D]'
+        ))
+        values = np.zeros((len(results), len(periods)))
+
+        for row, result in enumerate(results):
+            if not result['data']:
+                continue
+            columns = np.searchsorted(periods, np.array([item['period'] for item in result['data']], dtype='datetime64[D]'))
+            values[row, columns] = [item['ratio'] for item in result['data']]
+
+        return cls(
+            titles=[result['title'] for result in results],
+            periods=periods,
+            values=values,
+            time_unit=time_unit or data.get('timeUnit', 'date')
+        )
+
+    def moving_average(self, window: int) -> np.ndarray:
+        """
+        Trailing moving average per group
+
+        Returns:
+            Array of shape (groups, T); the first window-1 columns are NaN
+        """
+        result = np.full(self.values.shape, np.nan)
+        if window < 1 or window > self.values.shape[1]:
+            return result
+        cumulative = np.cumsum(np.pad(self.values, ((0, 0), (1, 0))), axis=1)
+        result[:, window - 1:] = (cumulative[:, window:] - cumulative[:, :-window]) / window
+        return result
+
+    def growth(self, lag: int = 1) -> np.ndarray:
+        """
+        Relative change versus lag periods earlier
+
+        Returns:
+            Array of shape (groups, T); NaN where there is no base or the base is 0
+        """
+        result = np.full(self.values.shape, np.nan)
+        if lag < 1 or lag >= self.values.shape[1]:
+            return result
+        base = self.values[:, :-lag]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[:, lag:] = np.where(base != 0, (self.values[:, lag:] - base) / base, np.nan)
+        return result
+
+    def peaks(self, threshold: float = 1.0) -> np.ndarray:
+        """
+        Local maxima that stand out from each group's own level
+
+        Args:
+            threshold: Minimum height above the group mean in standard deviations
+
+        Returns:
+            Boolean array of shape (groups, T)
+        """
+        values = self.values
+        mask = np.zeros(values.shape, dtype=bool)
+        if values.shape[1] < 3:
+            return mask
+        local_max = (values[:, 1:-1] > values[:, :-2]) & (values[:, 1:-1] >= values[:, 2:])
+        cutoff = values.mean(axis=1, keepdims=True) + threshold * values.std(axis=1, keepdims=True)
+        mask[:, 1:-1] = local_max & (values[:, 1:-1] > cutoff)
+        return mask
+
+    def decompose(self, season: Optional[int] = None) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Classical additive decomposition into trend, seasonal and residual
+
+        Args:
+            season: Cycle length in periods (default by timeUnit)
+
+        Returns:
+            Dict of (groups, T) arrays, or None if the series is shorter than two cycles
+        """
+        season = season or SEASON_LENGTH.get(self.time_unit, 7)
+        groups, length = self.values.shape
+        if season < 2 or length < 2 * season:
+            return None
+
+        # centered moving average; even cycles use the 2 x season weighting
+        if season % 2:
+            weights = np.full(season, 1.0 / season)
+        else:
+            weights = np.r_[0.5, np.ones(season - 1), 0.5] / season
+        half = len(weights) // 2
+        trend = np.full(self.values.shape, np.nan)
+        trend[:, half:length - half] = sliding_window_view(self.values, len(weights), axis=1) @ weights
+
+        # average detrended value per cycle position, centred on zero
+        detrended = self.values - trend
+        cycles = -(-length // season)
+        padded = np.full((groups, cycles * season), np.nan)
+        padded[:, :length] = detrended
+        with np.errstate(invalid='ignore'):
+            pattern = np.nanmean(padded.reshape(groups, cycles, season), axis=1)
+        pattern -= pattern.mean(axis=1, keepdims=True)
+        seasonal = np.tile(pattern, cycles)[:, :length]
+
+        return {
+            'trend': trend,
+            'seasonal': seasonal,
+            'residual': self.values - trend - seasonal
+        }
+
+    def slopes(self) -> np.ndarray:
+        """Least-squares slope per group in ratio points per period"""
+        length = self.values.shape[1]
+        if length < 2:
+            return np.zeros(self.values.shape[0])
+        x = np.arange(length) - (length - 1) / 2
+        return (self.values - self.values.mean(axis=1, keepdims=True)) @ x / (x @ x)
+
+    def summary(self, window: Optional[int] = None) -> List[Dict]:
+        """
+        Per-group headline numbers for the DataLab page
+
+        Args:
+            window: Moving-average window (default: one seasonal cycle)
+
+        Returns:
+            List of dicts with mean, latest, moving average, growth, peak and trend info
+        """
+        if self.values.shape[1] == 0:
+            return []
+
+        window = window or min(SEASON_LENGTH.get(self.time_unit, 7), self.values.shape[1])
+        moving = self.moving_average(window)[:, -1]
+        growth = self.growth(1)[:, -1]
+        yearly = self.growth(PERIODS_PER_YEAR.get(self.time_unit, 365))[:, -1]
+        peak_index = self.values.argmax(axis=1)
+        peak_counts = self.peaks().sum(axis=1)
+        slopes = self.slopes()
+
+        decomposition = self.decompose()
+        if decomposition is not None:
+            # share of detrended variance explained by the seasonal pattern (0..1)
+            residual_var = np.nanvar(decomposition['residual'], axis=1)
+            detrended_var = np.nanvar(decomposition['seasonal'] + decomposition['residual'], axis=1)
+            seasonal_strength = np.clip(1 - residual_var / np.maximum(detrended_var, 1e-12), 0, 1)
+        else:
+            seasonal_strength = np.full(len(self.titles), np.nan)
+
+        return [{
+            'title': title,
+            'mean': float(self.values[row].mean()),
+            'latest': float(self.values[row, -1]),
+            'moving_average': _optional(moving[row]),
+            'growth': _optional(growth[row]),
+            'yearly_growth': _optional(yearly[row]),
+            'peak_period': str(self.periods[peak_index[row]]),
+            'peak_ratio': float(self.values[row, peak_index[row]]),
+            'peak_count': int(peak_counts[row]),
+            'slope': float(slopes[row]),
+            'seasonal_strength': _optional(seasonal_strength[row])
+        } for row, title in enumerate(self.titles)]
+
+
+def _optional(value: float) -> Optional[float]:
+    """NaN -> None for display and JSON"""
+    return None if np.isnan(value) else float(value)
@@ -0,0 +1,120 @@
+"""
+User Cache Module
+
+Bounded in-process LRU of user records keyed by username, with an id index.
+Login populates it and admin checks read it. Writes go through UserService,
+which invalidates exactly the entries it touches.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+
+class UserCache:
+    """LRU + TTL cache of user dictionaries"""
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 300.0):
+        """
+        Args:
+            max_entries: Maximum number of users kept
+            ttl: Seconds before an entry is re-read (bounds staleness from outside edits)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._entries: "OrderedDict[str, Tuple[float, Dict]]" = OrderedDict()
+        self._ids: Dict[int, str] = {}
+        # bumped on every invalidation so reads started earlier don't repopulate stale data
+        self.generation = 0
+        self._stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'invalidations': 0
+        }
+
+    def get(self, username: str) -> Optional[Dict]:
+        """Look up a user by username; returns a copy or None on miss"""
+        entry = self._entries.get(username)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._drop(username)
+            self._stats['misses'] += 1
+            return None
+
+        self._entries.move_to_end(username)
+        self._stats['hits'] += 1
+        return dict(entry[1])
+
+    def get_by_id(self, user_id: int) -> Optional[Dict]:
+        """Look up a user by id"""
+        username = self._ids.get(user_id)
+        if username is None:
+            self._stats['misses'] += 1
+            return None
+        return self.get(username)
+
+    def set(self, user: Dict, generation: Optional[int] = None) -> None:
+        """
+        Store a user record
+
+        Args:
+            user: User dictionary (must contain 'id' and 'username')
+            generation: Value of self.generation when the read started; the
+                record is discarded if an invalidation happened since
+        """
+        if generation is not None and generation != self.generation:
+            return
+        username = user['username']
+        self._entries[username] = (time.monotonic() + self.ttl, dict(user))
+        self._entries.move_to_end(username)
+        self._ids[user['id']] = username
+        while len(self._entries) > self.max_entries:
+            _, (_, record) = self._entries.popitem(last=False)
+            self._ids.pop(record['id'], None)
+            self._stats['evictions'] += 1
+
+    def invalidate(self, username: Optional[str] = None) -> None:
+        """
+        Drop one user and stop in-flight reads from caching stale data
+
+        Args:
+            username: User whose record changed; None only bumps the generation
+        """
+        if username is not None and username in self._entries:
+            self._drop(username)
+        self.generation += 1
+        self._stats['invalidations'] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._ids.clear()
+        self.generation += 1
+
+    def stats(self) -> Dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dict with hit/miss counters, hit rate and current size
+        """
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            **self._stats,
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'size': len(self._entries),
+            'max_entries': self.max_entries
+        }
+
+    def _drop(self, username: str) -> None:
+        _, record = self._entries.pop(username)
+        self._ids.pop(record['id'], None)
+
+
+# Shared instance
+user_cache = UserCache(
+    max_entries=int(os.getenv('USER_CACHE_MAX_ENTRIES', '1000')),
+    ttl=float(os.getenv('USER_CACHE_TTL', '300'))
+)
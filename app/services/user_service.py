@@ -5,21 +5,27 @@ This module provides high-level user management operations,
 abstracting database operations and providing business logic.
 """
 
-from typing import List, Dict, Optional, Union
+from typing import List, Dict, Optional, Tuple, Union
 from db.database import (
     create_user as db_create_user,
     get_all_users as db_get_all_users,
+    list_users as db_list_users,
     delete_user as db_delete_user,
     get_user as db_get_user,
-    authenticate_user as db_authenticate_user
+    get_user_by_id as db_get_user_by_id,
+    get_credentials as db_get_credentials,
+    record_login as db_record_login,
+    update_password_hash as db_update_password_hash
 )
+from services.password_service import password_service
+from services.user_cache import user_cache
 
 
 class UserService:
     """Service class for user management operations"""
     
     @staticmethod
-    def create_user(
+    async def create_user(
         username: str,
         password: str,
         email: Optional[str] = None,
@@ -60,25 +66,58 @@ class UserService:
         full_name = full_name.strip() if full_name else None
         
         # Attempt to create user
-        success = db_create_user(username, password, email, full_name, is_admin)
+        password_hash = await password_service.hash(password)
+        success = await db_create_user(username, password_hash, email, full_name, is_admin)
         
         if success:
+            user_cache.invalidate(username)
             return {"success": True, "message": f"User '{username}' created successfully"}
         else:
             return {"success": False, "message": f"Username '{username}' already exists"}
     
     @staticmethod
-    def get_all_users() -> List[Dict]:
+    async def get_all_users() -> List[Dict]:
         """
         Get all users from the database
         
         Returns:
             List of user dictionaries
         """
-        return db_get_all_users()
+        return await db_get_all_users()
     
     @staticmethod
-    def delete_user(username: str) -> Dict[str, Union[bool, str]]:
+    async def list_users(
+        search: Optional[str] = None,
+        role: Optional[str] = None,
+        cursor: Optional[Tuple[str, int]] = None,
+        page_size: int = 50
+    ) -> Dict:
+        """
+        Get one page of users for the admin interface, newest first
+        
+        Args:
+            search: Optional text matched against username, full name and email
+            role: 'admin', 'user' or None for all users
+            cursor: next_cursor from the previous page, None for the first page
+            page_size: Users per page
+            
+        Returns:
+            Dict with 'users' and 'next_cursor' (None on the last page)
+        """
+        search = search.strip() if search and search.strip() else None
+        role = role if role in ('admin', 'user') else None
+        
+        # one extra row tells whether another page exists
+        users = await db_list_users(search, role, cursor, page_size + 1)
+        next_cursor = None
+        if len(users) > page_size:
+            users = users[:page_size]
+            next_cursor = (users[-1]['created_at'], users[-1]['id'])
+        
+        return {"users": users, "next_cursor": next_cursor}
+    
+    @staticmethod
+    async def delete_user(username: str) -> Dict[str, Union[bool, str]]:
         """
         Delete a user with business logic validation
         
@@ -97,15 +136,16 @@ class UserService:
         if username == 'admin':
             return {"success": False, "message": "Cannot delete the admin user"}
         
-        success = db_delete_user(username)
+        success = await db_delete_user(username)
         
         if success:
+            user_cache.invalidate(username)
             return {"success": True, "message": f"User '{username}' deleted successfully"}
         else:
             return {"success": False, "message": f"Failed to delete user '{username}' or user not found"}
     
     @staticmethod
-    def get_user(username: str) -> Optional[Dict]:
+    async def get_user(username: str) -> Optional[Dict]:
         """
         Get a specific user by username
         
@@ -118,10 +158,39 @@ class UserService:
         if not username or not username.strip():
             return None
         
-        return db_get_user(username.strip())
+        username = username.strip()
+        user = user_cache.get(username)
+        if user is None:
+            generation = user_cache.generation
+            user = await db_get_user(username)
+            if user:
+                user_cache.set(user, generation)
+        return user
+    
+    @staticmethod
+    async def get_user_by_id(user_id: int) -> Optional[Dict]:
+        """
+        Get a specific user by id
+        
+        Args:
+            user_id: User id to retrieve
+            
+        Returns:
+            User dictionary or None if not found
+        """
+        if user_id is None:
+            return None
+        
+        user = user_cache.get_by_id(user_id)
+        if user is None:
+            generation = user_cache.generation
+            user = await db_get_user_by_id(user_id)
+            if user:
+                user_cache.set(user, generation)
+        return user
     
     @staticmethod
-    def authenticate_user(username: str, password: str) -> Optional[Dict]:
+    async def authenticate_user(username: str, password: str) -> Optional[Dict]:
         """
         Authenticate a user
         
@@ -135,7 +204,36 @@ class UserService:
         if not username or not password:
             return None
         
-        return db_authenticate_user(username.strip(), password)
+        user = await db_get_credentials(username.strip())
+        if not user:
+            return None
+        
+        valid, new_hash = await password_service.verify(password, user['password_hash'])
+        if not valid:
+            return None
+        
+        # Transparently upgrade legacy SHA-256 / outdated scrypt hashes
+        if new_hash:
+            await db_update_password_hash(user['id'], new_hash)
+        
+        db_record_login(user['id'])
+        # last_login (and possibly the hash) changed; reload so admin checks in this session hit the cache
+        user_cache.invalidate(user['username'])
+        await UserService.get_user(user['username'])
+        
+        return {
+            'id': user['id'],
+            'username': user['username'],
+            'email': user['email'] or f"{user['username']}@localhost",
+            'name': user['full_name'] or user['username'],
+            'is_admin': user['is_admin'],
+            'login_type': 'local'
+        }
+    
+    @staticmethod
+    def cache_stats() -> Dict:
+        """Get user cache statistics (hit rate, size, invalidations)"""
+        return user_cache.stats()
     
     @staticmethod
     def is_admin(user_data: Dict) -> bool:
@@ -152,30 +250,30 @@ class UserService:
 
 
 # Convenience functions for backward compatibility and simpler imports
-def create_user(username: str, password: str, email: str = None, 
+async def create_user(username: str, password: str, email: str = None, 
                 full_name: str = None, is_admin: bool = False) -> Dict[str, Union[bool, str]]:
     """Convenience function for creating a user"""
-    return UserService.create_user(username, password, email, full_name, is_admin)
+    return await UserService.create_user(username, password, email, full_name, is_admin)
 
 
-def get_all_users() -> List[Dict]:
+async def get_all_users() -> List[Dict]:
     """Convenience function for getting all users"""
-    return UserService.get_all_users()
+    return await UserService.get_all_users()
 
 
-def delete_user(username: str) -> Dict[str, Union[bool, str]]:
+async def delete_user(username: str) -> Dict[str, Union[bool, str]]:
     """Convenience function for deleting a user"""
-    return UserService.delete_user(username)
+    return await UserService.delete_user(username)
 
 
-def get_user(username: str) -> Optional[Dict]:
+async def get_user(username: str) -> Optional[Dict]:
     """Convenience function for getting a user"""
-    return UserService.get_user(username)
+    return await UserService.get_user(username)
 
 
-def authenticate_user(username: str, password: str) -> Optional[Dict]:
+async def authenticate_user(username: str, password: str) -> Optional[Dict]:
     """Convenience function for authenticating a user"""
-    return UserService.authenticate_user(username, password)
+    return await UserService.authenticate_user(username, password)
 
 
 def is_admin_user(user_data: Dict) -> bool:
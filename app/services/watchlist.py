@@ -0,0 +1,324 @@
+"""
+Watchlist Module
+
+Background polling of tracked keywords through NaverAPIService. Keywords
+are packed into DataLab batches of 5 groups (one keyword per group), and
+each keyword also gets a blog search whose total is kept as a volume
+history (its items feed the term index as usual). Calls are spaced evenly across the poll interval and capped so the
+remaining daily quota lasts until the KST day rolls over. Results are
+stored in SQLite for pages to read without touching the network.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from services.naver_api import DATALAB_MAX_GROUPS, NaverAPIService
+from services.rate_limiter import KST
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCHLIST_DB = Path(__file__).parent.parent / 'db' / 'watchlist.db'
+
+
+def _seconds_until_kst_midnight() -> float:
+    now = datetime.now(KST)
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return (midnight - now).total_seconds()
+
+
+class WatchlistStore:
+    """SQLite storage for watched keywords and their latest results"""
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Args:
+            db_path: SQLite file for keywords and results
+        """
+        self.db_path = Path(db_path)
+        self._db_lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db: Optional[sqlite3.Connection] = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode = WAL')
+        self._db.executescript('''
+            CREATE TABLE IF NOT EXISTS watch_keywords (
+                keyword TEXT PRIMARY KEY,
+                added_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS watch_series (
+                keyword TEXT PRIMARY KEY,
+                time_unit TEXT NOT NULL,
+                periods TEXT NOT NULL,
+                ratios TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS watch_volume (
+                keyword TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                total INTEGER NOT NULL,
+                PRIMARY KEY (keyword, fetched_at)
+            ) WITHOUT ROWID;
+        ''')
+        self._db.commit()
+
+    def keywords(self) -> List[str]:
+        return [row[0] for row in self._query('SELECT keyword FROM watch_keywords ORDER BY added_at, keyword')]
+
+    def add_keyword(self, keyword: str) -> None:
+        self._execute('INSERT OR IGNORE INTO watch_keywords (keyword, added_at) VALUES (?, ?)', (keyword, time.time()))
+
+    def remove_keyword(self, keyword: str) -> None:
+        """Stop watching a keyword and drop its stored results"""
+        with self._db_lock:
+            if self._db is None:
+                return
+            with self._db:
+                for table in ('watch_keywords', 'watch_series', 'watch_volume'):
+                    self._db.execute(f'DELETE FROM {table} WHERE keyword = ?', (keyword,))
+
+    def save_series(self, keyword: str, time_unit: str, periods: List[str], ratios: List[float]) -> None:
+        self._execute(
+            'INSERT OR REPLACE INTO watch_series (keyword, time_unit, periods, ratios, fetched_at) VALUES (?, ?, ?, ?, ?)',
+            (keyword, time_unit, json.dumps(periods), json.dumps(ratios), time.time())
+        )
+
+    def save_volume(self, keyword: str, total: int) -> None:
+        self._execute(
+            'INSERT OR REPLACE INTO watch_volume (keyword, fetched_at, total) VALUES (?, ?, ?)',
+            (keyword, time.time(), total)
+        )
+
+    def series(self) -> Dict[str, Dict]:
+        """Latest DataLab series per keyword"""
+        return {
+            keyword: {
+                'time_unit': time_unit,
+                'periods': json.loads(periods),
+                'ratios': json.loads(ratios),
+                'fetched_at': fetched_at
+            }
+            for keyword, time_unit, periods, ratios, fetched_at in self._query(
+                'SELECT keyword, time_unit, periods, ratios, fetched_at FROM watch_series'
+            )
+        }
+
+    def volumes(self, since: float) -> Dict[str, List[tuple]]:
+        """Blog total counts per keyword recorded after since, oldest first"""
+        history: Dict[str, List[tuple]] = {}
+        for keyword, fetched_at, total in self._query(
+            'SELECT keyword, fetched_at, total FROM watch_volume WHERE fetched_at >= ? ORDER BY keyword, fetched_at',
+            (since,)
+        ):
+            history.setdefault(keyword, []).append((fetched_at, total))
+        return history
+
+    def prune_volume(self, before: float) -> None:
+        self._execute('DELETE FROM watch_volume WHERE fetched_at < ?', (before,))
+
+    def close(self) -> None:
+        """Close the SQLite backend"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _query(self, sql: str, params: tuple = ()) -> list:
+        with self._db_lock:
+            if self._db is None:
+                return []
+            return self._db.execute(sql, params).fetchall()
+
+    def _execute(self, sql: str, params: tuple = ()) -> None:
+        with self._db_lock:
+            if self._db is None:
+                return
+            self._db.execute(sql, params)
+            self._db.commit()
+
+
+class WatchlistPoller:
+    """Polls every watched keyword once per interval in the background"""
+
+    def __init__(
+        self,
+        api: NaverAPIService,
+        store: WatchlistStore,
+        interval: Optional[float] = None,
+        days: Optional[int] = None,
+        volume_retention_days: Optional[int] = None
+    ):
+        """
+        Args:
+            api: Naver API service used for every call
+            store: Where keywords and results live
+            interval: Seconds per poll cycle (default NAVER_WATCHLIST_INTERVAL or 3600)
+            days: DataLab window in days (default NAVER_WATCHLIST_DAYS or 90)
+            volume_retention_days: Blog count history kept (default 30)
+        """
+        self.api = api
+        self.store = store
+        self.interval = interval or float(os.getenv('NAVER_WATCHLIST_INTERVAL', '3600'))
+        self.days = days or int(os.getenv('NAVER_WATCHLIST_DAYS', '90'))
+        self.volume_retention_days = volume_retention_days or int(os.getenv('NAVER_WATCHLIST_VOLUME_DAYS', '30'))
+        self._task: Optional[asyncio.Task] = None
+        self._offsets = {'datalab': 0, 'blog': 0}
+        self._listeners = []
+        # last keyword count read from the store, so stats() needs no query
+        self._keyword_count = 0
+        self._stats = {
+            'cycles': 0,
+            'datalab_calls': 0,
+            'blog_calls': 0,
+            'deferred': 0,
+            'errors': 0,
+            'last_cycle_at': None
+        }
+
+    def add_listener(self, callback) -> None:
+        """Register an async callback run after every completed cycle"""
+        self._listeners.append(callback)
+
+    async def start(self) -> None:
+        """Start the background poll loop"""
+        if self._task is None:
+            self._keyword_count = len(await asyncio.to_thread(self.store.keywords))
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"Watchlist poller started | keywords: {self._keyword_count} | interval: {self.interval}s")
+
+    async def close(self) -> None:
+        """Stop the poll loop"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict:
+        return {**self._stats, 'keywords': self._keyword_count, 'running': self._task is not None}
+
+    async def poll_once(self, spread: bool = True) -> None:
+        """
+        Run one cycle
+
+        Args:
+            spread: Space the calls evenly over the interval instead of sending them back to back
+        """
+        keywords = await asyncio.to_thread(self.store.keywords)
+        self._keyword_count = len(keywords)
+        if not keywords:
+            return
+
+        batches = [keywords[i:i + DATALAB_MAX_GROUPS] for i in range(0, len(keywords), DATALAB_MAX_GROUPS)]
+        calls = (
+            [('datalab', batch) for batch in self._within_budget('datalab', batches)] +
+            [('blog', keyword) for keyword in self._within_budget('blog', keywords)]
+        )
+        spacing = self.interval / len(calls) if spread and calls else 0.0
+
+        for kind, target in calls:
+            started = time.monotonic()
+            try:
+                if kind == 'datalab':
+                    await self._poll_datalab(target)
+                else:
+                    await self._poll_blog(target)
+            except Exception as e:
+                self._stats['errors'] += 1
+                logger.warning(f"Watchlist {kind} poll failed | {target} | {e}")
+            await asyncio.sleep(max(0.0, spacing - (time.monotonic() - started)))
+
+        await asyncio.to_thread(self.store.prune_volume, time.time() - self.volume_retention_days * 86400)
+        self._stats['cycles'] += 1
+        self._stats['last_cycle_at'] = time.time()
+        for callback in self._listeners:
+            try:
+                await callback()
+            except Exception as e:
+                logger.error(f"Watchlist listener failed: {e}")
+
+    def _within_budget(self, endpoint: str, targets: list) -> list:
+        """
+        Keep this cycle's calls within its share of the remaining daily quota
+
+        Targets that don't fit are served first in later cycles (round-robin).
+        """
+        cycles_left = max(1, math.ceil(_seconds_until_kst_midnight() / self.interval))
+        budget = self.api.remaining_quota(endpoint) // cycles_left
+        if budget >= len(targets):
+            return targets
+
+        offset = self._offsets[endpoint] % len(targets)
+        rotated = targets[offset:] + targets[:offset]
+        self._offsets[endpoint] = offset + budget
+        self._stats['deferred'] += len(targets) - budget
+        logger.info(f"Watchlist {endpoint} budget {budget}/{len(targets)} calls this cycle")
+        return rotated[:budget]
+
+    async def _poll_datalab(self, batch: List[str]) -> None:
+        end = datetime.now(KST).date() - timedelta(days=1)
+        start = end - timedelta(days=self.days - 1)
+        data = await self.api.search_datalab(
+            start_date=start.isoformat(),
+            end_date=end.isoformat(),
+            time_unit='date',
+            keyword_groups=[{'groupName': keyword, 'keywords': [keyword]} for keyword in batch]
+        )
+        self._stats['datalab_calls'] += 1
+
+        for result in data.get('results', []):
+            points = sorted((item['period'], item['ratio']) for item in result.get('data', []))
+            await asyncio.to_thread(
+                self.store.save_series,
+                result['title'],
+                data.get('timeUnit', 'date'),
+                [period for period, _ in points],
+                [ratio for _, ratio in points]
+            )
+
+    async def _poll_blog(self, keyword: str) -> None:
+        data = await self.api.search_blog(keyword, display=10, sort='date')
+        self._stats['blog_calls'] += 1
+        await asyncio.to_thread(self.store.save_volume, keyword, int(data.get('total', 0)))
+
+    async def _run(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                await self.poll_once()
+            except Exception as e:
+                logger.error(f"Watchlist cycle failed: {e}")
+            # an empty or fully deferred cycle returns early; wait out the rest of the interval
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+
+def create_watchlist() -> WatchlistPoller:
+    """Build the shared poller with the keywords in NAVER_WATCHLIST (comma-separated)
+
+    The env list is authoritative: keywords no longer listed are removed along
+    with their results, so they stop using quota and leave the dashboard.
+    """
+    from services.naver_api import naver_api
+
+    store = WatchlistStore(os.getenv('NAVER_WATCHLIST_DB', str(DEFAULT_WATCHLIST_DB)))
+    listed = [keyword.strip() for keyword in os.getenv('NAVER_WATCHLIST', '').split(',') if keyword.strip()]
+    for keyword in store.keywords():
+        if keyword not in listed:
+            store.remove_keyword(keyword)
+            logger.info(f"Watchlist keyword removed | {keyword}")
+    for keyword in listed:
+        store.add_keyword(keyword)
+    return WatchlistPoller(naver_api, store)
+
+
+# Shared instance
+watchlist = create_watchlist()